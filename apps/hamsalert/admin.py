@@ -21,8 +21,8 @@ class EventAdmin(admin.ModelAdmin):
 
 def _get_weather_context():
     """Get common context for weather polling."""
-    from apps.hamsalert.services import WeatherService
-    service = WeatherService()
+    from apps.hamsalert.services import get_weather_service
+    service = get_weather_service()
     local_tz = ZoneInfo(getattr(settings, 'WEATHER_LOCAL_TIMEZONE', 'America/Los_Angeles'))
     local_today = datetime.now(local_tz).date()
     lat, lon = service.nws_location
@@ -150,21 +150,15 @@ def _poll_hourly(request):
 
 
 def _poll_historical(request):
-    """Poll historical weather for past 7 days."""
+    """Poll historical weather for past 7 days (1 API call)."""
     service, local_today, lat, lon = _get_weather_context()
     try:
-        count = 0
-        for days_ago in range(1, 8):
-            target = local_today - timedelta(days=days_ago)
-            try:
-                data = service._fetch_historical_weather(target)
-                if data:
-                    service._save_to_db('historical', target, service._serialize_historical_data(data), lat=lat, lon=lon)
-                    count += 1
-            except Exception:
-                pass  # Skip individual failures
-            time.sleep(1)
-        return True, f"Historical updated ({count} days)"
+        results = service.fetch_visualcrossing_historical_range(
+            local_today - timedelta(days=7), local_today - timedelta(days=1)
+        )
+        for target, data in results:
+            service._save_to_db('historical', target, service._serialize_historical_data(data), lat=lat, lon=lon)
+        return True, f"Historical updated ({len(results)} days)"
     except Exception as e:
         return False, f"Historical poll failed: {e}"
 
@@ -15,14 +15,15 @@ _lock = threading.Lock()
 
 
 def _ping_loop(url):
-    """Ping the health endpoint in a loop."""
+    """Ping the health endpoint in a loop, reusing one client for every ping."""
     event = threading.Event()
-    while not event.wait(PING_INTERVAL):
-        try:
-            response = httpx.get(url, timeout=10)
-            logger.debug("Keepalive ping %s -> %s", url, response.status_code)
-        except Exception:
-            logger.warning("Keepalive ping failed for %s", url, exc_info=True)
+    with httpx.Client(timeout=10) as client:
+        while not event.wait(PING_INTERVAL):
+            try:
+                response = client.get(url)
+                logger.debug("Keepalive ping %s -> %s", url, response.status_code)
+            except Exception:
+                logger.warning("Keepalive ping failed for %s", url, exc_info=True)
 
 
 def start():
@@ -43,29 +43,30 @@ class Command(BaseCommand):
         if 'all' in sources:
             sources = ['metar', 'taf', 'nws', 'daily', 'hourly']
 
-        service = WeatherService()
         local_tz = ZoneInfo(getattr(settings, 'WEATHER_LOCAL_TIMEZONE', 'America/Los_Angeles'))
         local_today = datetime.now(local_tz).date()
-        lat, lon = service.nws_location
-
-        for source in sources:
-            self.stdout.write(f'Polling {source}...')
-            try:
-                if source == 'metar':
-                    self._poll_metar(service, local_today)
-                elif source == 'taf':
-                    self._poll_taf(service, local_today)
-                elif source == 'nws':
-                    self._poll_nws(service, local_today, lat, lon)
-                elif source == 'daily':
-                    self._poll_daily(service, local_today, lat, lon)
-                elif source == 'hourly':
-                    self._poll_hourly(service, local_today, lat, lon)
-                elif source == 'historical':
-                    self._poll_historical(service, local_today, lat, lon, historical_days)
-                self.stdout.write(self.style.SUCCESS(f'  {source} done'))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'  {source} failed: {e}'))
+
+        with WeatherService() as service:
+            lat, lon = service.nws_location
+
+            for source in sources:
+                self.stdout.write(f'Polling {source}...')
+                try:
+                    if source == 'metar':
+                        self._poll_metar(service, local_today)
+                    elif source == 'taf':
+                        self._poll_taf(service, local_today)
+                    elif source == 'nws':
+                        self._poll_nws(service, local_today, lat, lon)
+                    elif source == 'daily':
+                        self._poll_daily(service, local_today, lat, lon)
+                    elif source == 'hourly':
+                        self._poll_hourly(service, local_today, lat, lon)
+                    elif source == 'historical':
+                        self._poll_historical(service, local_today, lat, lon, historical_days)
+                    self.stdout.write(self.style.SUCCESS(f'  {source} done'))
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f'  {source} failed: {e}'))
 
         self.stdout.write(self.style.SUCCESS('Poll complete'))
 
@@ -139,20 +140,20 @@ class Command(BaseCommand):
         self.stdout.write(f'    Hourly saved ({len(results)} days)')
 
     def _poll_historical(self, service, local_today, lat, lon, days):
-        """Poll historical weather for past N days."""
-        for days_ago in range(1, days + 1):
-            target_date = local_today - timedelta(days=days_ago)
-            try:
-                data = service.fetch_visualcrossing_historical(target_date)
-                if data:
-                    service._save_to_db(
-                        'historical',
-                        target_date,
-                        service._serialize_historical_data(data),
-                        lat=lat,
-                        lon=lon,
-                    )
-                    self.stdout.write(f'    Historical saved for {target_date}')
-            except Exception as e:
-                self.stdout.write(self.style.WARNING(f'    Historical failed for {target_date}: {e}'))
-            time.sleep(1)
+        """Poll historical weather for past N days (1 API call)."""
+        start = local_today - timedelta(days=days)
+        end = local_today - timedelta(days=1)
+        try:
+            results = service.fetch_visualcrossing_historical_range(start, end)
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f'    Historical failed for {start} to {end}: {e}'))
+            return
+        for target_date, data in results:
+            service._save_to_db(
+                'historical',
+                target_date,
+                service._serialize_historical_data(data),
+                lat=lat,
+                lon=lon,
+            )
+        self.stdout.write(f'    Historical saved ({len(results)} days)')
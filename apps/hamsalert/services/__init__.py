@@ -11,6 +11,7 @@ from .weather import (
     NwsForecastData,
     ExtendedForecastData,
     UnavailableWeatherData,
+    get_weather_service,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     'NwsForecastData',
     'ExtendedForecastData',
     'UnavailableWeatherData',
+    'get_weather_service',
 ]
@@ -10,25 +10,146 @@ Provides weather data from multiple sources for R/C flying conditions assessment
 Implements caching to stay within API rate limits.
 """
 
+import atexit
+import json
 import logging
+import math
 import random
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from datetime import timezone as dt_timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Iterable, Optional
 from zoneinfo import ZoneInfo
 
 import httpx
 from django.conf import settings
-from django.db import OperationalError
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import OperationalError, close_old_connections, connection
+from django.db.models import Count, Q
+from django.dispatch import receiver
 from django.utils import timezone
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _fromisoformat
+except ImportError:  # ciso8601 is an optional speedup
+    _fromisoformat = datetime.fromisoformat
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:  # h2 is optional; without it requests use HTTP/1.1
+    _HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Keys with a stale-while-revalidate refresh currently running in this process
+_refreshing: set[tuple] = set()
+_refreshing_lock = threading.Lock()
+
+# Upper bound on how long a cross-process refresh lock is held if its
+# holder dies mid-refresh (comfortably above the HTTP timeouts with retries)
+_REFRESH_LOCK_TTL = 60
+
+
+def _refresh_lock_key(key: tuple) -> str:
+    """Django cache key for the cross-process background refresh lock on key."""
+    return 'weather_refresh_' + '_'.join(str(part) for part in key)
+
+
+class _InflightCall:
+    """Result slot shared by callers waiting on the same upstream fetch."""
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+# Upstream fetches currently running in this process, keyed like the DB cache
+_inflight: dict[tuple, _InflightCall] = {}
+_inflight_lock = threading.Lock()
+
+
+# NWS wind text, e.g. "5 to 10 mph" or "10 mph with gusts to 25 mph"
+_NWS_NUMBER_RE = re.compile(r'\d+')
+# Matches the first "gust" in any case; group 1 is the speed when it reads
+# "gusts [to] N", so one search both splits the text and finds the gust
+_NWS_GUST_RE = re.compile(r'gust(?:s?\s+(?:to\s+)?(\d+))?', re.IGNORECASE)
+
+# NWS compass direction text -> degrees
+_NWS_DIRECTION_DEGREES = {
+    'N': 0, 'NNE': 22, 'NE': 45, 'ENE': 67,
+    'E': 90, 'ESE': 112, 'SE': 135, 'SSE': 157,
+    'S': 180, 'SSW': 202, 'SW': 225, 'WSW': 247,
+    'W': 270, 'WNW': 292, 'NW': 315, 'NNW': 337,
+}
+
+# 1 mph = 0.869 knots
+_MPH_TO_KT = 0.869
+
+# NWS points -> gridpoint forecast URL mappings are effectively permanent
+_NWS_FORECAST_URL_TTL = 30 * 24 * 3600
+
+# Stored coordinates match a lookup within this many degrees (~11m)
+_COORDINATE_TOLERANCE = Decimal('0.0001')
+
+# Shared, bounded pool for fanning out multi-source fetches (threads start on
+# first use). A fan-out uses at most four workers; the headroom lets fetches
+# still running past their composite deadline finish without starving callers.
+_FETCH_EXECUTOR_WORKERS = 16
+_fetch_executor = ThreadPoolExecutor(max_workers=_FETCH_EXECUTOR_WORKERS, thread_name_prefix='WeatherFetch')
+
+# Process-local L1 cache of DB reads: (weather_type, target_date, station, lat, lon) -> (expires_at, data)
+_L1_CACHE_MAX_ENTRIES = 2048
+_l1_cache: dict[tuple, tuple[float, dict]] = {}
+_l1_cache_lock = threading.Lock()
+
+
+def _l1_get(key: tuple) -> Optional[dict]:
+    """Return cached DB data for key if it has not expired."""
+    with _l1_cache_lock:
+        entry = _l1_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _l1_cache[key]
+            return None
+        return entry[1]
+
+
+def _l1_put(key: tuple, data: dict, ttl: float) -> None:
+    """Cache DB data for key for ttl seconds, evicting the oldest entry when full."""
+    with _l1_cache_lock:
+        if key not in _l1_cache and len(_l1_cache) >= _L1_CACHE_MAX_ENTRIES:
+            del _l1_cache[next(iter(_l1_cache))]
+        _l1_cache[key] = (time.monotonic() + ttl, data)
+
+
+def _l1_invalidate(key: Optional[tuple] = None) -> None:
+    """Drop one L1 entry, or all of them when key is None."""
+    with _l1_cache_lock:
+        if key is None:
+            _l1_cache.clear()
+        else:
+            _l1_cache.pop(key, None)
+
 
 class WeatherSource(Enum):
     """Source of weather data."""
@@ -40,7 +161,20 @@ class WeatherSource(Enum):
     UNAVAILABLE = 'unavailable'
 
 
-@dataclass
+COMPASS_POINTS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                  'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+# Compass point for every whole degree 0-360
+_COMPASS_BY_DEGREE = tuple(COMPASS_POINTS[round(d / 22.5) % 16] for d in range(361))
+
+
+def _compass_point(direction: int) -> str:
+    """Return the 16-point compass direction for a bearing in degrees."""
+    if type(direction) is int and 0 <= direction <= 360:
+        return _COMPASS_BY_DEGREE[direction]
+    return COMPASS_POINTS[round(direction / 22.5) % 16]
+
+
+@dataclass(slots=True, frozen=True)
 class WindData:
     """Wind information extracted from weather data."""
     direction: Optional[int]  # degrees (0-360), None if variable/calm
@@ -64,13 +198,24 @@ class WindData:
         """Return 16-point compass direction (N, NNE, NE, etc.)."""
         if self.direction is None:
             return 'VRB'
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                      'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-        index = round(self.direction / 22.5) % 16
-        return directions[index]
+        return _compass_point(self.direction)
 
 
-@dataclass
+# Cloud coverages that constitute a ceiling
+_CEILING_COVERAGES = frozenset({'BKN', 'OVC', 'VV'})
+
+_COVERAGE_TEXT = {
+    'FEW': 'Few',
+    'SCT': 'Scattered',
+    'BKN': 'Broken',
+    'OVC': 'Overcast',
+    'CLR': 'Clear',
+    'SKC': 'Sky Clear',
+    'VV': 'Vertical Vis',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class CloudLayer:
     """Single cloud layer from METAR/TAF."""
     coverage: str  # FEW, SCT, BKN, OVC, CLR, SKC
@@ -78,16 +223,87 @@ class CloudLayer:
 
     @property
     def coverage_text(self) -> str:
-        coverage_map = {
-            'FEW': 'Few',
-            'SCT': 'Scattered',
-            'BKN': 'Broken',
-            'OVC': 'Overcast',
-            'CLR': 'Clear',
-            'SKC': 'Sky Clear',
-            'VV': 'Vertical Vis',
-        }
-        return coverage_map.get(self.coverage, self.coverage)
+        return _COVERAGE_TEXT.get(self.coverage, self.coverage)
+
+
+# R/C ratings in order of severity; a rule can only raise the rating, never lower it
+RC_RATINGS = ('good', 'marginal', 'poor', 'no-fly')
+
+# (threshold, severity index into RC_RATINGS, bound reason formatter), most severe first.
+# The first matching rule for a parameter wins.
+_RC_WIND_RULES = (
+    (20, 3, "Wind too strong: {} kt".format),
+    (15, 2, "High wind: {} kt".format),
+    (10, 1, "Moderate wind: {} kt".format),
+)
+_RC_GUST_RULES = (
+    (25, 3, "Dangerous gusts: {} kt".format),
+    (20, 2, "Strong gusts: {} kt".format),
+)
+_RC_GUST_SPREAD_RULE = (10, 1, "Gusty: {} kt spread".format)
+_RC_PRECIP_RULES = (
+    (25, 2, "High rain chance: {}%".format),
+    (10, 1, "Rain possible: {}%".format),
+)
+# Visibility and ceiling rules match when the value is BELOW the threshold
+_RC_VISIBILITY_RULES = (
+    (1, 3, "Very low visibility: {} SM".format),
+    (3, 2, "Reduced visibility: {} SM".format),
+)
+_RC_CEILING_RULES = (
+    (400, 2, "Very low ceiling: {} ft".format),
+    (1000, 1, "Low ceiling: {} ft".format),
+)
+
+
+def _match_rc_rule(rules: tuple, value, below: bool = False) -> Optional[tuple]:
+    """Return the first rule whose threshold value meets (or is below, if below=True)."""
+    for rule in rules:
+        if (value < rule[0]) if below else (value >= rule[0]):
+            return rule
+    return None
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _rc_assessment(
+    wind_speed: int,
+    wind_gust: Optional[int],
+    visibility: Optional[float],
+    ceiling: Optional[int],
+    precipitation_probability: Optional[int],
+) -> tuple[str, tuple[str, ...]]:
+    """Memoized core of calculate_rc_assessment; returns (rating, reasons)."""
+    matches = []
+
+    # Wind assessment (most critical for R/C)
+    matches.append((_match_rc_rule(_RC_WIND_RULES, wind_speed), wind_speed))
+
+    # Gust assessment
+    if wind_gust:
+        gust_factor = wind_gust - wind_speed
+        rule = _match_rc_rule(_RC_GUST_RULES, wind_gust)
+        if rule:
+            matches.append((rule, wind_gust))
+        elif gust_factor >= _RC_GUST_SPREAD_RULE[0]:
+            matches.append((_RC_GUST_SPREAD_RULE, gust_factor))
+
+    if visibility is not None:
+        matches.append((_match_rc_rule(_RC_VISIBILITY_RULES, visibility, below=True), visibility))
+
+    if ceiling is not None:
+        matches.append((_match_rc_rule(_RC_CEILING_RULES, ceiling, below=True), ceiling))
+
+    # Precipitation probability (for forecasts)
+    if precipitation_probability is not None:
+        matches.append((_match_rc_rule(_RC_PRECIP_RULES, precipitation_probability), precipitation_probability))
+
+    severity = 0
+    reasons = []
+    for rule, value in matches:
+        if rule:
+            severity = max(severity, rule[1])
+            reasons.append(rule[2](value))
+    return RC_RATINGS[severity], tuple(reasons)
 
 
 def calculate_rc_assessment(
@@ -102,92 +318,98 @@ def calculate_rc_assessment(
 
     Works with all weather sources (METAR, TAF, NWS, Visual Crossing).
     """
-    reasons = []
-    rating = 'good'
+    rating, reasons = _rc_assessment(wind_speed, wind_gust, visibility, ceiling, precipitation_probability)
+    return {'rating': rating, 'reasons': list(reasons)}
 
-    # Wind assessment (most critical for R/C)
-    if wind_speed >= 20:
-        rating = 'no-fly'
-        reasons.append(f"Wind too strong: {wind_speed} kt")
-    elif wind_speed >= 15:
-        rating = 'poor'
-        reasons.append(f"High wind: {wind_speed} kt")
-    elif wind_speed >= 10:
-        if rating == 'good':
-            rating = 'marginal'
-        reasons.append(f"Moderate wind: {wind_speed} kt")
-
-    # Gust assessment
-    if wind_gust:
-        gust_factor = wind_gust - wind_speed
-        if wind_gust >= 25:
-            rating = 'no-fly'
-            reasons.append(f"Dangerous gusts: {wind_gust} kt")
-        elif wind_gust >= 20:
-            if rating in ('good', 'marginal'):
-                rating = 'poor'
-            reasons.append(f"Strong gusts: {wind_gust} kt")
-        elif gust_factor >= 10:
-            if rating == 'good':
-                rating = 'marginal'
-            reasons.append(f"Gusty: {gust_factor} kt spread")
-
-    # Visibility assessment
-    if visibility is not None:
-        if visibility < 1:
-            rating = 'no-fly'
-            reasons.append(f"Very low visibility: {visibility} SM")
-        elif visibility < 3:
-            if rating in ('good', 'marginal'):
-                rating = 'poor'
-            reasons.append(f"Reduced visibility: {visibility} SM")
-
-    # Ceiling assessment
-    if ceiling is not None:
-        if ceiling < 400:
-            if rating in ('good', 'marginal'):
-                rating = 'poor'
-            reasons.append(f"Very low ceiling: {ceiling} ft")
-        elif ceiling < 1000:
-            if rating == 'good':
-                rating = 'marginal'
-            reasons.append(f"Low ceiling: {ceiling} ft")
 
-    # Precipitation probability (for forecasts)
-    if precipitation_probability is not None:
-        if precipitation_probability >= 25:
-            if rating in ('good', 'marginal'):
-                rating = 'poor'
-            reasons.append(f"High rain chance: {precipitation_probability}%")
-        elif precipitation_probability >= 10:
-            if rating == 'good':
-                rating = 'marginal'
-            reasons.append(f"Rain possible: {precipitation_probability}%")
+# DaisyUI color classes for flight rules and R/C ratings
+_FLIGHT_RULES_COLORS = {
+    'VFR': 'success',
+    'MVFR': 'info',
+    'IFR': 'warning',
+    'LIFR': 'error',
+}
 
-    return {'rating': rating, 'reasons': reasons}
+_RC_RATING_COLORS = {
+    'good': 'success',
+    'marginal': 'info',
+    'poor': 'warning',
+    'no-fly': 'error',
+}
 
 
 def rc_rating_color(rating: str) -> str:
     """DaisyUI color class for R/C flying rating."""
-    colors = {
-        'good': 'success',
-        'marginal': 'info',
-        'poor': 'warning',
-        'no-fly': 'error',
-    }
-    return colors.get(rating, 'neutral')
+    return _RC_RATING_COLORS.get(rating, 'neutral')
+
+
+# Heavy filled arrows for visibility
+WIND_ARROWS = ('⬇️', '↙️', '⬅️', '↖️', '⬆️', '↗️', '➡️', '↘️')
+# Arrow for every whole degree 0-359 (wind FROM direction, arrow shows where it's going TO)
+_ARROW_BY_DEGREE = tuple(WIND_ARROWS[round(((d + 180) % 360) / 45) % 8] for d in range(360))
 
 
 def wind_arrow(direction: Optional[int]) -> str:
     """Return arrow character indicating wind direction."""
     if direction is None:
         return '◉'  # Variable/calm
+    if type(direction) is int:
+        return _ARROW_BY_DEGREE[direction % 360]
     # Wind FROM direction, arrow shows where it's going TO
     arrow_direction = (direction + 180) % 360
-    # Heavy filled arrows for visibility
-    arrows = ['⬇️', '↙️', '⬅️', '↖️', '⬆️', '↗️', '➡️', '↘️']
     index = round(arrow_direction / 45) % 8
-    return arrows[index]
+    return WIND_ARROWS[index]
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, memoized.
+
+    Cached payloads repeat the same hour/period timestamps on every page load,
+    so parsing each distinct string once is enough. datetime is immutable,
+    so sharing the result is safe.
+    """
+    return _fromisoformat(value)
+
+
+def _avwx_field(data: dict, key: str, field_name: str = 'value') -> Any:
+    """Return data[key][field_name] from an AVWX response, or None if either level is missing."""
+    node = data.get(key)
+    return node.get(field_name) if node else None
+
+
+# TAF periods are matched against midday of the target date
+_TAF_TARGET_TIME = dt_time(12)
+
+
+def _avwx_wind(data: dict) -> WindData:
+    """Build WindData from an AVWX METAR or TAF period."""
+    wind_dir = data.get('wind_direction') or {}
+    return WindData(
+        direction=wind_dir.get('value'),
+        speed=_avwx_field(data, 'wind_speed') or 0,
+        gust=_avwx_field(data, 'wind_gust'),
+        direction_repr=wind_dir.get('repr', 'VRB'),
+    )
+
+
+def _avwx_clouds(data: dict) -> list[CloudLayer]:
+    """Build the cloud layers from an AVWX METAR or TAF period."""
+    return [
+        CloudLayer(coverage=cloud.get('type', 'CLR'), altitude=cloud.get('altitude'))
+        for cloud in data.get('clouds') or ()
+    ]
+
+
+def _round_half_up(value: float) -> int:
+    """
+    Round to the nearest int, with ties toward +infinity (2.5 -> 3, -2.5 -> -2).
+
+    Unlike round(), ties don't go to even. On floats it's about twice as fast
+    as round() (CPython 3.11), which adds up in the parse loops.
+    """
+    return math.floor(value + 0.5)
 
 
 WMO_WEATHER_CODES = {
@@ -239,33 +461,27 @@ class WeatherData:
     from_cache: bool = False
     source: WeatherSource = WeatherSource.METAR
 
-    @property
+    @cached_property
     def ceiling(self) -> Optional[int]:
         """Return ceiling height (BKN or OVC layer altitude)."""
         for layer in self.clouds:
-            if layer.coverage in ('BKN', 'OVC', 'VV'):
+            if layer.coverage in _CEILING_COVERAGES:
                 return layer.altitude
         return None
 
-    @property
+    @cached_property
     def temperature_f(self) -> Optional[int]:
         """Return temperature in Fahrenheit."""
         if self.temperature is None:
             return None
         return round(self.temperature * 9 / 5 + 32)
 
-    @property
+    @cached_property
     def flight_rules_color(self) -> str:
         """Return DaisyUI color class for flight rules."""
-        colors = {
-            'VFR': 'success',
-            'MVFR': 'info',
-            'IFR': 'warning',
-            'LIFR': 'error',
-        }
-        return colors.get(self.flight_rules, 'neutral')
+        return _FLIGHT_RULES_COLORS.get(self.flight_rules or '', 'neutral')
 
-    @property
+    @cached_property
     def rc_flying_assessment(self) -> dict:
         """Assess conditions specifically for R/C flying."""
         return calculate_rc_assessment(
@@ -275,11 +491,11 @@ class WeatherData:
             ceiling=self.ceiling,
         )
 
-    @property
+    @cached_property
     def rc_rating_color(self) -> str:
         return rc_rating_color(self.rc_flying_assessment['rating'])
 
-    @property
+    @cached_property
     def wind_arrow(self) -> str:
         return wind_arrow(self.wind.direction)
 
@@ -288,7 +504,7 @@ class WeatherData:
         return 'Current'
 
 
-@dataclass
+@dataclass(slots=True)
 class TafForecastPeriod:
     """Single forecast period from TAF."""
     start_time: datetime
@@ -302,7 +518,7 @@ class TafForecastPeriod:
     @property
     def ceiling(self) -> Optional[int]:
         for layer in self.clouds:
-            if layer.coverage in ('BKN', 'OVC', 'VV'):
+            if layer.coverage in _CEILING_COVERAGES:
                 return layer.altitude
         return None
 
@@ -323,21 +539,15 @@ class TafForecastData:
     from_cache: bool = False
     source: WeatherSource = WeatherSource.TAF
 
-    @property
+    @cached_property
     def ceiling(self) -> Optional[int]:
         return self.period.ceiling
 
-    @property
+    @cached_property
     def flight_rules_color(self) -> str:
-        colors = {
-            'VFR': 'success',
-            'MVFR': 'info',
-            'IFR': 'warning',
-            'LIFR': 'error',
-        }
-        return colors.get(self.flight_rules, 'neutral')
+        return _FLIGHT_RULES_COLORS.get(self.flight_rules or '', 'neutral')
 
-    @property
+    @cached_property
     def rc_flying_assessment(self) -> dict:
         return calculate_rc_assessment(
             wind_speed=self.wind.speed,
@@ -346,11 +556,11 @@ class TafForecastData:
             ceiling=self.ceiling,
         )
 
-    @property
+    @cached_property
     def rc_rating_color(self) -> str:
         return rc_rating_color(self.rc_flying_assessment['rating'])
 
-    @property
+    @cached_property
     def wind_arrow(self) -> str:
         return wind_arrow(self.wind.direction)
 
@@ -359,7 +569,7 @@ class TafForecastData:
         return 'TAF'
 
 
-@dataclass
+@dataclass(slots=True)
 class NwsForecastPeriod:
     """Single period from NWS forecast."""
     name: str  # "Monday", "Monday Night", etc.
@@ -390,11 +600,11 @@ class NwsForecastData:
     from_cache: bool = False
     source: WeatherSource = WeatherSource.NWS
 
-    @property
+    @cached_property
     def temperature_f(self) -> Optional[int]:
         return self.temperature_high
 
-    @property
+    @cached_property
     def rc_flying_assessment(self) -> dict:
         return calculate_rc_assessment(
             wind_speed=self.wind.speed,
@@ -402,11 +612,11 @@ class NwsForecastData:
             precipitation_probability=self.precipitation_probability,
         )
 
-    @property
+    @cached_property
     def rc_rating_color(self) -> str:
         return rc_rating_color(self.rc_flying_assessment['rating'])
 
-    @property
+    @cached_property
     def wind_arrow(self) -> str:
         return wind_arrow(self.wind.direction)
 
@@ -429,23 +639,23 @@ class ExtendedForecastData:
     from_cache: bool = False
     source: WeatherSource = WeatherSource.EXTENDED
 
-    @property
+    @cached_property
     def temperature_high_f(self) -> Optional[int]:
         if self.temperature_high is None:
             return None
         return round(self.temperature_high * 9 / 5 + 32)
 
-    @property
+    @cached_property
     def temperature_low_f(self) -> Optional[int]:
         if self.temperature_low is None:
             return None
         return round(self.temperature_low * 9 / 5 + 32)
 
-    @property
+    @cached_property
     def temperature_f(self) -> Optional[int]:
         return self.temperature_high_f
 
-    @property
+    @cached_property
     def rc_flying_assessment(self) -> dict:
         return calculate_rc_assessment(
             wind_speed=self.wind.speed,
@@ -453,11 +663,11 @@ class ExtendedForecastData:
             precipitation_probability=self.precipitation_probability,
         )
 
-    @property
+    @cached_property
     def rc_rating_color(self) -> str:
         return rc_rating_color(self.rc_flying_assessment['rating'])
 
-    @property
+    @cached_property
     def wind_arrow(self) -> str:
         return wind_arrow(self.wind.direction)
 
@@ -466,7 +676,7 @@ class ExtendedForecastData:
         return 'Extended'
 
 
-@dataclass
+@dataclass(slots=True)
 class HourlyForecastEntry:
     """Single hour of hourly forecast data."""
     time: datetime
@@ -499,10 +709,7 @@ class HourlyForecastEntry:
     def direction_compass(self) -> str:
         if self.wind_direction is None:
             return 'VRB'
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                      'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-        index = round(self.wind_direction / 22.5) % 16
-        return directions[index]
+        return _compass_point(self.wind_direction)
 
     @property
     def wind_arrow(self) -> str:
@@ -515,7 +722,7 @@ class HourlyForecastEntry:
         return WMO_WEATHER_CODES.get(self.weather_code, f'Code {self.weather_code}')
 
 
-@dataclass
+@dataclass(slots=True)
 class HourlyForecastData:
     """Hourly forecast data for a single day."""
     location: tuple[float, float]
@@ -538,30 +745,30 @@ class HistoricalWeatherData:
     from_cache: bool = False
     source: WeatherSource = WeatherSource.HISTORICAL
 
-    @property
+    @cached_property
     def temperature_high_f(self) -> Optional[int]:
         if self.temperature_high is None:
             return None
         return round(self.temperature_high * 9 / 5 + 32)
 
-    @property
+    @cached_property
     def temperature_low_f(self) -> Optional[int]:
         if self.temperature_low is None:
             return None
         return round(self.temperature_low * 9 / 5 + 32)
 
-    @property
+    @cached_property
     def rc_flying_assessment(self) -> dict:
         return calculate_rc_assessment(
             wind_speed=self.wind.speed,
             wind_gust=self.wind.gust,
         )
 
-    @property
+    @cached_property
     def rc_rating_color(self) -> str:
         return rc_rating_color(self.rc_flying_assessment['rating'])
 
-    @property
+    @cached_property
     def wind_arrow(self) -> str:
         return wind_arrow(self.wind.direction)
 
@@ -570,7 +777,7 @@ class HistoricalWeatherData:
         return 'Historical'
 
 
-@dataclass
+@dataclass(slots=True)
 class UnavailableWeatherData:
     """Placeholder when weather data is unavailable."""
     message: str
@@ -598,173 +805,155 @@ class CompositeWeatherData:
     cached_at: datetime = field(default_factory=timezone.now)
     source: WeatherSource = WeatherSource.METAR  # Primary source for compatibility
 
-    @property
+    # (attribute, source, label) in priority order: METAR > TAF > NWS > Extended > Historical
+    SOURCE_ORDER = (
+        ('metar', WeatherSource.METAR, 'METAR'),
+        ('taf', WeatherSource.TAF, 'TAF'),
+        ('nws', WeatherSource.NWS, 'NWS'),
+        ('extended', WeatherSource.EXTENDED, 'Extended'),
+        ('historical', WeatherSource.HISTORICAL, 'Historical'),
+    )
+
+    # Per-field source ladders: field -> ((attribute, source, data field), ...), and
+    # whether a source only counts when its value is set (False: first source present wins)
+    _PRIMARY_FIELDS = {
+        'temperature': ((
+            ('metar', WeatherSource.METAR, 'temperature_f'),
+            ('nws', WeatherSource.NWS, 'temperature_high'),
+            ('extended', WeatherSource.EXTENDED, 'temperature_high_f'),
+            ('historical', WeatherSource.HISTORICAL, 'temperature_high_f'),
+        ), True),
+        'temperature_high': ((
+            ('nws', WeatherSource.NWS, 'temperature_high'),
+            ('extended', WeatherSource.EXTENDED, 'temperature_high_f'),
+            ('historical', WeatherSource.HISTORICAL, 'temperature_high_f'),
+        ), True),
+        'temperature_low': ((
+            ('nws', WeatherSource.NWS, 'temperature_low'),
+            ('extended', WeatherSource.EXTENDED, 'temperature_low_f'),
+            ('historical', WeatherSource.HISTORICAL, 'temperature_low_f'),
+        ), True),
+        'ceiling': ((
+            ('metar', WeatherSource.METAR, 'ceiling'),
+            ('taf', WeatherSource.TAF, 'ceiling'),
+        ), False),
+        'reported_ceiling': ((
+            ('metar', WeatherSource.METAR, 'ceiling'),
+            ('taf', WeatherSource.TAF, 'ceiling'),
+        ), True),
+        'visibility': ((
+            ('metar', WeatherSource.METAR, 'visibility'),
+            ('taf', WeatherSource.TAF, 'visibility'),
+        ), False),
+        'precipitation_probability': ((
+            ('nws', WeatherSource.NWS, 'precipitation_probability'),
+            ('extended', WeatherSource.EXTENDED, 'precipitation_probability'),
+        ), True),
+        'flight_rules': ((
+            ('metar', WeatherSource.METAR, 'flight_rules'),
+            ('taf', WeatherSource.TAF, 'flight_rules'),
+        ), False),
+    }
+
+    @cached_property
+    def _primary(self) -> dict[str, tuple[Any, Optional[WeatherSource]]]:
+        """(value, source) for each field in _PRIMARY_FIELDS, chosen in one pass."""
+        primary = {}
+        for name, (ladder, needs_value) in self._PRIMARY_FIELDS.items():
+            picked = (None, None)
+            for attr, source, data_field in ladder:
+                data = getattr(self, attr)
+                if data:
+                    value = getattr(data, data_field)
+                    if value is not None or not needs_value:
+                        picked = (value, source)
+                        break
+            primary[name] = picked
+        return primary
+
+    @cached_property
+    def _available(self) -> list[tuple[AnyWeatherData, WeatherSource, str]]:
+        """(data, source, label) for each source present, in priority order."""
+        return [
+            (data, source, label)
+            for attr, source, label in self.SOURCE_ORDER
+            if (data := getattr(self, attr))
+        ]
+
+    @cached_property
     def sources(self) -> list[WeatherSource]:
         """List of available sources."""
-        result = []
-        if self.metar:
-            result.append(WeatherSource.METAR)
-        if self.taf:
-            result.append(WeatherSource.TAF)
-        if self.nws:
-            result.append(WeatherSource.NWS)
-        if self.extended:
-            result.append(WeatherSource.EXTENDED)
-        if self.historical:
-            result.append(WeatherSource.HISTORICAL)
-        return result
+        return [source for _, source, _ in self._available]
 
-    @property
+    @cached_property
     def wind(self) -> Optional[WindData]:
         """Best available wind data (METAR > TAF > NWS > Extended > Historical)."""
-        if self.metar:
-            return self.metar.wind
-        if self.taf:
-            return self.taf.wind
-        if self.nws:
-            return self.nws.wind
-        if self.extended:
-            return self.extended.wind
-        if self.historical:
-            return self.historical.wind
-        return None
+        return self._available[0][0].wind if self._available else None
 
-    @property
+    @cached_property
     def wind_source(self) -> Optional[WeatherSource]:
         """Source of wind data."""
-        if self.metar:
-            return WeatherSource.METAR
-        if self.taf:
-            return WeatherSource.TAF
-        if self.nws:
-            return WeatherSource.NWS
-        if self.extended:
-            return WeatherSource.EXTENDED
-        if self.historical:
-            return WeatherSource.HISTORICAL
-        return None
+        return self._available[0][1] if self._available else None
 
-    @property
+    @cached_property
     def temperature_f(self) -> Optional[int]:
         """Best available temperature in Fahrenheit (METAR > NWS > Extended > Historical)."""
-        if self.metar and self.metar.temperature_f is not None:
-            return self.metar.temperature_f
-        if self.nws and self.nws.temperature_high is not None:
-            return self.nws.temperature_high
-        if self.extended and self.extended.temperature_high_f is not None:
-            return self.extended.temperature_high_f
-        if self.historical and self.historical.temperature_high_f is not None:
-            return self.historical.temperature_high_f
-        return None
+        return self._primary['temperature'][0]
 
     @property
     def temperature_source(self) -> Optional[WeatherSource]:
         """Source of temperature data."""
-        if self.metar and self.metar.temperature_f is not None:
-            return WeatherSource.METAR
-        if self.nws and self.nws.temperature_high is not None:
-            return WeatherSource.NWS
-        if self.extended and self.extended.temperature_high_f is not None:
-            return WeatherSource.EXTENDED
-        if self.historical and self.historical.temperature_high_f is not None:
-            return WeatherSource.HISTORICAL
-        return None
+        return self._primary['temperature'][1]
 
     @property
     def temperature_high_f(self) -> Optional[int]:
         """High temperature for forecast days or historical."""
-        if self.nws and self.nws.temperature_high is not None:
-            return self.nws.temperature_high
-        if self.extended and self.extended.temperature_high_f is not None:
-            return self.extended.temperature_high_f
-        if self.historical and self.historical.temperature_high_f is not None:
-            return self.historical.temperature_high_f
-        return None
+        return self._primary['temperature_high'][0]
 
     @property
     def temperature_low_f(self) -> Optional[int]:
         """Low temperature for forecast days or historical."""
-        if self.nws and self.nws.temperature_low is not None:
-            return self.nws.temperature_low
-        if self.extended and self.extended.temperature_low_f is not None:
-            return self.extended.temperature_low_f
-        if self.historical and self.historical.temperature_low_f is not None:
-            return self.historical.temperature_low_f
-        return None
+        return self._primary['temperature_low'][0]
 
-    @property
+    @cached_property
     def ceiling(self) -> Optional[int]:
         """Best available ceiling (METAR > TAF)."""
-        if self.metar:
-            return self.metar.ceiling
-        if self.taf:
-            return self.taf.ceiling
-        return None
+        return self._primary['ceiling'][0]
 
     @property
     def ceiling_source(self) -> Optional[WeatherSource]:
         """Source of ceiling data."""
-        if self.metar and self.metar.ceiling is not None:
-            return WeatherSource.METAR
-        if self.taf and self.taf.ceiling is not None:
-            return WeatherSource.TAF
-        return None
+        return self._primary['reported_ceiling'][1]
 
-    @property
+    @cached_property
     def visibility(self) -> Optional[float]:
         """Best available visibility (METAR > TAF)."""
-        if self.metar:
-            return self.metar.visibility
-        if self.taf:
-            return self.taf.visibility
-        return None
+        return self._primary['visibility'][0]
 
     @property
     def visibility_source(self) -> Optional[WeatherSource]:
         """Source of visibility data."""
-        if self.metar:
-            return WeatherSource.METAR
-        if self.taf:
-            return WeatherSource.TAF
-        return None
+        return self._primary['visibility'][1]
 
-    @property
+    @cached_property
     def precipitation_probability(self) -> Optional[int]:
         """Best available precipitation probability (NWS > Extended)."""
-        if self.nws and self.nws.precipitation_probability is not None:
-            return self.nws.precipitation_probability
-        if self.extended and self.extended.precipitation_probability is not None:
-            return self.extended.precipitation_probability
-        return None
+        return self._primary['precipitation_probability'][0]
 
     @property
     def precip_source(self) -> Optional[WeatherSource]:
         """Source of precipitation probability."""
-        if self.nws and self.nws.precipitation_probability is not None:
-            return WeatherSource.NWS
-        if self.extended and self.extended.precipitation_probability is not None:
-            return WeatherSource.EXTENDED
-        return None
+        return self._primary['precipitation_probability'][1]
 
-    @property
+    @cached_property
     def flight_rules(self) -> Optional[str]:
         """Flight rules from METAR or TAF."""
-        if self.metar:
-            return self.metar.flight_rules
-        if self.taf:
-            return self.taf.flight_rules
-        return None
+        return self._primary['flight_rules'][0]
 
     @property
     def flight_rules_color(self) -> str:
         """DaisyUI color for flight rules."""
-        colors = {
-            'VFR': 'success',
-            'MVFR': 'info',
-            'IFR': 'warning',
-            'LIFR': 'error',
-        }
-        return colors.get(self.flight_rules or '', 'neutral')
+        return _FLIGHT_RULES_COLORS.get(self.flight_rules or '', 'neutral')
 
     @property
     def short_forecast(self) -> Optional[str]:
@@ -775,7 +964,7 @@ class CompositeWeatherData:
             return self.extended.conditions
         return None
 
-    @property
+    @cached_property
     def rc_flying_assessment(self) -> dict:
         """Calculate R/C flying assessment from best available data."""
         wind = self.wind
@@ -824,44 +1013,19 @@ class CompositeWeatherData:
             return self.taf.raw_taf
         return None
 
-    @property
+    @cached_property
     def from_cache(self) -> bool:
         """True if any source was from cache."""
-        if self.metar and self.metar.from_cache:
-            return True
-        if self.taf and self.taf.from_cache:
-            return True
-        if self.nws and self.nws.from_cache:
-            return True
-        if self.extended and self.extended.from_cache:
-            return True
-        if self.historical and self.historical.from_cache:
-            return True
-        return False
+        return any(data.from_cache for data, _, _ in self._available)
 
-    @property
+    @cached_property
     def source_label(self) -> str:
         """Label showing all sources."""
-        labels = []
-        if self.metar:
-            labels.append('METAR')
-        if self.taf:
-            labels.append('TAF')
-        if self.nws:
-            labels.append('NWS')
-        if self.extended:
-            labels.append('Extended')
-        if self.historical:
-            labels.append('Historical')
-        return ' + '.join(labels) if labels else 'Unavailable'
+        return ' + '.join(label for _, _, label in self._available) or 'Unavailable'
 
     def get_shortest_ttl(self, ttls: dict[WeatherSource, int]) -> int:
         """Get the shortest TTL from available sources."""
-        min_ttl = float('inf')
-        for source in self.sources:
-            if source in ttls:
-                min_ttl = min(min_ttl, ttls[source])
-        return int(min_ttl) if min_ttl != float('inf') else 0
+        return min((ttls[source] for source in self.sources if source in ttls), default=0)
 
 
 class WeatherServiceError(Exception):
@@ -882,15 +1046,58 @@ class WeatherService:
     BASE_DELAY = 1.0
     MAX_DELAY = 30.0
 
+    # Transient gateway/server errors worth retrying like a 429
+    RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+    # How long a composite fetch waits on each source before going without it
+    COMPOSITE_SOURCE_TIMEOUTS = {'metar': 3.0, 'taf': 3.0, 'nws': 5.0, 'extended': 5.0}
+
+    VISUALCROSSING_TIMELINE_URL = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline"
+
+    # Earliest date Visual Crossing has historical observations for
+    VISUALCROSSING_HISTORY_START = date(1970, 1, 1)
+
+    # Record types clear_cache removes for each day out from today (index =
+    # days_out), mirroring the sources chosen by get_weather_for_date
+    _CLEAR_TYPES_BY_DAYS_OUT = (
+        ('metar',),
+        ('taf',),
+        *(('nws',),) * 6,
+        *(('extended', 'hourly'),) * 7,
+    )
+    _STATION_TYPES = frozenset({'metar', 'taf'})
+
     def __init__(self):
         self.api_token = getattr(settings, 'AVWX_API_TOKEN', '')
+        # Settings are fixed for the service's lifetime (the shared instance is
+        # rebuilt when they change), so the configured check is decided once
+        self._configured = bool(self.api_token)
         self.base_url = 'https://avwx.rest/api'
         self.default_station = getattr(settings, 'AVWX_DEFAULT_STATION', 'KJFK')
-        self.nws_location = getattr(settings, 'NWS_DEFAULT_LOCATION', (40.9781, -124.1086))
+        lat, lon = getattr(settings, 'NWS_DEFAULT_LOCATION', (40.9781, -124.1086))
+        self.nws_location = (float(lat), float(lon))
         self.nws_user_agent = getattr(settings, 'NWS_USER_AGENT', 'HamsAlert/1.0')
         self.local_timezone = ZoneInfo(getattr(settings, 'WEATHER_LOCAL_TIMEZONE', 'America/Los_Angeles'))
         self.visualcrossing_api_key = getattr(settings, 'VISUALCROSSING_API_KEY', '')
 
+        # Request headers are fixed per service, so build them once
+        self._avwx_headers = {'Authorization': f'Token {self.api_token}'}
+        self._nws_headers = {
+            'User-Agent': self.nws_user_agent,
+            'Accept': 'application/geo+json',
+        }
+
+        # Visual Crossing timeline query params, keyed by 'include' value (built once)
+        self._visualcrossing_params = {
+            include: {
+                'key': self.visualcrossing_api_key,
+                'unitGroup': 'metric',  # Celsius, km/h
+                'include': include,
+                'contentType': 'json',
+            }
+            for include in ('days', 'hours')
+        }
+
         # Cache TTLs
         self.metar_cache_ttl = getattr(settings, 'WEATHER_METAR_CACHE_TTL', 1800)
         self.taf_cache_ttl = getattr(settings, 'WEATHER_TAF_CACHE_TTL', 3600)
@@ -898,6 +1105,14 @@ class WeatherService:
         self.visualcrossing_cache_ttl = getattr(settings, 'WEATHER_VISUALCROSSING_CACHE_TTL', 14400)
         self.extended_cache_ttl = self.visualcrossing_cache_ttl  # Alias for compatibility
         self.historical_cache_ttl = getattr(settings, 'WEATHER_HISTORICAL_CACHE_TTL', 86400)  # 24 hours
+        # How long past its TTL data may still be served while a refresh runs
+        self.stale_while_revalidate = getattr(settings, 'WEATHER_STALE_WHILE_REVALIDATE', 3600)
+        # How long view reads may be served from the in-process L1 cache (0 disables it)
+        self.l1_cache_ttl = getattr(settings, 'WEATHER_L1_CACHE_TTL', 60)
+        # Per-source wait budget (seconds) for composite fetches
+        self.composite_source_timeouts = getattr(
+            settings, 'WEATHER_COMPOSITE_SOURCE_TIMEOUTS', self.COMPOSITE_SOURCE_TIMEOUTS
+        )
 
         # Rate limiting settings (can be overridden via settings)
         self.max_retries = getattr(settings, 'WEATHER_MAX_RETRIES', self.MAX_RETRIES)
@@ -910,6 +1125,52 @@ class WeatherService:
         self.rate_limit_per_day = getattr(settings, 'WEATHER_RATE_LIMIT_PER_DAY', 10000)
         self.rate_limit_safety_margin = getattr(settings, 'WEATHER_RATE_LIMIT_SAFETY_MARGIN', 0.9)
 
+        # NWS gridpoint forecast URLs keyed by (lat, lon); the points lookup
+        # for a fixed location never changes, so it only needs to happen once.
+        self._nws_forecast_url_cache: dict[tuple[float, float], str] = {}
+
+        # Pooled HTTP client, created on first use so idle services hold no sockets
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
+
+    def _get_http_client(self) -> httpx.Client:
+        """
+        Return this service's pooled HTTP client.
+
+        Reusing one client keeps connections (and TLS sessions) alive between
+        requests instead of paying a fresh handshake on every call.
+        """
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        timeout=10.0,
+                        # The transport owns the pool; retries stay in
+                        # _make_request_with_retry so they aren't stacked
+                        transport=httpx.HTTPTransport(
+                            http2=_HTTP2_AVAILABLE,
+                            limits=httpx.Limits(
+                                max_connections=20,
+                                max_keepalive_connections=20,
+                                keepalive_expiry=60.0,
+                            ),
+                        ),
+                    )
+        return self._http_client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        with self._http_client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+    def __enter__(self) -> 'WeatherService':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _make_request_with_retry(
         self,
         url: str,
@@ -918,7 +1179,7 @@ class WeatherService:
         headers: Optional[dict] = None,
     ) -> httpx.Response:
         """
-        Make HTTP GET request with exponential backoff retry on 429/timeout errors.
+        Make HTTP GET request with exponential backoff retry on 429/5xx/timeout errors.
 
         Checks proactive rate limits before requesting and increments counters
         after successful responses.
@@ -944,31 +1205,23 @@ class WeatherService:
 
         for attempt in range(self.max_retries + 1):
             try:
-                with httpx.Client(timeout=timeout) as client:
-                    response = client.get(url, params=params, headers=headers)
+                response = self._get_http_client().get(url, params=params, headers=headers, timeout=timeout)
+
+                if self._should_retry_status(response.status_code):
+                    if attempt < self.max_retries:
+                        delay = self._retry_delay(response, attempt)
+                        reason = "Rate limited" if response.status_code == 429 else "Upstream unavailable"
+                        logger.warning(
+                            f"{reason} ({response.status_code}) on {url}, "
+                            f"attempt {attempt + 1}/{self.max_retries + 1}, retrying in {delay:.1f}s"
+                        )
+                        time.sleep(delay)
+                        continue
 
                     if response.status_code == 429:
-                        if attempt < self.max_retries:
-                            # Check for Retry-After header
-                            retry_after = response.headers.get('Retry-After')
-                            if retry_after:
-                                try:
-                                    delay = min(float(retry_after), self.max_delay)
-                                except ValueError:
-                                    delay = self._calculate_backoff_delay(attempt)
-                            else:
-                                delay = self._calculate_backoff_delay(attempt)
-
-                            logger.warning(
-                                f"Rate limited (429) on {url}, attempt {attempt + 1}/{self.max_retries + 1}, "
-                                f"retrying in {delay:.1f}s"
-                            )
-                            time.sleep(delay)
-                            continue
-
                         raise WeatherServiceError("API rate limit exceeded after retries")
 
-                    return response
+                return response
 
             except httpx.TimeoutException as e:
                 last_exception = e
@@ -997,6 +1250,61 @@ class WeatherService:
             raise WeatherServiceError("API request timed out after retries")
         raise WeatherServiceError(f"API request failed after retries: {last_exception}")
 
+    def _stream_with_retry(
+        self,
+        client: httpx.Client,
+        url: str,
+        headers: Optional[dict],
+        handle: Callable[[httpx.Response], Any],
+        timeout: float = 10.0,
+    ) -> Any:
+        """
+        Stream a GET request with the same retry/backoff as _make_request_with_retry.
+
+        handle(response) runs inside the stream, so it can check the status
+        before reading the body. 429/502/503/504 responses are closed unread
+        and retried, and so are transport errors (including ones raised while
+        reading the body). Once retries run out, the last retryable response
+        goes to handle so callers report its status as before, and the last
+        transport error is re-raised.
+        """
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            try:
+                with client.stream('GET', url, headers=headers, timeout=timeout) as response:
+                    if not (retries_left and self._should_retry_status(response.status_code)):
+                        return handle(response)
+                    delay = self._retry_delay(response, attempt)
+                    reason = "Rate limited" if response.status_code == 429 else "Upstream unavailable"
+                    logger.warning(
+                        f"{reason} ({response.status_code}) on {url}, "
+                        f"attempt {attempt + 1}/{self.max_retries + 1}, retrying in {delay:.1f}s"
+                    )
+            except httpx.TransportError as e:
+                if not retries_left:
+                    raise
+                delay = self._calculate_backoff_delay(attempt)
+                logger.warning(
+                    f"Request error on {url}: {e}, attempt {attempt + 1}/{self.max_retries + 1}, "
+                    f"retrying in {delay:.1f}s"
+                )
+            # Sleep with the connection already back in the pool
+            time.sleep(delay)
+
+    def _should_retry_status(self, status_code: int) -> bool:
+        """Whether a response status is worth retrying (rate limited or upstream unavailable)."""
+        return status_code == 429 or status_code in self.RETRYABLE_STATUS_CODES
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Delay before retrying a response, honouring Retry-After when present."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay)
+            except ValueError:
+                pass
+        return self._calculate_backoff_delay(attempt)
+
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """
         Calculate exponential backoff delay with jitter.
@@ -1026,48 +1334,30 @@ class WeatherService:
 
         now = timezone.now()
         extended_types = ['extended', 'hourly', 'historical']
-
-        # Count requests in last minute
         minute_ago = now - timedelta(minutes=1)
-        minute_count = WeatherRecord.objects.filter(
-            weather_type__in=extended_types,
-            fetched_at__gte=minute_ago
-        ).count()
-
-        minute_threshold = int(self.rate_limit_per_minute * self.rate_limit_safety_margin)
-        if minute_count >= minute_threshold:
-            logger.warning(
-                f"Rate limit approaching: {minute_count}/{self.rate_limit_per_minute} per minute"
-            )
-            return False
-
-        # Count requests in last hour
         hour_ago = now - timedelta(hours=1)
-        hour_count = WeatherRecord.objects.filter(
-            weather_type__in=extended_types,
-            fetched_at__gte=hour_ago
-        ).count()
-
-        hour_threshold = int(self.rate_limit_per_hour * self.rate_limit_safety_margin)
-        if hour_count >= hour_threshold:
-            logger.warning(
-                f"Rate limit approaching: {hour_count}/{self.rate_limit_per_hour} per hour"
-            )
-            return False
-
-        # Count requests in last day
         day_ago = now - timedelta(days=1)
-        day_count = WeatherRecord.objects.filter(
+
+        # Count requests in the last minute, hour and day in one query
+        counts = WeatherRecord.objects.filter(
             weather_type__in=extended_types,
-            fetched_at__gte=day_ago
-        ).count()
+            fetched_at__gte=day_ago,
+        ).aggregate(
+            minute=Count('pk', filter=Q(fetched_at__gte=minute_ago)),
+            hour=Count('pk', filter=Q(fetched_at__gte=hour_ago)),
+            day=Count('pk'),
+        )
 
-        day_threshold = int(self.rate_limit_per_day * self.rate_limit_safety_margin)
-        if day_count >= day_threshold:
-            logger.warning(
-                f"Rate limit approaching: {day_count}/{self.rate_limit_per_day} per day"
-            )
-            return False
+        windows = (
+            ('minute', self.rate_limit_per_minute),
+            ('hour', self.rate_limit_per_hour),
+            ('day', self.rate_limit_per_day),
+        )
+        for window, limit in windows:
+            threshold = int(limit * self.rate_limit_safety_margin)
+            if counts[window] >= threshold:
+                logger.warning(f"Rate limit approaching: {counts[window]}/{limit} per {window}")
+                return False
 
         return True
 
@@ -1094,53 +1384,145 @@ class WeatherService:
         Returns:
             Stored data dict if found, None otherwise
         """
-        from apps.hamsalert.models import WeatherRecord
-
-        query = WeatherRecord.objects.filter(
-            weather_type=weather_type,
-            target_date=target_date,
-        )
-
-        if station:
-            query = query.filter(station=station)
-        elif lat is not None and lon is not None:
-            # Use approximate matching for coordinates (within ~11m precision)
-            query = query.filter(
-                latitude__range=(Decimal(str(lat)) - Decimal('0.0001'), Decimal(str(lat)) + Decimal('0.0001')),
-                longitude__range=(Decimal(str(lon)) - Decimal('0.0001'), Decimal(str(lon)) + Decimal('0.0001')),
-            )
+        query = self._records_query(weather_type, target_date, station, lat, lon)
 
         if max_age_seconds is not None:
             cutoff = timezone.now() - timezone.timedelta(seconds=max_age_seconds)
             query = query.filter(fetched_at__gte=cutoff)
 
-        record = query.order_by('-fetched_at').first()
-        if record:
+        # Only the payload is needed; skip hydrating a full model instance
+        data = query.order_by('-fetched_at').values_list('data', flat=True).first()
+        if data is not None:
             logger.info(f"DB cache hit: {weather_type} for {target_date}")
-            return record.data
-        return None
+        return data
 
-    def _save_to_db(
+    def _get_newest_from_db(
         self,
         weather_type: str,
         target_date: date,
-        data: dict,
         station: Optional[str] = None,
         lat: Optional[float] = None,
         lon: Optional[float] = None,
-        api_response_time_ms: Optional[int] = None,
-    ) -> None:
+    ) -> Optional[tuple[dict, datetime]]:
         """
-        Update existing record or create new one.
+        Retrieve the newest stored (data, fetched_at) for a weather type, or None.
 
-        Args:
-            weather_type: Type of weather data
-            target_date: The date the weather is for
-            data: Weather data dict to store
-            station: Station identifier (for METAR/TAF)
-            lat: Latitude (for NWS/Extended)
-            lon: Longitude (for NWS/Extended)
-            api_response_time_ms: API response time in milliseconds
+        Lets callers that check several ages (fresh, stale-while-revalidate,
+        stale fallback) decide from one query.
+        """
+        return (
+            self._records_query(weather_type, target_date, station, lat, lon)
+            .order_by('-fetched_at')
+            .values_list('data', 'fetched_at')
+            .first()
+        )
+
+    def _records_query(
+        self,
+        weather_type: str,
+        target_date: date,
+        station: Optional[str] = None,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+    ):
+        """WeatherRecord queryset for one weather type and date at a station or location."""
+        from apps.hamsalert.models import WeatherRecord
+
+        query = WeatherRecord.objects.filter(
+            weather_type=weather_type,
+            target_date=target_date,
+        )
+
+        if station:
+            query = query.filter(station=station)
+        elif lat is not None and lon is not None:
+            query = query.filter(**self._location_filter(lat, lon))
+        return query
+
+    def _get_many_from_db(
+        self,
+        target_date: date,
+        station: str,
+        station_types: list[str],
+        lat: float,
+        lon: float,
+        location_types: list[str],
+        max_ages: Optional[dict[str, int]] = None,
+    ) -> dict[str, dict]:
+        """
+        Retrieve the newest stored data for several weather types in one query.
+
+        station_types are matched by station (METAR/TAF), location_types by
+        coordinates (NWS/Extended/Historical). Returns {weather_type: data}
+        for the types that have a record. Freshness is only checked for types
+        given a maximum age (seconds) in max_ages.
+        """
+        from apps.hamsalert.models import WeatherRecord
+
+        conditions = Q()
+        if station_types:
+            conditions |= Q(weather_type__in=station_types, station=station)
+        if location_types:
+            conditions |= Q(weather_type__in=location_types, **self._location_filter(lat, lon))
+        if not conditions:
+            return {}
+
+        records = WeatherRecord.objects.filter(conditions, target_date=target_date).order_by('fetched_at')
+        if not max_ages:
+            # Ascending fetched_at, so the newest record per type wins
+            return {weather_type: data for weather_type, data in records.values_list('weather_type', 'data')}
+
+        now = timezone.now()
+        newest = {
+            weather_type: (data, fetched_at)
+            for weather_type, data, fetched_at in records.values_list('weather_type', 'data', 'fetched_at')
+        }
+        return {
+            weather_type: data
+            for weather_type, (data, fetched_at) in newest.items()
+            if weather_type not in max_ages or now - fetched_at <= timedelta(seconds=max_ages[weather_type])
+        }
+
+    @cached_property
+    def _deserializers(self) -> dict[str, Callable[[dict], Any]]:
+        """Stored-data deserializer for each composite weather type."""
+        return {
+            'metar': self._deserialize_metar_data,
+            'taf': self._deserialize_taf_data,
+            'nws': self._deserialize_nws_data,
+            'extended': self._deserialize_extended_data,
+            'historical': self._deserialize_historical_data,
+        }
+
+    def _location_filter(self, lat: float, lon: float) -> dict:
+        """Queryset filter kwargs matching coordinates approximately (within ~11m precision)."""
+        lat_d, lon_d = Decimal(str(lat)), Decimal(str(lon))
+        return {
+            'latitude__range': (lat_d - _COORDINATE_TOLERANCE, lat_d + _COORDINATE_TOLERANCE),
+            'longitude__range': (lon_d - _COORDINATE_TOLERANCE, lon_d + _COORDINATE_TOLERANCE),
+        }
+
+    def _save_to_db(
+        self,
+        weather_type: str,
+        target_date: date,
+        data: dict,
+        station: Optional[str] = None,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        api_response_time_ms: Optional[int] = None,
+    ) -> None:
+        """
+        Update existing record or create new one.
+
+        Args:
+            weather_type: Type of weather data
+            target_date: The date the weather is for
+            data: Weather data dict to store
+            station: Station identifier (for METAR/TAF)
+            lat: Latitude (for NWS/Extended)
+            lon: Longitude (for NWS/Extended)
+            api_response_time_ms: API response time in milliseconds
         """
         from apps.hamsalert.models import WeatherRecord
 
@@ -1179,8 +1561,15 @@ class WeatherService:
                     else:
                         WeatherRecord.objects.create(**lookup, **defaults)
                 else:
-                    WeatherRecord.objects.update_or_create(defaults=defaults, **lookup)
+                    # Single INSERT ... ON CONFLICT DO UPDATE instead of SELECT then UPDATE/INSERT
+                    WeatherRecord.objects.bulk_create(
+                        [WeatherRecord(**lookup, **defaults)],
+                        update_conflicts=True,
+                        unique_fields=['weather_type', 'target_date', 'station', 'latitude', 'longitude'],
+                        update_fields=list(defaults),
+                    )
 
+                _l1_invalidate((weather_type, target_date, station or '', lat, lon))
                 logger.debug(f"Saved {weather_type} to DB for {target_date}")
                 return
             except OperationalError as e:
@@ -1252,22 +1641,21 @@ class WeatherService:
 
     def _deserialize_hourly_data(self, data: dict) -> HourlyForecastData:
         """Deserialize dict to HourlyForecastData."""
-        hours = []
-        for h in data.get('hours', []):
-            hours.append(HourlyForecastEntry(
-                time=datetime.fromisoformat(h['time']),
-                temperature_c=h.get('temperature_c'),
-                wind_speed_kmh=h.get('wind_speed_kmh'),
-                wind_direction=h.get('wind_direction'),
-                wind_gusts_kmh=h.get('wind_gusts_kmh'),
-                precipitation_probability=h.get('precipitation_probability'),
-                weather_code=h.get('weather_code'),
-            ))
-
         return HourlyForecastData(
             location=tuple(data['location']),
             target_date=date.fromisoformat(data['target_date']),
-            hours=hours,
+            hours=[
+                HourlyForecastEntry(
+                    time=_parse_iso(h['time']),
+                    temperature_c=h.get('temperature_c'),
+                    wind_speed_kmh=h.get('wind_speed_kmh'),
+                    wind_direction=h.get('wind_direction'),
+                    wind_gusts_kmh=h.get('wind_gusts_kmh'),
+                    precipitation_probability=h.get('precipitation_probability'),
+                    weather_code=h.get('weather_code'),
+                )
+                for h in data.get('hours', [])
+            ],
             cached_at=timezone.now(),
             from_cache=True,
         )
@@ -1336,7 +1724,7 @@ class WeatherService:
         wind_data = data['wind']
         obs_time_str = data['observation_time']
         try:
-            obs_time = datetime.fromisoformat(obs_time_str)
+            obs_time = _parse_iso(obs_time_str)
         except (ValueError, AttributeError):
             obs_time = datetime.now()
 
@@ -1411,17 +1799,17 @@ class WeatherService:
         period_wind = period_data['wind']
 
         try:
-            issue_time = datetime.fromisoformat(data['issue_time'])
+            issue_time = _parse_iso(data['issue_time'])
         except (ValueError, AttributeError):
             issue_time = datetime.now()
 
         try:
-            period_start = datetime.fromisoformat(period_data['start_time'])
+            period_start = _parse_iso(period_data['start_time'])
         except (ValueError, AttributeError):
             period_start = datetime.now()
 
         try:
-            period_end = datetime.fromisoformat(period_data['end_time'])
+            period_end = _parse_iso(period_data['end_time'])
         except (ValueError, AttributeError):
             period_end = datetime.now()
 
@@ -1510,11 +1898,11 @@ class WeatherService:
         periods = []
         for p in data.get('periods', []):
             try:
-                start_time = datetime.fromisoformat(p['start_time'])
+                start_time = _parse_iso(p['start_time'])
             except (ValueError, AttributeError):
                 start_time = datetime.now()
             try:
-                end_time = datetime.fromisoformat(p['end_time'])
+                end_time = _parse_iso(p['end_time'])
             except (ValueError, AttributeError):
                 end_time = datetime.now()
 
@@ -1565,7 +1953,7 @@ class WeatherService:
         - 8-15 days: Visual Crossing Extended
         - >15 days: Unavailable
         """
-        local_today = datetime.now(self.local_timezone).date()
+        local_today = self._local_today()
         days_out = (target_date - local_today).days
 
         if days_out < 0:
@@ -1596,9 +1984,9 @@ class WeatherService:
         - Days 8-15: Extended only
         - >15 days: None
 
-        Uses ThreadPoolExecutor for parallel fetches on cache miss.
+        Fetches run in parallel on a shared, bounded module-level thread pool.
         """
-        local_today = datetime.now(self.local_timezone).date()
+        local_today = self._local_today()
         days_out = (target_date - local_today).days
 
         # Historical data for past dates
@@ -1618,12 +2006,6 @@ class WeatherService:
         if days_out > 14:
             return CompositeWeatherData(target_date=target_date)
 
-        # Determine which sources to fetch
-        fetch_metar = days_out == 0
-        fetch_taf = days_out <= 1
-        fetch_nws = days_out <= 7
-        fetch_extended = days_out <= 14
-
         # Prepare fetch tasks
         results = {
             'metar': None,
@@ -1632,6 +2014,32 @@ class WeatherService:
             'extended': None,
         }
 
+        # Sources still fresh in the DB come back from one query; only the
+        # rest go through their getters (and possibly the APIs)
+        station_types = ['metar'] if days_out == 0 else []
+        if days_out <= 1:
+            station_types.append('taf')
+        location_types = ['nws', 'extended'] if days_out <= 7 else ['extended']
+        lat, lon = self.nws_location
+        fresh = self._get_many_from_db(
+            target_date, (station or self.default_station).upper(), station_types, lat, lon, location_types,
+            max_ages={
+                'metar': self.metar_cache_ttl,
+                'taf': self.taf_cache_ttl,
+                'nws': self.nws_cache_ttl,
+                'extended': self.extended_cache_ttl,
+            },
+        )
+        for weather_type, db_data in fresh.items():
+            if db_data:
+                results[weather_type] = self._deserializers[weather_type](db_data)
+
+        # Determine which sources to fetch
+        fetch_metar = days_out == 0 and results['metar'] is None
+        fetch_taf = days_out <= 1 and results['taf'] is None
+        fetch_nws = days_out <= 7 and results['nws'] is None
+        fetch_extended = results['extended'] is None
+
         def fetch_metar_safe():
             try:
                 return self._get_metar(station)
@@ -1660,47 +2068,50 @@ class WeatherService:
                 logger.warning(f"Extended forecast fetch failed: {e}")
                 return None
 
-        # Use ThreadPoolExecutor for parallel fetches
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {}
-            if fetch_metar:
-                futures[executor.submit(fetch_metar_safe)] = 'metar'
-            if fetch_taf:
-                futures[executor.submit(fetch_taf_safe)] = 'taf'
-            if fetch_nws:
-                futures[executor.submit(fetch_nws_safe)] = 'nws'
-            if fetch_extended:
-                futures[executor.submit(fetch_extended_safe)] = 'extended'
-
-            for future in as_completed(futures):
-                source_name = futures[future]
+        def in_worker(fetch):
+            # Pool threads outlive the request, so release their DB connections after each task
+            def run():
                 try:
-                    results[source_name] = future.result()
-                except Exception as e:
-                    logger.error(f"Error fetching {source_name}: {e}")
-                    results[source_name] = None
-
-        # Determine primary source for TTL calculation
-        if results['metar']:
-            primary_source = WeatherSource.METAR
-        elif results['taf']:
-            primary_source = WeatherSource.TAF
-        elif results['nws']:
-            primary_source = WeatherSource.NWS
-        elif results['extended']:
-            primary_source = WeatherSource.EXTENDED
-        else:
-            primary_source = WeatherSource.UNAVAILABLE
+                    return fetch()
+                finally:
+                    close_old_connections()
+            return run
+
+        tasks = {}
+        if fetch_metar:
+            tasks['metar'] = fetch_metar_safe
+        if fetch_taf:
+            tasks['taf'] = fetch_taf_safe
+        if fetch_nws:
+            tasks['nws'] = fetch_nws_safe
+        if fetch_extended:
+            tasks['extended'] = fetch_extended_safe
+
+        # Fan out on the shared pool instead of creating threads per call
+        futures = {
+            _fetch_executor.submit(in_worker(fetch)): source_name
+            for source_name, fetch in tasks.items()
+        }
 
-        return CompositeWeatherData(
-            target_date=target_date,
-            metar=results['metar'],
-            taf=results['taf'],
-            nws=results['nws'],
-            extended=results['extended'],
-            cached_at=timezone.now(),
-            source=primary_source,
-        )
+        # Each source gets its own deadline from the fan-out, so one slow
+        # upstream can't hold back the rest. A timed-out fetch keeps running
+        # and still saves its result for the next request.
+        started = time.monotonic()
+        for future, source_name in futures.items():
+            budget = self.composite_source_timeouts.get(source_name)
+            remaining = None if budget is None else max(0.0, started + budget - time.monotonic())
+            try:
+                results[source_name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                logger.warning(f"{source_name} fetch exceeded {budget}s, continuing without it")
+            except Exception as e:
+                logger.error(f"Error fetching {source_name}: {e}")
+                results[source_name] = None
+
+        composite = CompositeWeatherData(target_date=target_date, cached_at=timezone.now(), **results)
+        # Primary source for TTL calculation is the highest-priority one present
+        composite.source = composite.sources[0] if composite.sources else WeatherSource.UNAVAILABLE
+        return composite
 
     def get_weather_from_db(
         self,
@@ -1717,7 +2128,7 @@ class WeatherService:
         """
         station = (station or self.default_station).upper()
         lat, lon = self.nws_location
-        local_today = datetime.now(self.local_timezone).date()
+        local_today = self._local_today()
         days_out = (target_date - local_today).days
 
         results = {
@@ -1728,65 +2139,53 @@ class WeatherService:
             'historical': None,
         }
 
-        # Historical data for past dates
+        # Which sources apply to this date
+        station_types = []
+        location_types = []
         if days_out < 0:
-            db_data = self._get_from_db('historical', target_date, lat=lat, lon=lon)
-            if db_data:
-                results['historical'] = self._deserialize_historical_data(db_data)
+            # Historical data for past dates
+            location_types.append('historical')
         else:
-            # Day 0: METAR
             if days_out == 0:
-                db_data = self._get_from_db('metar', target_date, station=station)
-                if db_data:
-                    results['metar'] = self._deserialize_metar_data(db_data)
-
-            # Days 0-1: TAF
+                station_types.append('metar')  # Day 0: METAR
             if days_out <= 1:
-                db_data = self._get_from_db('taf', target_date, station=station)
-                if db_data:
-                    results['taf'] = self._deserialize_taf_data(db_data)
-
-            # Days 2-7: NWS
+                station_types.append('taf')  # Days 0-1: TAF
             if 2 <= days_out <= 7:
-                db_data = self._get_from_db('nws', target_date, lat=lat, lon=lon)
-                if db_data:
-                    results['nws'] = self._deserialize_nws_data(db_data)
-
-            # Days 0-14: Extended forecast
+                location_types.append('nws')  # Days 2-7: NWS
             if days_out <= 14:
-                db_data = self._get_from_db('extended', target_date, lat=lat, lon=lon)
-                if db_data:
-                    results['extended'] = self._deserialize_extended_data(db_data)
+                location_types.append('extended')  # Days 0-14: Extended forecast
+
+        # Serve what the L1 cache holds; one query for every other applicable source
+        stored = {}
+        l1_keys = {
+            **{t: (t, target_date, station, None, None) for t in station_types},
+            **{t: (t, target_date, '', lat, lon) for t in location_types},
+        }
+        for weather_type, key in l1_keys.items():
+            db_data = _l1_get(key)
+            if db_data is not None:
+                stored[weather_type] = db_data
+        missing_station = [t for t in station_types if t not in stored]
+        missing_location = [t for t in location_types if t not in stored]
+        if missing_station or missing_location:
+            fetched = self._get_many_from_db(target_date, station, missing_station, lat, lon, missing_location)
+            if self.l1_cache_ttl > 0:
+                for weather_type, db_data in fetched.items():
+                    _l1_put(l1_keys[weather_type], db_data, self.l1_cache_ttl)
+            stored.update(fetched)
+        for weather_type, db_data in stored.items():
+            if db_data:
+                results[weather_type] = self._deserializers[weather_type](db_data)
 
         # Check if we have any data
         has_data = any(results.values())
         if not has_data:
             return None
 
-        # Determine primary source
-        if results['metar']:
-            primary_source = WeatherSource.METAR
-        elif results['taf']:
-            primary_source = WeatherSource.TAF
-        elif results['nws']:
-            primary_source = WeatherSource.NWS
-        elif results['extended']:
-            primary_source = WeatherSource.EXTENDED
-        elif results['historical']:
-            primary_source = WeatherSource.HISTORICAL
-        else:
-            primary_source = WeatherSource.UNAVAILABLE
-
-        return CompositeWeatherData(
-            target_date=target_date,
-            metar=results['metar'],
-            taf=results['taf'],
-            nws=results['nws'],
-            extended=results['extended'],
-            historical=results['historical'],
-            cached_at=timezone.now(),
-            source=primary_source,
-        )
+        composite = CompositeWeatherData(target_date=target_date, cached_at=timezone.now(), **results)
+        # Primary source is the highest-priority one present
+        composite.source = composite.sources[0]
+        return composite
 
     def get_hourly_from_db(self, target_date: date) -> Optional['HourlyForecastData']:
         """
@@ -1796,7 +2195,12 @@ class WeatherService:
         Returns None if no data exists (poller hasn't run yet).
         """
         lat, lon = self.nws_location
-        db_data = self._get_from_db('hourly', target_date, lat=lat, lon=lon)
+        key = ('hourly', target_date, '', lat, lon)
+        db_data = _l1_get(key)
+        if db_data is None:
+            db_data = self._get_from_db('hourly', target_date, lat=lat, lon=lon)
+            if db_data and self.l1_cache_ttl > 0:
+                _l1_put(key, db_data, self.l1_cache_ttl)
         if db_data:
             return self._deserialize_hourly_data(db_data)
         return None
@@ -1811,33 +2215,29 @@ class WeatherService:
 
         station = (station or self.default_station).upper()
         lat, lon = self.nws_location
-        local_today = datetime.now(self.local_timezone).date()
+        local_today = self._local_today()
         days_out = (target_date - local_today).days
 
-        # Clear all applicable DB records
+        # Clear all applicable DB records in a single DELETE
+        location_types = []
+        station_types = []
         if days_out < 0:
-            WeatherRecord.objects.filter(
-                weather_type='historical', target_date=target_date
-            ).delete()
+            location_types.append('historical')
         if days_out == 0:
-            WeatherRecord.objects.filter(
-                weather_type='metar', target_date=target_date, station=station
-            ).delete()
+            station_types.append('metar')
         if days_out <= 1:
-            WeatherRecord.objects.filter(
-                weather_type='taf', target_date=target_date, station=station
-            ).delete()
+            station_types.append('taf')
         if days_out <= 7:
-            WeatherRecord.objects.filter(
-                weather_type='nws', target_date=target_date
-            ).delete()
+            location_types.append('nws')
         if days_out <= 14:
-            WeatherRecord.objects.filter(
-                weather_type='extended', target_date=target_date
-            ).delete()
-            WeatherRecord.objects.filter(
-                weather_type='hourly', target_date=target_date
-            ).delete()
+            location_types.extend(['extended', 'hourly'])
+
+        if location_types or station_types:
+            query = Q(weather_type__in=location_types)
+            if station_types:
+                query |= Q(weather_type__in=station_types, station=station)
+            WeatherRecord.objects.filter(query, target_date=target_date).delete()
+        _l1_invalidate()
 
     def get_weather(self, station: Optional[str] = None) -> Optional[WeatherData]:
         """Get METAR weather data for a station (legacy method for today)."""
@@ -1846,36 +2246,28 @@ class WeatherService:
     def _get_metar(self, station: Optional[str] = None) -> Optional[WeatherData]:
         """Get METAR weather data for a station with DB cache."""
         station = (station or self.default_station).upper()
-        local_today = datetime.now(self.local_timezone).date()
-        ttl = self.metar_cache_ttl
-
-        # 1. Check DB cache
-        db_data = self._get_from_db('metar', local_today, station=station, max_age_seconds=ttl)
-        if db_data:
-            logger.info(f"Cache hit: METAR {station}")
-            return self._deserialize_metar_data(db_data)
+        local_today = self._local_today()
+        return self._cached_fetch(
+            'metar', local_today, self.metar_cache_ttl,
+            refresh=lambda: self._refresh_metar(station, local_today),
+            deserialize=self._deserialize_metar_data,
+            label=f"METAR {station}",
+            station=station,
+        )
 
-        # 2. Fetch from API
+    def _refresh_metar(self, station: str, local_today: date) -> Optional[WeatherData]:
+        """Fetch METAR from AVWX and store it in the DB."""
         logger.info(f"API fetch: METAR {station}")
-        try:
-            start_time = time.time()
-            data = self._fetch_metar_from_api(station)
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            if data:
-                self._save_to_db(
-                    'metar', local_today, self._serialize_metar_data(data),
-                    station=station, api_response_time_ms=response_time_ms
-                )
-            return data
-
-        except WeatherServiceError:
-            # 3. Fallback to stale DB data
-            stale_data = self._get_from_db('metar', local_today, station=station, max_age_seconds=None)
-            if stale_data:
-                logger.warning(f"Using stale DB data for METAR {station}")
-                return self._deserialize_metar_data(stale_data)
-            raise
+        start_time = time.time()
+        data = self._fetch_metar_from_api(station)
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if data:
+            self._save_to_db(
+                'metar', local_today, self._serialize_metar_data(data),
+                station=station, api_response_time_ms=response_time_ms
+            )
+        return data
 
     def _fetch_metar_from_api(self, station: str) -> Optional[WeatherData]:
         """Fetch METAR data from AVWX API."""
@@ -1884,67 +2276,56 @@ class WeatherService:
             raise WeatherServiceError("Weather API not configured")
 
         url = f"{self.base_url}/metar/{station}"
-        headers = {'Authorization': f'Token {self.api_token}'}
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
-
-                if response.status_code == 401:
-                    raise WeatherServiceError("Invalid API token")
-                elif response.status_code == 404:
-                    logger.warning(f"Station not found: {station}")
-                    return None
-                elif response.status_code == 429:
-                    raise WeatherServiceError("API rate limit exceeded")
-                elif response.status_code != 200:
-                    raise WeatherServiceError(f"API error: {response.status_code}")
-
-                return self._parse_metar_response(response.json())
-
+            data = self._get_avwx_json(url, f"Station not found: {station}")
         except httpx.TimeoutException:
             raise WeatherServiceError("API request timed out")
         except httpx.RequestError as e:
             raise WeatherServiceError(f"API request failed: {e}")
+        return self._parse_metar_response(data) if data is not None else None
+
+    def _get_avwx_json(self, url: str, not_found_message: str) -> Optional[dict]:
+        """
+        Stream an AVWX GET request and decode the JSON body.
+
+        Like _get_nws_json, the status is checked before the body is read, so
+        error responses are never downloaded or decoded. Returns None for 404.
+        Rate limits, 5xx and transport errors are retried with backoff.
+        """
+        def handle(response: httpx.Response) -> Optional[dict]:
+            if response.status_code == 401:
+                raise WeatherServiceError("Invalid API token")
+            elif response.status_code == 404:
+                logger.warning(not_found_message)
+                return None
+            elif response.status_code == 429:
+                raise WeatherServiceError("API rate limit exceeded")
+            elif response.status_code != 200:
+                raise WeatherServiceError(f"API error: {response.status_code}")
+
+            return _json_loads(response.read())
+
+        return self._stream_with_retry(self._get_http_client(), url, self._avwx_headers, handle)
 
     def _parse_metar_response(self, data: dict) -> WeatherData:
         """Parse AVWX METAR API response into WeatherData."""
         try:
             # Parse wind
-            wind_dir = data.get('wind_direction') or {}
-            wind_speed = data.get('wind_speed') or {}
-            wind_gust = data.get('wind_gust') or {}
-
-            wind = WindData(
-                direction=wind_dir.get('value'),
-                speed=wind_speed.get('value', 0) or 0,
-                gust=wind_gust.get('value') if wind_gust else None,
-                direction_repr=wind_dir.get('repr', 'VRB'),
-            )
+            wind = _avwx_wind(data)
 
             # Parse clouds
-            clouds = []
-            for cloud in data.get('clouds') or []:
-                clouds.append(CloudLayer(
-                    coverage=cloud.get('type', 'CLR'),
-                    altitude=cloud.get('altitude'),
-                ))
+            clouds = _avwx_clouds(data)
 
             # Parse visibility
             vis = data.get('visibility') or {}
-            visibility = vis.get('value', 10) or 10
+            visibility = vis.get('value') or 10
             visibility_repr = vis.get('repr', str(visibility))
 
-            # Parse temperature
-            temp = data.get('temperature') or {}
-            dewpoint = data.get('dewpoint') or {}
-
             # Parse observation time
-            time_data = data.get('time') or {}
-            obs_time_str = time_data.get('dt', '')
             try:
-                obs_time = datetime.fromisoformat(obs_time_str.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
+                obs_time = _parse_iso(_avwx_field(data, 'time', 'dt'))
+            except (ValueError, TypeError, AttributeError):
                 obs_time = datetime.now()
 
             return WeatherData(
@@ -1955,8 +2336,8 @@ class WeatherService:
                 visibility=visibility,
                 visibility_repr=visibility_repr,
                 clouds=clouds,
-                temperature=temp.get('value'),
-                dewpoint=dewpoint.get('value'),
+                temperature=_avwx_field(data, 'temperature'),
+                dewpoint=_avwx_field(data, 'dewpoint'),
                 flight_rules=data.get('flight_rules', 'VFR'),
                 cached_at=timezone.now(),
                 source=WeatherSource.METAR,
@@ -1969,35 +2350,27 @@ class WeatherService:
     def _get_taf(self, station: Optional[str], target_date: date) -> Optional[TafForecastData]:
         """Get TAF forecast data for a station and target date with DB cache."""
         station = (station or self.default_station).upper()
-        ttl = self.taf_cache_ttl
-
-        # 1. Check DB cache
-        db_data = self._get_from_db('taf', target_date, station=station, max_age_seconds=ttl)
-        if db_data:
-            logger.info(f"Cache hit: TAF {station}")
-            return self._deserialize_taf_data(db_data)
+        return self._cached_fetch(
+            'taf', target_date, self.taf_cache_ttl,
+            refresh=lambda: self._refresh_taf(station, target_date),
+            deserialize=self._deserialize_taf_data,
+            label=f"TAF {station}",
+            station=station,
+        )
 
-        # 2. Fetch from API
+    def _refresh_taf(self, station: str, target_date: date) -> Optional[TafForecastData]:
+        """Fetch TAF from AVWX and store it in the DB."""
         logger.info(f"API fetch: TAF {station}")
-        try:
-            start_time = time.time()
-            data = self._fetch_taf_from_api(station, target_date)
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            if data:
-                self._save_to_db(
-                    'taf', target_date, self._serialize_taf_data(data),
-                    station=station, api_response_time_ms=response_time_ms
-                )
-            return data
-
-        except WeatherServiceError:
-            # 3. Fallback to stale DB data
-            stale_data = self._get_from_db('taf', target_date, station=station, max_age_seconds=None)
-            if stale_data:
-                logger.warning(f"Using stale DB data for TAF {station}")
-                return self._deserialize_taf_data(stale_data)
-            raise
+        start_time = time.time()
+        data = self._fetch_taf_from_api(station, target_date)
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if data:
+            self._save_to_db(
+                'taf', target_date, self._serialize_taf_data(data),
+                station=station, api_response_time_ms=response_time_ms
+            )
+        return data
 
     def _fetch_taf_from_api(self, station: str, target_date: date) -> Optional[TafForecastData]:
         """Fetch TAF data from AVWX API."""
@@ -2006,28 +2379,14 @@ class WeatherService:
             raise WeatherServiceError("Weather API not configured")
 
         url = f"{self.base_url}/taf/{station}"
-        headers = {'Authorization': f'Token {self.api_token}'}
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
-
-                if response.status_code == 401:
-                    raise WeatherServiceError("Invalid API token")
-                elif response.status_code == 404:
-                    logger.warning(f"TAF not found for station: {station}")
-                    return None
-                elif response.status_code == 429:
-                    raise WeatherServiceError("API rate limit exceeded")
-                elif response.status_code != 200:
-                    raise WeatherServiceError(f"API error: {response.status_code}")
-
-                return self._parse_taf_response(response.json(), target_date)
-
+            data = self._get_avwx_json(url, f"TAF not found for station: {station}")
         except httpx.TimeoutException:
             raise WeatherServiceError("API request timed out")
         except httpx.RequestError as e:
             raise WeatherServiceError(f"API request failed: {e}")
+        return self._parse_taf_response(data, target_date) if data is not None else None
 
     def _parse_taf_response(self, data: dict, target_date: date) -> Optional[TafForecastData]:
         """Parse AVWX TAF API response into TafForecastData."""
@@ -2036,27 +2395,28 @@ class WeatherService:
             if not forecasts:
                 return None
 
-            # Find the forecast period that covers the target date (midday)
-            target_datetime = datetime.combine(target_date, datetime.min.time().replace(hour=12))
+            # Find the forecast period that covers the target date (midday),
+            # compared as UTC when AVWX times are timezone-aware
+            target_naive = datetime.combine(target_date, _TAF_TARGET_TIME)
+            target_aware = target_naive.replace(tzinfo=dt_timezone.utc)
 
             applicable_period = None
+            period_start = period_end = None
             for fc in forecasts:
-                start_time_str = fc.get('start_time', {}).get('dt', '')
-                end_time_str = fc.get('end_time', {}).get('dt', '')
-
                 try:
-                    start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                    end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
+                    start_time = _parse_iso(_avwx_field(fc, 'start_time', 'dt'))
+                    target_datetime = target_naive if start_time.tzinfo is None else target_aware
 
-                    # Make target_datetime timezone-aware for comparison
-                    if start_time.tzinfo is not None:
-                        from datetime import timezone as dt_timezone
-                        target_datetime = target_datetime.replace(tzinfo=dt_timezone.utc)
+                    # Periods starting after the target can't cover it; skip parsing their end
+                    if start_time > target_datetime:
+                        continue
 
-                    if start_time <= target_datetime <= end_time:
+                    end_time = _parse_iso(_avwx_field(fc, 'end_time', 'dt'))
+                    if target_datetime <= end_time:
                         applicable_period = fc
+                        period_start, period_end = start_time, end_time
                         break
-                except (ValueError, AttributeError):
+                except (ValueError, TypeError, AttributeError):
                     continue
 
             # If no exact match, use the last available period
@@ -2067,53 +2427,31 @@ class WeatherService:
                 return None
 
             # Parse wind from applicable period
-            wind_dir = applicable_period.get('wind_direction') or {}
-            wind_speed = applicable_period.get('wind_speed') or {}
-            wind_gust = applicable_period.get('wind_gust') or {}
-
-            wind = WindData(
-                direction=wind_dir.get('value'),
-                speed=wind_speed.get('value', 0) or 0,
-                gust=wind_gust.get('value') if wind_gust else None,
-                direction_repr=wind_dir.get('repr', 'VRB'),
-            )
+            wind = _avwx_wind(applicable_period)
 
             # Parse clouds
-            clouds = []
-            for cloud in applicable_period.get('clouds') or []:
-                clouds.append(CloudLayer(
-                    coverage=cloud.get('type', 'CLR'),
-                    altitude=cloud.get('altitude'),
-                ))
+            clouds = _avwx_clouds(applicable_period)
 
             # Parse visibility
-            vis = applicable_period.get('visibility') or {}
-            visibility = vis.get('value', 10) or 10
+            visibility = _avwx_field(applicable_period, 'visibility') or 10
 
             # Parse times
-            time_data = data.get('time') or {}
-            issue_time_str = time_data.get('dt', '')
             try:
-                issue_time = datetime.fromisoformat(issue_time_str.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
+                issue_time = _parse_iso(_avwx_field(data, 'time', 'dt'))
+            except (ValueError, TypeError, AttributeError):
                 issue_time = datetime.now()
 
-            start_time_data = applicable_period.get('start_time') or {}
-            end_time_data = applicable_period.get('end_time') or {}
-
-            try:
-                period_start = datetime.fromisoformat(
-                    start_time_data.get('dt', '').replace('Z', '+00:00')
-                )
-            except (ValueError, AttributeError):
-                period_start = datetime.now()
+            # The matched period's times were parsed above; only the fallback needs parsing
+            if period_start is None:
+                try:
+                    period_start = _parse_iso(_avwx_field(applicable_period, 'start_time', 'dt'))
+                except (ValueError, TypeError, AttributeError):
+                    period_start = datetime.now()
 
-            try:
-                period_end = datetime.fromisoformat(
-                    end_time_data.get('dt', '').replace('Z', '+00:00')
-                )
-            except (ValueError, AttributeError):
-                period_end = datetime.now()
+                try:
+                    period_end = _parse_iso(_avwx_field(applicable_period, 'end_time', 'dt'))
+                except (ValueError, TypeError, AttributeError):
+                    period_end = datetime.now()
 
             period = TafForecastPeriod(
                 start_time=period_start,
@@ -2146,104 +2484,149 @@ class WeatherService:
     def _get_nws_forecast(self, target_date: date) -> Optional[NwsForecastData]:
         """Get NWS 7-day forecast for a target date with DB cache."""
         lat, lon = self.nws_location
-        ttl = self.nws_cache_ttl
-
-        # 1. Check DB cache
-        db_data = self._get_from_db('nws', target_date, lat=lat, lon=lon, max_age_seconds=ttl)
-        if db_data:
-            logger.info(f"Cache hit: NWS {lat},{lon}")
-            return self._deserialize_nws_data(db_data)
+        return self._cached_fetch(
+            'nws', target_date, self.nws_cache_ttl,
+            refresh=lambda: self._refresh_nws(target_date),
+            deserialize=self._deserialize_nws_data,
+            label=f"NWS {lat},{lon} on {target_date}",
+            lat=lat,
+            lon=lon,
+        )
 
-        # 2. Fetch from API
+    def _refresh_nws(self, target_date: date) -> Optional[NwsForecastData]:
+        """Fetch the NWS forecast and store it in the DB."""
+        lat, lon = self.nws_location
         logger.info(f"API fetch: NWS {lat},{lon}")
-        try:
-            start_time = time.time()
-            data = self._fetch_nws_forecast(target_date)
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            if data:
-                self._save_to_db(
-                    'nws', target_date, self._serialize_nws_data(data),
-                    lat=lat, lon=lon, api_response_time_ms=response_time_ms
-                )
-            return data
-
-        except WeatherServiceError:
-            # 3. Fallback to stale DB data
-            stale_data = self._get_from_db('nws', target_date, lat=lat, lon=lon, max_age_seconds=None)
-            if stale_data:
-                logger.warning(f"Using stale DB data for NWS {lat},{lon} on {target_date}")
-                return self._deserialize_nws_data(stale_data)
-            raise
+        start_time = time.time()
+        data = self._fetch_nws_forecast(target_date)
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if data:
+            self._save_to_db(
+                'nws', target_date, self._serialize_nws_data(data),
+                lat=lat, lon=lon, api_response_time_ms=response_time_ms
+            )
+        return data
 
     def _fetch_nws_forecast(self, target_date: date) -> Optional[NwsForecastData]:
         """Fetch forecast from NWS API."""
-        lat, lon = self.nws_location
-        headers = {
-            'User-Agent': self.nws_user_agent,
-            'Accept': 'application/geo+json',
-        }
+        return self._parse_nws_response(self._fetch_nws_forecast_json(), target_date)
 
-        try:
-            with httpx.Client(timeout=10.0) as client:
-                # Step 1: Get the forecast URL from points endpoint
-                points_url = f"https://api.weather.gov/points/{lat},{lon}"
-                points_response = client.get(points_url, headers=headers)
-
-                if points_response.status_code != 200:
-                    logger.warning(f"NWS points API error: {points_response.status_code}")
-                    raise WeatherServiceError(f"NWS API error: {points_response.status_code}")
+    def fetch_nws_batch(self, target_dates: list[date]) -> list[tuple[date, NwsForecastData]]:
+        """
+        Fetch the NWS forecast ONCE and split it into per-day results.
 
-                points_data = points_response.json()
-                forecast_url = points_data.get('properties', {}).get('forecast')
+        The gridpoint forecast covers the whole week, so the poller no longer
+        requests the same document once per day. Each day is parsed exactly
+        as _fetch_nws_forecast would parse it.
+        """
+        forecast_data = self._fetch_nws_forecast_json()
+        results = []
+        for target_date in target_dates:
+            data = self._parse_nws_response(forecast_data, target_date)
+            if data:
+                results.append((target_date, data))
+        return results
 
-                if not forecast_url:
-                    raise WeatherServiceError("NWS forecast URL not found")
+    def _fetch_nws_forecast_json(self) -> dict:
+        """Fetch the raw NWS gridpoint forecast for the configured location."""
+        lat, lon = self.nws_location
+        headers = self._nws_headers
 
-                # Step 2: Get the forecast
-                forecast_response = client.get(forecast_url, headers=headers)
+        try:
+            client = self._get_http_client()
 
-                if forecast_response.status_code != 200:
-                    logger.warning(f"NWS forecast API error: {forecast_response.status_code}")
-                    raise WeatherServiceError(f"NWS forecast error: {forecast_response.status_code}")
+            # Step 1: Get the forecast URL from points endpoint (once per location)
+            forecast_url = self._get_nws_forecast_url(client, lat, lon, headers)
 
-                return self._parse_nws_response(forecast_response.json(), target_date)
+            # Step 2: Get the forecast
+            try:
+                forecast_data = self._get_nws_json(
+                    client, forecast_url, headers, "NWS forecast API error", "NWS forecast error"
+                )
+            except WeatherServiceError:
+                # A remembered URL that has gone bad (e.g. NWS redrew its grid)
+                # would otherwise fail for its whole TTL; resolve it afresh next time
+                self._forget_nws_forecast_url(lat, lon)
+                raise
+            return forecast_data
 
         except httpx.TimeoutException:
             raise WeatherServiceError("NWS API request timed out")
         except httpx.RequestError as e:
             raise WeatherServiceError(f"NWS API request failed: {e}")
 
+    def _get_nws_forecast_url(self, client: httpx.Client, lat: float, lon: float, headers: dict) -> str:
+        """
+        Resolve the NWS gridpoint forecast URL for a location.
+
+        The points lookup for a fixed location essentially never changes, so
+        the result is kept in memory and in the Django cache, letting new
+        processes skip the extra round trip after a restart or deploy.
+        """
+        forecast_url = self._nws_forecast_url_cache.get((lat, lon))
+        if forecast_url:
+            return forecast_url
+
+        cache_key = f'weather_nws_forecast_url_{lat}_{lon}'
+        forecast_url = cache.get(cache_key)
+        if not forecast_url:
+            points_url = f"https://api.weather.gov/points/{lat},{lon}"
+            points_data = self._get_nws_json(
+                client, points_url, headers, "NWS points API error", "NWS API error"
+            )
+            forecast_url = points_data.get('properties', {}).get('forecast')
+
+            if not forecast_url:
+                raise WeatherServiceError("NWS forecast URL not found")
+            cache.set(cache_key, forecast_url, _NWS_FORECAST_URL_TTL)
+
+        self._nws_forecast_url_cache[(lat, lon)] = forecast_url
+        return forecast_url
+
+    def _forget_nws_forecast_url(self, lat: float, lon: float) -> None:
+        """Drop the remembered forecast URL for a location from memory and the Django cache."""
+        self._nws_forecast_url_cache.pop((lat, lon), None)
+        cache.delete(f'weather_nws_forecast_url_{lat}_{lon}')
+
+    def _get_nws_json(self, client: httpx.Client, url: str, headers: dict, log_label: str, error_label: str) -> dict:
+        """
+        Stream an NWS GET request and decode the JSON body.
+
+        The status code is checked as soon as the headers arrive, so error
+        responses are rejected without downloading or decoding the (20-40KB)
+        body. Rate limits, 5xx and transport errors are retried with backoff.
+        """
+        def handle(response: httpx.Response) -> dict:
+            if response.status_code != 200:
+                logger.warning(f"{log_label}: {response.status_code}")
+                raise WeatherServiceError(f"{error_label}: {response.status_code}")
+
+            return _json_loads(response.read())
+
+        return self._stream_with_retry(client, url, headers, handle)
+
     def _parse_nws_wind(self, wind_speed_str: str, wind_direction_str: str) -> WindData:
         """Parse NWS wind text into WindData."""
         # Parse wind speed: "5 to 10 mph" or "10 mph"
         speed = 0
         gust = None
 
-        # Extract numbers from wind speed string
-        numbers = re.findall(r'\d+', wind_speed_str)
+        # Sustained speed comes only from the text before any gust clause,
+        # so "10 mph with gusts to 25 mph" is 10 mph sustained, not 25
+        gust_match = _NWS_GUST_RE.search(wind_speed_str)
+        sustained_str = wind_speed_str if gust_match is None else wind_speed_str[:gust_match.start()]
+
+        # Extract numbers from wind speed string; for a range use the higher value
+        numbers = _NWS_NUMBER_RE.findall(sustained_str)
         if numbers:
-            # Convert mph to knots (1 mph = 0.869 knots)
-            if len(numbers) >= 2:
-                # Range: use higher value
-                speed = round(int(numbers[-1]) * 0.869)
-            else:
-                speed = round(int(numbers[0]) * 0.869)
-
-            # Check for gusts
-            if 'gust' in wind_speed_str.lower():
-                gust_match = re.search(r'gust[s]?\s+(?:to\s+)?(\d+)', wind_speed_str.lower())
-                if gust_match:
-                    gust = round(int(gust_match.group(1)) * 0.869)
-
-        # Parse direction
-        direction_map = {
-            'N': 0, 'NNE': 22, 'NE': 45, 'ENE': 67,
-            'E': 90, 'ESE': 112, 'SE': 135, 'SSE': 157,
-            'S': 180, 'SSW': 202, 'SW': 225, 'WSW': 247,
-            'W': 270, 'WNW': 292, 'NW': 315, 'NNW': 337,
-        }
-        direction = direction_map.get(wind_direction_str.upper())
+            speed = round(int(numbers[-1]) * _MPH_TO_KT)
+
+        # Check for gusts
+        if gust_match is not None and gust_match.group(1):
+            gust = round(int(gust_match.group(1)) * _MPH_TO_KT)
+
+        direction = _NWS_DIRECTION_DEGREES.get(wind_direction_str.upper())
 
         return WindData(
             direction=direction,
@@ -2266,44 +2649,53 @@ class WeatherService:
             temp_high = None
             temp_low = None
             precip_prob = None
+            target_str = target_date.isoformat()
 
             for period in periods:
                 start_time_str = period.get('startTime', '')
+                # startTime is local ISO time, so its date prefix is the period's
+                # date; only parse the periods that can match
+                if start_time_str[:10] != target_str:
+                    continue
                 try:
                     start_time = datetime.fromisoformat(start_time_str)
-                    if start_time.date() == target_date:
-                        nws_period = NwsForecastPeriod(
-                            name=period.get('name', ''),
-                            start_time=start_time,
-                            end_time=datetime.fromisoformat(period.get('endTime', start_time_str)),
-                            temperature=period.get('temperature', 0),
-                            temperature_unit=period.get('temperatureUnit', 'F'),
-                            is_daytime=period.get('isDaytime', True),
-                            wind_speed=period.get('windSpeed', ''),
-                            wind_direction=period.get('windDirection', ''),
-                            short_forecast=period.get('shortForecast', ''),
-                            detailed_forecast=period.get('detailedForecast', ''),
-                            precipitation_probability=period.get('probabilityOfPrecipitation', {}).get('value'),
-                        )
-                        applicable_periods.append(nws_period)
-
-                        # Track high/low temps
-                        temp = period.get('temperature')
-                        if temp is not None:
-                            if period.get('isDaytime', True):
-                                temp_high = temp
-                            else:
-                                temp_low = temp
-
-                        # Track precipitation probability
-                        prob = period.get('probabilityOfPrecipitation', {}).get('value')
-                        if prob is not None:
-                            if precip_prob is None or prob > precip_prob:
-                                precip_prob = prob
-
+                    if start_time.date() != target_date:
+                        continue
+                    end_time = datetime.fromisoformat(period.get('endTime', start_time_str))
                 except (ValueError, AttributeError):
                     continue
 
+                # Read each field once and reuse it for the period and the day's summary
+                temp = period.get('temperature')
+                is_daytime = period.get('isDaytime', True)
+                pop = period.get('probabilityOfPrecipitation')
+                prob = pop.get('value') if pop else None
+
+                applicable_periods.append(NwsForecastPeriod(
+                    name=period.get('name', ''),
+                    start_time=start_time,
+                    end_time=end_time,
+                    temperature=temp if 'temperature' in period else 0,
+                    temperature_unit=period.get('temperatureUnit', 'F'),
+                    is_daytime=is_daytime,
+                    wind_speed=period.get('windSpeed', ''),
+                    wind_direction=period.get('windDirection', ''),
+                    short_forecast=period.get('shortForecast', ''),
+                    detailed_forecast=period.get('detailedForecast', ''),
+                    precipitation_probability=prob,
+                ))
+
+                # Track high/low temps
+                if temp is not None:
+                    if is_daytime:
+                        temp_high = temp
+                    else:
+                        temp_low = temp
+
+                # Track the day's highest precipitation probability
+                if prob is not None and (precip_prob is None or prob > precip_prob):
+                    precip_prob = prob
+
             if not applicable_periods:
                 # If no exact match, use first available period
                 period = periods[0]
@@ -2346,55 +2738,48 @@ class WeatherService:
     def _get_extended_forecast(self, target_date: date) -> Optional[ExtendedForecastData]:
         """Get extended forecast for a target date with DB cache (uses Visual Crossing)."""
         lat, lon = self.nws_location
-        ttl = self.extended_cache_ttl
-
-        # 1. Check DB cache
-        db_data = self._get_from_db('extended', target_date, lat=lat, lon=lon, max_age_seconds=ttl)
-        if db_data:
-            data = self._deserialize_extended_data(db_data)
-            return data
+        return self._cached_fetch(
+            'extended', target_date, self.extended_cache_ttl,
+            refresh=lambda: self._refresh_extended(target_date),
+            deserialize=self._deserialize_extended_data,
+            label=f"daily {lat},{lon} on {target_date}",
+            lat=lat,
+            lon=lon,
+        )
 
-        # 2. Fetch from Visual Crossing API
+    def _refresh_extended(self, target_date: date) -> Optional[ExtendedForecastData]:
+        """Fetch the daily forecast from Visual Crossing and store it in the DB."""
+        lat, lon = self.nws_location
         logger.info(f"API fetch: Visual Crossing daily {lat},{lon}")
-        try:
-            start_time = time.time()
-            data = self._fetch_visualcrossing_daily(target_date)
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            if data:
-                self._save_to_db(
-                    'extended', target_date, self._serialize_extended_data(data),
-                    lat=lat, lon=lon, api_response_time_ms=response_time_ms
-                )
-            return data
+        start_time = time.time()
+        data = self._fetch_visualcrossing_daily(target_date)
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if data:
+            self._save_to_db(
+                'extended', target_date, self._serialize_extended_data(data),
+                lat=lat, lon=lon, api_response_time_ms=response_time_ms
+            )
+        return data
 
-        except WeatherServiceError:
-            # 3. Fallback to stale DB data
-            stale_data = self._get_from_db('extended', target_date, lat=lat, lon=lon, max_age_seconds=None)
-            if stale_data:
-                logger.warning(f"Using stale DB data for daily {lat},{lon} on {target_date}")
-                return self._deserialize_extended_data(stale_data)
-            raise
+    def _visualcrossing_url(self, start: Optional[date] = None, end: Optional[date] = None) -> str:
+        """Build the Visual Crossing timeline URL for our location, optionally for start..end (inclusive)."""
+        lat, lon = self.nws_location
+        url = f"{self.VISUALCROSSING_TIMELINE_URL}/{lat},{lon}"
+        if start is None:
+            return url
+        start_str = start.isoformat()
+        end_str = start_str if end is None or end == start else end.isoformat()
+        return f"{url}/{start_str}/{end_str}"
 
     def _fetch_visualcrossing_daily(self, target_date: date) -> Optional[ExtendedForecastData]:
         """Fetch daily forecast from Visual Crossing API for a single date."""
         if not self.visualcrossing_api_key:
             raise WeatherServiceError("Visual Crossing API key not configured")
 
-        lat, lon = self.nws_location
-        location = f"{lat},{lon}"
-        date_str = target_date.isoformat()
-
-        url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{location}/{date_str}/{date_str}"
-
-        params = {
-            'key': self.visualcrossing_api_key,
-            'unitGroup': 'metric',
-            'include': 'days',
-            'contentType': 'json',
-        }
+        url = self._visualcrossing_url(target_date)
 
-        response = self._make_request_with_retry(url, params=params)
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['days'])
 
         if response.status_code == 401:
             raise WeatherServiceError("Invalid Visual Crossing API key")
@@ -2402,7 +2787,7 @@ class WeatherService:
             logger.warning(f"Visual Crossing API error: {response.status_code}")
             raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
 
-        return self._parse_visualcrossing_daily_response(response.json(), target_date)
+        return self._parse_visualcrossing_daily_response(_json_loads(response.content), target_date)
 
     def _parse_visualcrossing_daily_response(self, data: dict, target_date: date) -> Optional[ExtendedForecastData]:
         """Parse Visual Crossing daily API response for a single date."""
@@ -2422,23 +2807,24 @@ class WeatherService:
             conditions = day_data.get('conditions')
 
             # Convert km/h to knots
-            wind_speed_kt = round(wind_speed_kmh * 0.54)
-            wind_gust_kt = round(wind_gust_kmh * 0.54) if wind_gust_kmh else None
+            wind_speed_kt = _round_half_up(wind_speed_kmh * 0.54)
+            wind_gust_kt = _round_half_up(wind_gust_kmh * 0.54) if wind_gust_kmh else None
 
+            direction = _round_half_up(wind_dir) if wind_dir is not None else None
             wind = WindData(
-                direction=round(wind_dir) if wind_dir is not None else None,
+                direction=direction,
                 speed=wind_speed_kt,
                 gust=wind_gust_kt,
-                direction_repr=str(round(wind_dir)) if wind_dir is not None else 'VRB',
+                direction_repr=str(direction) if direction is not None else 'VRB',
             )
 
             return ExtendedForecastData(
                 location=self.nws_location,
                 target_date=target_date,
                 wind=wind,
-                temperature_high=round(temp_max) if temp_max is not None else None,
-                temperature_low=round(temp_min) if temp_min is not None else None,
-                precipitation_probability=round(precip_prob) if precip_prob is not None else None,
+                temperature_high=_round_half_up(temp_max) if temp_max is not None else None,
+                temperature_low=_round_half_up(temp_min) if temp_min is not None else None,
+                precipitation_probability=_round_half_up(precip_prob) if precip_prob is not None else None,
                 conditions=conditions,
                 cached_at=timezone.now(),
                 source=WeatherSource.EXTENDED,
@@ -2455,23 +2841,22 @@ class WeatherService:
             dates = daily.get('time', [])
 
             # Find index for target date
-            target_str = target_date.isoformat()
-            if target_str not in dates:
+            try:
+                idx = dates.index(target_date.isoformat())
+            except ValueError:
                 return None
 
-            idx = dates.index(target_str)
-
-            # Get values for target date
-            temp_max = daily.get('temperature_2m_max', [])[idx]
-            temp_min = daily.get('temperature_2m_min', [])[idx]
-            precip_prob = daily.get('precipitation_probability_max', [])[idx]
-            wind_speed_kmh = daily.get('wind_speed_10m_max', [])[idx] or 0
-            wind_gust_kmh = daily.get('wind_gusts_10m_max', [])[idx]
-            wind_dir = daily.get('wind_direction_10m_dominant', [])[idx]
+            # Get values for target date (a missing column raises KeyError below)
+            temp_max = daily['temperature_2m_max'][idx]
+            temp_min = daily['temperature_2m_min'][idx]
+            precip_prob = daily['precipitation_probability_max'][idx]
+            wind_speed_kmh = daily['wind_speed_10m_max'][idx] or 0
+            wind_gust_kmh = daily['wind_gusts_10m_max'][idx]
+            wind_dir = daily['wind_direction_10m_dominant'][idx]
 
             # Convert km/h to knots (1 km/h = 0.54 knots)
-            wind_speed_kt = round(wind_speed_kmh * 0.54)
-            wind_gust_kt = round(wind_gust_kmh * 0.54) if wind_gust_kmh else None
+            wind_speed_kt = _round_half_up(wind_speed_kmh * 0.54)
+            wind_gust_kt = _round_half_up(wind_gust_kmh * 0.54) if wind_gust_kmh else None
 
             wind = WindData(
                 direction=wind_dir,
@@ -2484,8 +2869,8 @@ class WeatherService:
                 location=self.nws_location,
                 target_date=target_date,
                 wind=wind,
-                temperature_high=round(temp_max) if temp_max is not None else None,
-                temperature_low=round(temp_min) if temp_min is not None else None,
+                temperature_high=_round_half_up(temp_max) if temp_max is not None else None,
+                temperature_low=_round_half_up(temp_min) if temp_min is not None else None,
                 precipitation_probability=precip_prob,
                 cached_at=timezone.now(),
                 source=WeatherSource.EXTENDED,
@@ -2498,55 +2883,95 @@ class WeatherService:
     def get_hourly_forecast(self, target_date: date) -> Optional['HourlyForecastData']:
         """Get hourly forecast data for a target date (0-14 days out) with DB cache."""
         lat, lon = self.nws_location
-        ttl = self.extended_cache_ttl
+        return self._cached_fetch(
+            'hourly', target_date, self.extended_cache_ttl,
+            refresh=lambda: self._refresh_hourly(target_date),
+            deserialize=self._deserialize_hourly_data,
+            label=f"hourly {lat},{lon} on {target_date}",
+            lat=lat,
+            lon=lon,
+        )
 
-        # 1. Check DB cache
-        db_data = self._get_from_db('hourly', target_date, lat=lat, lon=lon, max_age_seconds=ttl)
-        if db_data:
-            data = self._deserialize_hourly_data(db_data)
-            return data
+    def get_hourly_forecast_range(self, start: date, end: date) -> dict[date, 'HourlyForecastData']:
+        """
+        Get hourly forecasts for every day from start to end (inclusive).
+
+        Fresh days come from one DB query; any missing days are fetched with a
+        single Visual Crossing range request instead of one request per day.
+        Days that cannot be fetched fall back to stale DB data or are omitted.
+        """
+        from apps.hamsalert.models import WeatherRecord
+
+        lat, lon = self.nws_location
+        records = WeatherRecord.objects.filter(
+            weather_type='hourly',
+            target_date__range=(start, end),
+            **self._location_filter(lat, lon),
+        ).order_by('fetched_at')
+        cutoff = timezone.now() - timedelta(seconds=self.extended_cache_ttl)
+
+        fresh = {}
+        stale = {}
+        # Ascending fetched_at, so the newest record for a day wins
+        for target_date, fetched_at, data in records.values_list('target_date', 'fetched_at', 'data'):
+            if fetched_at >= cutoff:
+                fresh[target_date] = data
+            else:
+                stale[target_date] = data
+
+        results = {d: self._deserialize_hourly_data(data) for d, data in fresh.items()}
+        days = (start + timedelta(days=i) for i in range((end - start).days + 1))
+        missing = [d for d in days if d not in results]
+        if not missing:
+            return results
 
-        # 2. Fetch from Visual Crossing API
-        logger.info(f"API fetch: Visual Crossing hourly {lat},{lon}")
         try:
             start_time = time.time()
-            data = self._fetch_visualcrossing_hourly(target_date)
+            fetched = self.fetch_visualcrossing_hourly_range(missing[0], missing[-1])
             response_time_ms = int((time.time() - start_time) * 1000)
+        except WeatherServiceError as e:
+            logger.warning(f"Hourly range fetch failed for {missing[0]}..{missing[-1]}: {e}")
+            fetched = []
+            response_time_ms = None
 
-            if data:
+        for target_date, data in fetched:
+            if target_date in missing:
                 self._save_to_db(
                     'hourly', target_date, self._serialize_hourly_data(data),
                     lat=lat, lon=lon, api_response_time_ms=response_time_ms
                 )
-            return data
+                results[target_date] = data
 
-        except WeatherServiceError:
-            # 3. Fallback to stale DB data
-            stale_data = self._get_from_db('hourly', target_date, lat=lat, lon=lon, max_age_seconds=None)
-            if stale_data:
+        for target_date in missing:
+            if target_date not in results and target_date in stale:
                 logger.warning(f"Using stale DB data for hourly {lat},{lon} on {target_date}")
-                return self._deserialize_hourly_data(stale_data)
-            raise
+                results[target_date] = self._deserialize_hourly_data(stale[target_date])
+
+        return results
+
+    def _refresh_hourly(self, target_date: date) -> Optional['HourlyForecastData']:
+        """Fetch hourly forecast from Visual Crossing and store it in the DB."""
+        lat, lon = self.nws_location
+        logger.info(f"API fetch: Visual Crossing hourly {lat},{lon}")
+        start_time = time.time()
+        data = self._fetch_visualcrossing_hourly(target_date)
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if data:
+            self._save_to_db(
+                'hourly', target_date, self._serialize_hourly_data(data),
+                lat=lat, lon=lon, api_response_time_ms=response_time_ms
+            )
+        return data
 
     def _fetch_visualcrossing_hourly(self, target_date: date) -> Optional['HourlyForecastData']:
         """Fetch hourly forecast from Visual Crossing API for a single date."""
         if not self.visualcrossing_api_key:
             raise WeatherServiceError("Visual Crossing API key not configured")
 
-        lat, lon = self.nws_location
-        location = f"{lat},{lon}"
-        date_str = target_date.isoformat()
-
-        url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{location}/{date_str}/{date_str}"
-
-        params = {
-            'key': self.visualcrossing_api_key,
-            'unitGroup': 'metric',
-            'include': 'hours',
-            'contentType': 'json',
-        }
+        url = self._visualcrossing_url(target_date)
 
-        response = self._make_request_with_retry(url, params=params)
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['hours'])
 
         if response.status_code == 401:
             raise WeatherServiceError("Invalid Visual Crossing API key")
@@ -2554,7 +2979,7 @@ class WeatherService:
             logger.warning(f"Visual Crossing hourly API error: {response.status_code}")
             raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
 
-        return self._parse_visualcrossing_hourly_response(response.json(), target_date)
+        return self._parse_visualcrossing_hourly_response(_json_loads(response.content), target_date)
 
     def _parse_visualcrossing_hourly_response(self, data: dict, target_date: date) -> Optional['HourlyForecastData']:
         """Parse Visual Crossing hourly API response for a single date."""
@@ -2563,39 +2988,10 @@ class WeatherService:
             if not days:
                 return None
 
-            day_data = days[0]
-            hours_data = day_data.get('hours', [])
-            hours = []
-
-            for hour_data in hours_data:
-                time_str = hour_data.get('datetime', '')  # Format: "HH:MM:SS"
-                try:
-                    hour_time = datetime.combine(
-                        target_date,
-                        datetime.strptime(time_str, "%H:%M:%S").time(),
-                        tzinfo=self.local_timezone,
-                    )
-                except ValueError:
-                    continue
-
-                # Map Visual Crossing conditions to WMO weather codes
-                conditions = hour_data.get('conditions', '')
-                weather_code = self._conditions_to_wmo_code(conditions)
-
-                hours.append(HourlyForecastEntry(
-                    time=hour_time,
-                    temperature_c=hour_data.get('temp'),
-                    wind_speed_kmh=hour_data.get('windspeed'),
-                    wind_direction=round(hour_data.get('winddir')) if hour_data.get('winddir') is not None else None,
-                    wind_gusts_kmh=hour_data.get('windgust'),
-                    precipitation_probability=round(hour_data.get('precipprob')) if hour_data.get('precipprob') is not None else None,
-                    weather_code=weather_code,
-                ))
-
             return HourlyForecastData(
                 location=self.nws_location,
                 target_date=target_date,
-                hours=hours,
+                hours=self._parse_visualcrossing_hours(target_date, days[0].get('hours', [])),
                 cached_at=timezone.now(),
             )
 
@@ -2606,72 +3002,210 @@ class WeatherService:
     def _get_historical_weather(self, target_date: date) -> Optional[HistoricalWeatherData]:
         """Get historical weather data for a past date with DB cache (uses Visual Crossing)."""
         lat, lon = self.nws_location
-        ttl = self.historical_cache_ttl
+        return self._cached_fetch(
+            'historical', target_date, self.historical_cache_ttl,
+            refresh=lambda: self._refresh_historical(target_date),
+            deserialize=self._deserialize_historical_data,
+            label=f"historical {lat},{lon} on {target_date}",
+            lat=lat,
+            lon=lon,
+        )
+
+    def _refresh_historical(self, target_date: date) -> Optional[HistoricalWeatherData]:
+        """Fetch historical weather from Visual Crossing and store it in the DB."""
+        lat, lon = self.nws_location
+        logger.info(f"API fetch: Visual Crossing historical {lat},{lon}")
+        start_time = time.time()
+        data = self.fetch_visualcrossing_historical(target_date)
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if data:
+            self._save_to_db(
+                'historical', target_date, self._serialize_historical_data(data),
+                lat=lat, lon=lon, api_response_time_ms=response_time_ms
+            )
+        return data
+
+    def _cached_fetch(
+        self,
+        weather_type: str,
+        target_date: date,
+        ttl: int,
+        refresh: Callable[[], Any],
+        deserialize: Callable[[dict], Any],
+        label: str,
+        station: Optional[str] = None,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+    ) -> Any:
+        """
+        Serve one weather type for a date from the DB cache, refreshing from the API as needed.
+
+        1. Fresh DB data is returned as-is.
+        2. Data less than stale_while_revalidate past its TTL is returned while
+           a background refresh runs.
+        3. Otherwise the API is called; concurrent misses share one request.
+        4. If that fails, stale DB data of any age is returned before giving up.
+
+        Station-keyed types (METAR, TAF) pass station; the rest pass lat/lon.
+        """
+        if station:
+            location = {'station': station}
+            key = (weather_type, station, target_date)
+        else:
+            location = {'lat': lat, 'lon': lon}
+            key = (weather_type, lat, lon, target_date)
+
+        # One read of the newest row serves every step; they differ only in
+        # how old that row may be
+        newest = self._get_newest_from_db(weather_type, target_date, **location)
+        db_data, age = None, None
+        if newest:
+            db_data, fetched_at = newest
+            age = (timezone.now() - fetched_at).total_seconds()
 
-        # 1. Check DB cache
-        db_data = self._get_from_db('historical', target_date, lat=lat, lon=lon, max_age_seconds=ttl)
         if db_data:
-            data = self._deserialize_historical_data(db_data)
-            return data
+            # 1. Check DB cache
+            if age <= ttl:
+                logger.debug(f"Cache hit: {label}")
+                return deserialize(db_data)
 
-        # 2. Fetch from Visual Crossing API
-        logger.info(f"API fetch: Visual Crossing historical {lat},{lon}")
-        try:
-            start_time = time.time()
-            data = self.fetch_visualcrossing_historical(target_date)
-            response_time_ms = int((time.time() - start_time) * 1000)
+            # 2. Serve recently expired data and refresh it in the background
+            if age <= ttl + self.stale_while_revalidate:
+                self._refresh_in_background(key, refresh)
+                return deserialize(db_data)
 
-            if data:
-                self._save_to_db(
-                    'historical', target_date, self._serialize_historical_data(data),
-                    lat=lat, lon=lon, api_response_time_ms=response_time_ms
-                )
-            return data
+        # 3. Fetch from API (concurrent misses share one request)
+        try:
+            return self._singleflight(key, refresh)
 
         except WeatherServiceError:
-            # 3. Fallback to stale DB data
-            stale_data = self._get_from_db('historical', target_date, lat=lat, lon=lon, max_age_seconds=None)
-            if stale_data:
-                logger.warning(f"Using stale DB data for historical {lat},{lon} on {target_date}")
-                return self._deserialize_historical_data(stale_data)
+            # 4. Fallback to stale DB data
+            if db_data:
+                logger.warning(f"Using stale DB data for {label}")
+                return deserialize(db_data)
             raise
 
-    def clear_cache(self, station: Optional[str] = None, target_date: Optional[date] = None) -> None:
-        """Clear cached weather data (DB records only)."""
-        from apps.hamsalert.models import WeatherRecord
+    def _singleflight(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() for key, or wait for a call already running for key and share its outcome.
 
-        station = (station or self.default_station).upper()
-        local_today = datetime.now(self.local_timezone).date()
+        Keeps simultaneous cache misses in this process from sending identical
+        upstream requests. Waiters get the leader's result or re-raise its error;
+        the wait is bounded by the leader's HTTP timeouts.
+        """
+        with _inflight_lock:
+            call = _inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _inflight[key] = _InflightCall()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
 
-        if target_date is None:
-            target_date = local_today
+        try:
+            call.result = fetch()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+            call.done.set()
 
-        days_out = (target_date - local_today).days
+    def _refresh_in_background(self, key: tuple, refresh: Callable[[], Any]) -> None:
+        """
+        Run refresh() on a daemon thread unless one is already running for key.
 
-        # Clear appropriate DB records based on date
-        if days_out == 0:
-            WeatherRecord.objects.filter(
-                weather_type='metar', target_date=target_date, station=station
-            ).delete()
-        elif days_out == 1:
-            WeatherRecord.objects.filter(
-                weather_type='taf', target_date=target_date, station=station
-            ).delete()
-        elif days_out <= 7:
-            WeatherRecord.objects.filter(
-                weather_type='nws', target_date=target_date
-            ).delete()
-        elif days_out <= 14:
-            WeatherRecord.objects.filter(
-                weather_type='extended', target_date=target_date
-            ).delete()
-            WeatherRecord.objects.filter(
-                weather_type='hourly', target_date=target_date
-            ).delete()
+        Used for stale-while-revalidate: the caller has already been handed
+        stale data and should not wait on the upstream API.
+        """
+        with _refreshing_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        # Other worker processes serving the same stale record skip the
+        # refresh while this one holds the shared lock
+        lock_key = _refresh_lock_key(key)
+        if not cache.add(lock_key, 1, _REFRESH_LOCK_TTL):
+            with _refreshing_lock:
+                _refreshing.discard(key)
+            return
+
+        def run():
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key}: {e}")
+            finally:
+                cache.delete(lock_key)
+                with _refreshing_lock:
+                    _refreshing.discard(key)
+                connection.close()
+
+        threading.Thread(target=run, name=f"WeatherRefresh-{key[0]}", daemon=True).start()
+
+    def clear_cache(
+        self,
+        station: Optional[str | Iterable[str]] = None,
+        target_date: Optional[date | Iterable[date]] = None,
+    ) -> None:
+        """
+        Clear cached weather data (DB records only).
+
+        Accepts a single station/date or iterables of them; every matching
+        record across the cartesian product is removed in one DELETE.
+        """
+        from apps.hamsalert.models import WeatherRecord
+
+        if target_date is None or isinstance(target_date, date):
+            target_date = [target_date]
+        local_today = self._local_today()
+        target_dates = {d or local_today for d in target_date}
+
+        # Bucket dates by the record types that own them so each bucket is one clause
+        dates_by_types: dict[tuple[str, ...], list[date]] = {}
+        today_ordinal = local_today.toordinal()
+        for d in target_dates:
+            days_out = d.toordinal() - today_ordinal
+            if days_out < 0:
+                # Past dates have always been swept along with the NWS records
+                types = ('nws',)
+            elif days_out < len(self._CLEAR_TYPES_BY_DAYS_OUT):
+                types = self._CLEAR_TYPES_BY_DAYS_OUT[days_out]
+            else:
+                continue
+            dates_by_types.setdefault(types, []).append(d)
+        if not dates_by_types:
+            # Every date is beyond the forecast range; nothing is stored for it
+            return
+
+        if station is None or isinstance(station, str):
+            station = [station]
+        stations = sorted({(s or self.default_station).upper() for s in station})
+
+        query = Q()
+        for types, dates in dates_by_types.items():
+            if types[0] in self._STATION_TYPES:
+                query |= Q(weather_type__in=types, station__in=stations, target_date__in=dates)
+            else:
+                query |= Q(weather_type__in=types, target_date__in=dates)
+
+        WeatherRecord.objects.filter(query).delete()
+        _l1_invalidate()
+
+    def _local_today(self) -> date:
+        """Today's date in the configured local timezone."""
+        return datetime.now(self.local_timezone).date()
 
     def is_configured(self) -> bool:
         """Check if the weather service is properly configured."""
-        return bool(self.api_token)
+        return self._configured
 
     # -------------------------------------------------------------------------
     # Visual Crossing batch fetch methods for background poller
@@ -2686,20 +3220,10 @@ class WeatherService:
         if not self.visualcrossing_api_key:
             raise WeatherServiceError("Visual Crossing API key not configured")
 
-        lat, lon = self.nws_location
-        location = f"{lat},{lon}"
-
         # Visual Crossing gives us 15 days of forecast
-        url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{location}"
-
-        params = {
-            'key': self.visualcrossing_api_key,
-            'unitGroup': 'metric',  # Celsius, km/h
-            'include': 'days',
-            'contentType': 'json',
-        }
+        url = self._visualcrossing_url()
 
-        response = self._make_request_with_retry(url, params=params)
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['days'])
 
         if response.status_code == 401:
             raise WeatherServiceError("Invalid Visual Crossing API key")
@@ -2707,11 +3231,12 @@ class WeatherService:
             logger.warning(f"Visual Crossing API error: {response.status_code}")
             raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
 
-        return self._parse_visualcrossing_batch_response(response.json())
+        return self._parse_visualcrossing_batch_response(_json_loads(response.content))
 
     def _parse_visualcrossing_batch_response(self, data: dict) -> list[tuple[date, ExtendedForecastData]]:
         """Parse Visual Crossing API response and return all days."""
         results = []
+        fetched_at = timezone.now()
         try:
             days = data.get('days', [])
 
@@ -2730,25 +3255,26 @@ class WeatherService:
                 conditions = day_data.get('conditions')
 
                 # Convert km/h to knots (1 km/h = 0.54 knots)
-                wind_speed_kt = round(wind_speed_kmh * 0.54)
-                wind_gust_kt = round(wind_gust_kmh * 0.54) if wind_gust_kmh else None
+                wind_speed_kt = _round_half_up(wind_speed_kmh * 0.54)
+                wind_gust_kt = _round_half_up(wind_gust_kmh * 0.54) if wind_gust_kmh else None
 
+                direction = _round_half_up(wind_dir) if wind_dir is not None else None
                 wind = WindData(
-                    direction=round(wind_dir) if wind_dir is not None else None,
+                    direction=direction,
                     speed=wind_speed_kt,
                     gust=wind_gust_kt,
-                    direction_repr=str(round(wind_dir)) if wind_dir is not None else 'VRB',
+                    direction_repr=str(direction) if direction is not None else 'VRB',
                 )
 
                 forecast = ExtendedForecastData(
                     location=self.nws_location,
                     target_date=target_date,
                     wind=wind,
-                    temperature_high=round(temp_max) if temp_max is not None else None,
-                    temperature_low=round(temp_min) if temp_min is not None else None,
-                    precipitation_probability=round(precip_prob) if precip_prob is not None else None,
+                    temperature_high=_round_half_up(temp_max) if temp_max is not None else None,
+                    temperature_low=_round_half_up(temp_min) if temp_min is not None else None,
+                    precipitation_probability=_round_half_up(precip_prob) if precip_prob is not None else None,
                     conditions=conditions,
-                    cached_at=timezone.now(),
+                    cached_at=fetched_at,
                     source=WeatherSource.EXTENDED,  # Keep same source for DB compatibility
                 )
                 results.append((target_date, forecast))
@@ -2767,19 +3293,29 @@ class WeatherService:
         if not self.visualcrossing_api_key:
             raise WeatherServiceError("Visual Crossing API key not configured")
 
-        lat, lon = self.nws_location
-        location = f"{lat},{lon}"
+        url = self._visualcrossing_url()
 
-        url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{location}"
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['hours'])
 
-        params = {
-            'key': self.visualcrossing_api_key,
-            'unitGroup': 'metric',  # Celsius, km/h
-            'include': 'hours',
-            'contentType': 'json',
-        }
+        if response.status_code == 401:
+            raise WeatherServiceError("Invalid Visual Crossing API key")
+        elif response.status_code != 200:
+            logger.warning(f"Visual Crossing hourly API error: {response.status_code}")
+            raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
+
+        return self._parse_visualcrossing_hourly_batch_response(_json_loads(response.content))
+
+    def fetch_visualcrossing_hourly_range(self, start: date, end: date) -> list[tuple[date, 'HourlyForecastData']]:
+        """
+        Fetch hourly forecast from Visual Crossing for start..end (inclusive) in ONE API call.
+        Returns list of (target_date, data) tuples for each day.
+        """
+        if not self.visualcrossing_api_key:
+            raise WeatherServiceError("Visual Crossing API key not configured")
 
-        response = self._make_request_with_retry(url, params=params)
+        url = self._visualcrossing_url(start, end)
+
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['hours'])
 
         if response.status_code == 401:
             raise WeatherServiceError("Invalid Visual Crossing API key")
@@ -2787,11 +3323,12 @@ class WeatherService:
             logger.warning(f"Visual Crossing hourly API error: {response.status_code}")
             raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
 
-        return self._parse_visualcrossing_hourly_batch_response(response.json())
+        return self._parse_visualcrossing_hourly_batch_response(_json_loads(response.content))
 
     def _parse_visualcrossing_hourly_batch_response(self, data: dict) -> list[tuple[date, 'HourlyForecastData']]:
         """Parse Visual Crossing hourly API response and return all days."""
         results = []
+        fetched_at = timezone.now()
         try:
             days = data.get('days', [])
 
@@ -2801,39 +3338,11 @@ class WeatherService:
                 except ValueError:
                     continue
 
-                hours_data = day_data.get('hours', [])
-                hours = []
-
-                for hour_data in hours_data:
-                    time_str = hour_data.get('datetime', '')  # Format: "HH:MM:SS"
-                    try:
-                        hour_time = datetime.combine(
-                            target_date,
-                            datetime.strptime(time_str, "%H:%M:%S").time(),
-                            tzinfo=self.local_timezone,
-                        )
-                    except ValueError:
-                        continue
-
-                    # Map Visual Crossing conditions to WMO weather codes (approximate)
-                    conditions = hour_data.get('conditions', '')
-                    weather_code = self._conditions_to_wmo_code(conditions)
-
-                    hours.append(HourlyForecastEntry(
-                        time=hour_time,
-                        temperature_c=hour_data.get('temp'),
-                        wind_speed_kmh=hour_data.get('windspeed'),
-                        wind_direction=round(hour_data.get('winddir')) if hour_data.get('winddir') is not None else None,
-                        wind_gusts_kmh=hour_data.get('windgust'),
-                        precipitation_probability=round(hour_data.get('precipprob')) if hour_data.get('precipprob') is not None else None,
-                        weather_code=weather_code,
-                    ))
-
                 forecast = HourlyForecastData(
                     location=self.nws_location,
                     target_date=target_date,
-                    hours=hours,
-                    cached_at=timezone.now(),
+                    hours=self._parse_visualcrossing_hours(target_date, day_data.get('hours', [])),
+                    cached_at=fetched_at,
                 )
                 results.append((target_date, forecast))
 
@@ -2843,6 +3352,37 @@ class WeatherService:
 
         return results
 
+    def _parse_visualcrossing_hours(self, target_date: date, hours_data: list) -> list[HourlyForecastEntry]:
+        """Convert one day's Visual Crossing hour records into HourlyForecastEntry rows."""
+        combine = datetime.combine
+        parse_time = dt_time.fromisoformat
+        tz = self.local_timezone
+        to_wmo_code = self._conditions_to_wmo_code
+        hours = []
+
+        for hour_data in hours_data:
+            time_str = hour_data.get('datetime', '')  # Format: "HH:MM:SS"
+            try:
+                hour_time = combine(target_date, parse_time(time_str), tzinfo=tz)
+            except ValueError:
+                continue
+
+            wind_dir = hour_data.get('winddir')
+            precip_prob = hour_data.get('precipprob')
+
+            hours.append(HourlyForecastEntry(
+                time=hour_time,
+                temperature_c=hour_data.get('temp'),
+                wind_speed_kmh=hour_data.get('windspeed'),
+                wind_direction=_round_half_up(wind_dir) if wind_dir is not None else None,
+                wind_gusts_kmh=hour_data.get('windgust'),
+                precipitation_probability=_round_half_up(precip_prob) if precip_prob is not None else None,
+                # Map Visual Crossing conditions to WMO weather codes (approximate)
+                weather_code=to_wmo_code(hour_data.get('conditions', '')),
+            ))
+
+        return hours
+
     def _conditions_to_wmo_code(self, conditions: str) -> Optional[int]:
         """Map Visual Crossing conditions string to WMO weather code."""
         if not conditions:
@@ -2878,23 +3418,45 @@ class WeatherService:
 
     def fetch_visualcrossing_historical(self, target_date: date) -> Optional[HistoricalWeatherData]:
         """Fetch historical weather from Visual Crossing for a specific date."""
+        # Only completed past days have observations; skip the request otherwise
+        local_today = self._local_today()
+        if not self.VISUALCROSSING_HISTORY_START <= target_date < local_today:
+            logger.debug(f"No historical data available for {target_date}")
+            return None
+
         if not self.visualcrossing_api_key:
             raise WeatherServiceError("Visual Crossing API key not configured")
 
-        lat, lon = self.nws_location
-        location = f"{lat},{lon}"
-        date_str = target_date.isoformat()
+        url = self._visualcrossing_url(target_date)
 
-        url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{location}/{date_str}/{date_str}"
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['days'])
 
-        params = {
-            'key': self.visualcrossing_api_key,
-            'unitGroup': 'metric',
-            'include': 'days',
-            'contentType': 'json',
-        }
+        if response.status_code == 401:
+            raise WeatherServiceError("Invalid Visual Crossing API key")
+        elif response.status_code != 200:
+            logger.warning(f"Visual Crossing historical API error: {response.status_code}")
+            raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
 
-        response = self._make_request_with_retry(url, params=params)
+        return self._parse_visualcrossing_historical_response(_json_loads(response.content), target_date)
+
+    def fetch_visualcrossing_historical_range(self, start: date, end: date) -> list[tuple[date, HistoricalWeatherData]]:
+        """
+        Fetch historical weather from Visual Crossing for start..end (inclusive) in ONE API call.
+        Returns list of (target_date, data) tuples; days outside the observable range are skipped.
+        """
+        local_today = self._local_today()
+        start = max(start, self.VISUALCROSSING_HISTORY_START)
+        end = min(end, local_today - timedelta(days=1))
+        if start > end:
+            logger.debug(f"No historical data available for {start} to {end}")
+            return []
+
+        if not self.visualcrossing_api_key:
+            raise WeatherServiceError("Visual Crossing API key not configured")
+
+        url = self._visualcrossing_url(start, end)
+
+        response = self._make_request_with_retry(url, params=self._visualcrossing_params['days'])
 
         if response.status_code == 401:
             raise WeatherServiceError("Invalid Visual Crossing API key")
@@ -2902,46 +3464,128 @@ class WeatherService:
             logger.warning(f"Visual Crossing historical API error: {response.status_code}")
             raise WeatherServiceError(f"Visual Crossing API error: {response.status_code}")
 
-        return self._parse_visualcrossing_historical_response(response.json(), target_date)
+        results = []
+        fetched_at = timezone.now()
+        try:
+            for day_data in _json_loads(response.content).get('days', []):
+                try:
+                    target_date = date.fromisoformat(day_data.get('datetime', ''))
+                except ValueError:
+                    continue
+                if start <= target_date <= end:
+                    results.append((
+                        target_date,
+                        self._parse_visualcrossing_historical_day(day_data, target_date, fetched_at),
+                    ))
+        # A non-dict payload or day entry; bad field values are reported by
+        # _parse_visualcrossing_historical_day itself
+        except (TypeError, AttributeError) as e:
+            logger.error(f"Failed to parse Visual Crossing historical response: {e}")
+            raise WeatherServiceError(f"Failed to parse historical data: {e}")
+
+        return results
 
     def _parse_visualcrossing_historical_response(self, data: dict, target_date: date) -> Optional[HistoricalWeatherData]:
         """Parse Visual Crossing historical API response."""
         try:
+            # The request covers exactly one day, so only the first entry can match
             days = data.get('days', [])
             if not days:
                 return None
 
             day_data = days[0]
+            date_str = target_date.isoformat()
+            if day_data.get('datetime', date_str) != date_str:
+                return None
+        except (TypeError, AttributeError) as e:
+            logger.error(f"Failed to parse Visual Crossing historical response: {e}")
+            raise WeatherServiceError(f"Failed to parse historical data: {e}")
+
+        return self._parse_visualcrossing_historical_day(day_data, target_date)
+
+    def _parse_visualcrossing_historical_day(
+        self,
+        day_data: dict,
+        target_date: date,
+        cached_at: Optional[datetime] = None,
+    ) -> HistoricalWeatherData:
+        """
+        Build HistoricalWeatherData from a single Visual Crossing day entry.
 
+        Batch callers pass one cached_at for the whole response instead of
+        reading the clock once per day. Only the field conversions are guarded,
+        so errors raised while building the dataclasses are not reported as
+        bad upstream data.
+        """
+        try:
             temp_max = day_data.get('tempmax')
             temp_min = day_data.get('tempmin')
-            precip_sum = day_data.get('precip')  # mm in metric
             wind_speed_kmh = day_data.get('windspeed') or 0
             wind_gust_kmh = day_data.get('windgust')
             wind_dir = day_data.get('winddir')
 
             # Convert km/h to knots
-            wind_speed_kt = round(wind_speed_kmh * 0.54)
-            wind_gust_kt = round(wind_gust_kmh * 0.54) if wind_gust_kmh else None
+            wind_speed_kt = _round_half_up(wind_speed_kmh * 0.54)
+            wind_gust_kt = _round_half_up(wind_gust_kmh * 0.54) if wind_gust_kmh else None
+            direction = _round_half_up(wind_dir) if wind_dir is not None else None
+            temperature_high = _round_half_up(temp_max) if temp_max is not None else None
+            temperature_low = _round_half_up(temp_min) if temp_min is not None else None
+        except (TypeError, AttributeError) as e:
+            logger.error(f"Failed to parse Visual Crossing historical day {target_date}: {e}")
+            raise WeatherServiceError(f"Failed to parse historical data: {e}")
 
-            wind = WindData(
-                direction=round(wind_dir) if wind_dir is not None else None,
-                speed=wind_speed_kt,
-                gust=wind_gust_kt,
-                direction_repr=str(round(wind_dir)) if wind_dir is not None else 'VRB',
-            )
+        wind = WindData(
+            direction=direction,
+            speed=wind_speed_kt,
+            gust=wind_gust_kt,
+            direction_repr=str(direction) if direction is not None else 'VRB',
+        )
 
-            return HistoricalWeatherData(
-                location=self.nws_location,
-                target_date=target_date,
-                wind=wind,
-                temperature_high=round(temp_max) if temp_max is not None else None,
-                temperature_low=round(temp_min) if temp_min is not None else None,
-                precipitation_sum=precip_sum,
-                cached_at=timezone.now(),
-                source=WeatherSource.HISTORICAL,
-            )
+        return HistoricalWeatherData(
+            location=self.nws_location,
+            target_date=target_date,
+            wind=wind,
+            temperature_high=temperature_high,
+            temperature_low=temperature_low,
+            precipitation_sum=day_data.get('precip'),  # mm in metric
+            cached_at=cached_at or timezone.now(),
+            source=WeatherSource.HISTORICAL,
+        )
 
-        except (KeyError, TypeError, IndexError) as e:
-            logger.error(f"Failed to parse Visual Crossing historical response: {e}")
-            raise WeatherServiceError(f"Failed to parse historical data: {e}")
+
+_shared_service: Optional[WeatherService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_weather_service() -> WeatherService:
+    """
+    Return the process-wide WeatherService, creating it on first use.
+
+    Views use this instead of constructing a service per request so that
+    settings are read once and the pooled HTTP client and NWS points cache
+    are shared.
+    """
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = WeatherService()
+    return _shared_service
+
+
+@atexit.register
+def _close_shared_service() -> None:
+    """Close the shared service's pooled connections at interpreter exit."""
+    with _shared_service_lock:
+        if _shared_service is not None:
+            _shared_service.close()
+
+
+@receiver(setting_changed)
+def _reset_shared_service(**kwargs) -> None:
+    """Drop the shared service when settings change (e.g. override_settings in tests)."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is not None:
+            _shared_service.close()
+        _shared_service = None
@@ -1,13 +1,22 @@
 """Tests for weather service data classes and utility functions."""
 
-from datetime import date, datetime
+import json
+import threading
+import time
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import httpx
 from django.test import TestCase, override_settings
 
 from apps.hamsalert.services.weather import (
     CloudLayer,
+    CompositeWeatherData,
+    ExtendedForecastData,
+    HistoricalWeatherData,
     RateLimitError,
+    UnavailableWeatherData,
     WeatherData,
     WeatherSource,
     WindData,
@@ -16,9 +25,32 @@ from apps.hamsalert.services.weather import (
     wind_arrow,
     WeatherService,
     WeatherServiceError,
+    _round_half_up,
+    get_weather_service,
 )
 
 
+def _mock_stream(client, *status_codes, payload=None):
+    """
+    Point client.stream at a mocked response and return it.
+
+    With several status codes, each stream opened gets the next one in turn.
+    """
+    response = MagicMock(status_code=status_codes[0], headers={})
+    response.read.return_value = json.dumps(payload).encode()
+    if len(status_codes) == 1:
+        client.stream.return_value.__enter__.return_value = response
+    else:
+        statuses = iter(status_codes)
+
+        def enter():
+            response.status_code = next(statuses)
+            return response
+
+        client.stream.return_value.__enter__.side_effect = enter
+    return response
+
+
 class WindDataTests(TestCase):
     """Tests for WindData dataclass."""
 
@@ -58,6 +90,12 @@ class WindDataTests(TestCase):
         wind = WindData(direction=45, speed=10, gust=None, direction_repr='045')
         self.assertEqual(wind.direction_compass, 'NE')
 
+    def test_immutable_and_hashable(self):
+        wind = WindData(direction=270, speed=10, gust=None, direction_repr='270')
+        with self.assertRaises(FrozenInstanceError):
+            wind.speed = 20
+        self.assertEqual(hash(wind), hash(WindData(direction=270, speed=10, gust=None, direction_repr='270')))
+
 
 class CloudLayerTests(TestCase):
     """Tests for CloudLayer dataclass."""
@@ -158,6 +196,11 @@ class RcAssessmentTests(TestCase):
         self.assertEqual(result['rating'], 'poor')
         self.assertGreater(len(result['reasons']), 1)
 
+    def test_int_and_float_inputs_cached_separately(self):
+        calculate_rc_assessment(wind_speed=10.0, wind_gust=None, visibility=2.0)
+        result = calculate_rc_assessment(wind_speed=10, wind_gust=None, visibility=2)
+        self.assertEqual(result['reasons'], ['Moderate wind: 10 kt', 'Reduced visibility: 2 SM'])
+
 
 class RcRatingColorTests(TestCase):
     """Tests for rc_rating_color function."""
@@ -197,6 +240,32 @@ class WindArrowTests(TestCase):
     def test_east_wind(self):
         self.assertEqual(wind_arrow(90), '➡️')
 
+    def test_out_of_range_degrees_wrap(self):
+        self.assertEqual(wind_arrow(360), wind_arrow(0))
+        self.assertEqual(wind_arrow(-90), wind_arrow(270))
+        self.assertEqual(wind_arrow(450), wind_arrow(90))
+
+
+class RoundHalfUpTests(TestCase):
+    """Tests for _round_half_up, used by the Visual Crossing parsers."""
+
+    def test_ties_round_up_not_to_even(self):
+        for value, expected in ((0.5, 1), (1.5, 2), (2.5, 3), (20.5, 21)):
+            self.assertEqual(_round_half_up(value), expected)
+
+    def test_negative_values(self):
+        # Temperatures below zero: ties go toward +infinity, others to nearest
+        for value, expected in ((-0.5, 0), (-2.5, -2), (-2.6, -3), (-10.4, -10), (-10.5, -10)):
+            self.assertEqual(_round_half_up(value), expected)
+
+    def test_non_ties_match_round(self):
+        for value in (0.0, 0.49, 9.6, 21.4, -0.49, -9.6, 7):
+            self.assertEqual(_round_half_up(value), round(value))
+
+    def test_returns_int(self):
+        self.assertIsInstance(_round_half_up(21.4), int)
+        self.assertIsInstance(_round_half_up(-2.5), int)
+
 
 class WeatherDataTests(TestCase):
     """Tests for WeatherData dataclass."""
@@ -264,6 +333,76 @@ class WeatherDataTests(TestCase):
         data = self.create_weather_data()
         self.assertEqual(data.source_label, 'Current')
 
+    @patch('apps.hamsalert.services.weather.calculate_rc_assessment', return_value={'rating': 'good', 'reasons': []})
+    def test_rc_flying_assessment_computed_once(self, mock_assess):
+        data = self.create_weather_data()
+        data.rc_flying_assessment
+        data.rc_rating_color
+        mock_assess.assert_called_once()
+
+
+class CompositeWeatherDataTests(TestCase):
+    """Tests for source priority in CompositeWeatherData."""
+
+    def _extended(self, speed, from_cache=False):
+        return ExtendedForecastData(
+            location=(40.9781, -124.1086),
+            target_date=date(2025, 6, 1),
+            wind=WindData(direction=180, speed=speed, gust=None, direction_repr='180'),
+            from_cache=from_cache,
+        )
+
+    def _historical(self, speed):
+        return HistoricalWeatherData(
+            location=(40.9781, -124.1086),
+            target_date=date(2025, 6, 1),
+            wind=WindData(direction=90, speed=speed, gust=None, direction_repr='90'),
+        )
+
+    def test_highest_priority_source_wins(self):
+        composite = CompositeWeatherData(
+            target_date=date(2025, 6, 1),
+            extended=self._extended(12, from_cache=True),
+            historical=self._historical(4),
+        )
+        self.assertEqual(composite.sources, [WeatherSource.EXTENDED, WeatherSource.HISTORICAL])
+        self.assertEqual(composite.wind.speed, 12)
+        self.assertEqual(composite.wind_source, WeatherSource.EXTENDED)
+        self.assertEqual(composite.source_label, 'Extended + Historical')
+        self.assertTrue(composite.from_cache)
+
+    def test_no_sources(self):
+        composite = CompositeWeatherData(target_date=date(2025, 6, 1))
+        self.assertEqual(composite.sources, [])
+        self.assertIsNone(composite.wind)
+        self.assertIsNone(composite.wind_source)
+        self.assertEqual(composite.source_label, 'Unavailable')
+        self.assertFalse(composite.from_cache)
+        self.assertEqual(composite.rc_flying_assessment['reasons'], ['No wind data available'])
+
+    def test_shortest_ttl(self):
+        composite = CompositeWeatherData(
+            target_date=date(2025, 6, 1),
+            extended=self._extended(12),
+            historical=self._historical(4),
+        )
+        ttls = {WeatherSource.METAR: 60, WeatherSource.EXTENDED: 600, WeatherSource.HISTORICAL: 300}
+        self.assertEqual(composite.get_shortest_ttl(ttls), 300)
+        self.assertEqual(CompositeWeatherData(target_date=date(2025, 6, 1)).get_shortest_ttl(ttls), 0)
+
+    def test_field_falls_through_to_next_source_with_a_value(self):
+        extended = self._extended(12)
+        extended.precipitation_probability = 40
+        historical = self._historical(4)
+        historical.temperature_high = 20
+        composite = CompositeWeatherData(target_date=date(2025, 6, 1), extended=extended, historical=historical)
+
+        self.assertEqual(composite.temperature_f, 68)
+        self.assertEqual(composite.temperature_source, WeatherSource.HISTORICAL)
+        self.assertEqual(composite.precipitation_probability, 40)
+        self.assertEqual(composite.precip_source, WeatherSource.EXTENDED)
+        self.assertIsNone(composite.visibility_source)
+
 
 class WeatherServiceConfigTests(TestCase):
     """Tests for WeatherService configuration."""
@@ -292,6 +431,15 @@ class WeatherServiceConfigTests(TestCase):
         self.assertEqual(service.visualcrossing_cache_ttl, 7200)
         self.assertEqual(service.extended_cache_ttl, 7200)  # Alias
 
+    def test_shared_service_is_reused(self):
+        self.assertIs(get_weather_service(), get_weather_service())
+
+    def test_shared_service_rebuilt_when_settings_change(self):
+        before = get_weather_service()
+        with override_settings(AVWX_DEFAULT_STATION='KSFO'):
+            self.assertEqual(get_weather_service().default_station, 'KSFO')
+        self.assertIsNot(get_weather_service(), before)
+
 
 class WeatherServiceNWSParsingTests(TestCase):
     """Tests for NWS wind parsing."""
@@ -311,10 +459,24 @@ class WeatherServiceNWSParsingTests(TestCase):
         self.assertEqual(wind.direction, 0)
 
     def test_parse_nws_wind_with_gusts(self):
-        # Note: current implementation extracts all numbers and uses last one for speed
         wind = self.service._parse_nws_wind('10 mph with gusts to 25 mph', 'NW')
         self.assertEqual(wind.gust, 22)  # 25 * 0.869 rounded
-        self.assertIsNotNone(wind.speed)
+        self.assertEqual(wind.speed, 9)  # gust value is not taken as sustained speed
+
+    def test_parse_nws_wind_range_with_gusts(self):
+        wind = self.service._parse_nws_wind('5 to 15 mph, gusts 30 mph', 'S')
+        self.assertEqual(wind.speed, 13)
+        self.assertEqual(wind.gust, 26)
+
+    def test_parse_nws_wind_gusts_any_case(self):
+        wind = self.service._parse_nws_wind('10 MPH, Gusts To 30 MPH', 'S')
+        self.assertEqual(wind.speed, 9)
+        self.assertEqual(wind.gust, 26)
+
+    def test_parse_nws_wind_unparsed_gust_clause(self):
+        wind = self.service._parse_nws_wind('10 mph with gusts as high as 25 mph', 'S')
+        self.assertEqual(wind.speed, 9)
+        self.assertIsNone(wind.gust)
 
     def test_parse_nws_wind_unknown_direction(self):
         wind = self.service._parse_nws_wind('10 mph', 'XXX')
@@ -322,6 +484,579 @@ class WeatherServiceNWSParsingTests(TestCase):
         self.assertEqual(wind.direction_repr, 'XXX')
 
 
+class WeatherServiceAVWXParsingTests(TestCase):
+    """Tests for AVWX METAR/TAF response parsing."""
+
+    def setUp(self):
+        self.service = WeatherService()
+
+    def test_parse_metar_response(self):
+        data = self.service._parse_metar_response({
+            'station': 'KACV',
+            'raw': 'KACV 011753Z 27012G20KT 10SM BKN015 15/10 A3000',
+            'time': {'dt': '2025-06-01T17:53:00Z'},
+            'wind_direction': {'value': 270, 'repr': '270'},
+            'wind_speed': {'value': 12},
+            'wind_gust': {'value': 20},
+            'visibility': {'value': 10, 'repr': '10'},
+            'clouds': [{'type': 'BKN', 'altitude': 15}],
+            'temperature': {'value': 15},
+            'dewpoint': {'value': 10},
+            'flight_rules': 'MVFR',
+        })
+        self.assertEqual(data.wind.direction, 270)
+        self.assertEqual(data.wind.speed, 12)
+        self.assertEqual(data.wind.gust, 20)
+        self.assertEqual(data.ceiling, 15)
+        self.assertEqual(data.temperature, 15)
+        self.assertEqual(data.observation_time.year, 2025)
+        self.assertEqual(data.observation_time.utcoffset().total_seconds(), 0)
+
+    def test_parse_metar_response_with_missing_fields(self):
+        data = self.service._parse_metar_response({
+            'station': 'KACV',
+            'wind_speed': None,
+            'wind_gust': None,
+            'visibility': None,
+            'time': None,
+        })
+        self.assertEqual(data.wind.speed, 0)
+        self.assertIsNone(data.wind.gust)
+        self.assertEqual(data.wind.direction_repr, 'VRB')
+        self.assertEqual(data.visibility, 10)
+        self.assertIsNone(data.temperature)
+
+    def test_parse_taf_response_selects_covering_period(self):
+        data = self.service._parse_taf_response({
+            'station': 'KACV',
+            'raw': 'TAF KACV',
+            'time': {'dt': '2025-06-01T11:20:00Z'},
+            'forecast': [
+                {
+                    'start_time': {'dt': '2025-06-01T12:00:00Z'},
+                    'end_time': {'dt': '2025-06-01T18:00:00Z'},
+                    'wind_speed': {'value': 5},
+                    'flight_rules': 'VFR',
+                },
+                {
+                    'start_time': {'dt': '2025-06-01T18:00:00Z'},
+                    'end_time': {'dt': '2025-06-02T12:00:00Z'},
+                    'wind_speed': {'value': 14},
+                    'wind_gust': {'value': 22},
+                    'flight_rules': 'MVFR',
+                },
+            ],
+        }, date(2025, 6, 2))
+        self.assertEqual(data.wind.speed, 14)
+        self.assertEqual(data.wind.gust, 22)
+        self.assertEqual(data.flight_rules, 'MVFR')
+        self.assertEqual(data.period.start_time.hour, 18)
+
+
+class WeatherServiceVisualCrossingParsingTests(TestCase):
+    """Tests for Visual Crossing response parsing."""
+
+    def setUp(self):
+        self.service = WeatherService()
+
+    def test_parse_hourly_batch_response(self):
+        results = self.service._parse_visualcrossing_hourly_batch_response({
+            'days': [
+                {
+                    'datetime': '2025-06-01',
+                    'hours': [
+                        {'datetime': '00:00:00', 'temp': 12.5, 'windspeed': 10.0, 'winddir': 271.6,
+                         'windgust': 20.0, 'precipprob': 10.4, 'conditions': 'Clear'},
+                        {'datetime': 'bogus', 'temp': 13.0},
+                        {'datetime': '01:00:00', 'temp': 12.0, 'winddir': None, 'precipprob': None,
+                         'conditions': 'Rain, Overcast'},
+                    ],
+                },
+                {'datetime': 'not-a-date', 'hours': []},
+            ],
+        })
+
+        self.assertEqual(len(results), 1)
+        target, data = results[0]
+        self.assertEqual(target, date(2025, 6, 1))
+        self.assertEqual(len(data.hours), 2)
+
+        first, second = data.hours
+        self.assertEqual(first.time.hour, 0)
+        self.assertEqual(first.time.date(), date(2025, 6, 1))
+        self.assertEqual(first.time.tzinfo, self.service.local_timezone)
+        self.assertEqual(first.wind_direction, 272)
+        self.assertEqual(first.precipitation_probability, 10)
+        self.assertEqual(first.weather_code, 0)
+        self.assertEqual(second.time.hour, 1)
+        self.assertIsNone(second.wind_direction)
+        self.assertIsNone(second.precipitation_probability)
+        self.assertEqual(second.weather_code, 3)
+
+    def test_parse_daily_batch_response_rounds_halves_up(self):
+        results = self.service._parse_visualcrossing_batch_response({
+            'days': [{'datetime': '2025-06-01', 'tempmax': 20.5, 'tempmin': -2.5, 'precipprob': 12.5,
+                      'winddir': 90.5}],
+        })
+
+        [(target, data)] = results
+        self.assertEqual(target, date(2025, 6, 1))
+        self.assertEqual(data.temperature_high, 21)
+        self.assertEqual(data.temperature_low, -2)
+        self.assertEqual(data.precipitation_probability, 13)
+        self.assertEqual(data.wind.direction, 91)
+        self.assertEqual(data.wind.direction_repr, '91')
+
+    def test_parse_daily_response_below_freezing(self):
+        data = self.service._parse_visualcrossing_daily_response({
+            'days': [{'datetime': '2025-01-10', 'tempmax': -0.5, 'tempmin': -10.5}],
+        }, date(2025, 1, 10))
+
+        self.assertEqual(data.temperature_high, 0)
+        self.assertEqual(data.temperature_low, -10)
+
+
+class WeatherServiceVisualCrossingHistoricalParsingTests(TestCase):
+    """Tests for Visual Crossing historical response parsing."""
+
+    def setUp(self):
+        self.service = WeatherService()
+        self.target = date(2025, 5, 30)
+
+    def test_parse_historical_response(self):
+        data = self.service._parse_visualcrossing_historical_response({
+            'days': [{
+                'datetime': '2025-05-30', 'tempmax': 21.4, 'tempmin': 9.6, 'precip': 1.2,
+                'windspeed': 20.0, 'windgust': 37.0, 'winddir': 301.0,
+            }],
+        }, self.target)
+        self.assertEqual(data.target_date, self.target)
+        self.assertEqual(data.temperature_high, 21)
+        self.assertEqual(data.temperature_low, 10)
+        self.assertEqual(data.precipitation_sum, 1.2)
+        self.assertEqual(data.wind.speed, 11)
+        self.assertEqual(data.wind.gust, 20)
+        self.assertEqual(data.wind.direction, 301)
+
+    def test_parse_historical_response_rounds_halves_up(self):
+        data = self.service._parse_visualcrossing_historical_response({
+            'days': [{'datetime': '2025-05-30', 'tempmax': 20.5, 'tempmin': -2.5, 'winddir': 180.5}],
+        }, self.target)
+        self.assertEqual(data.temperature_high, 21)
+        self.assertEqual(data.temperature_low, -2)
+        self.assertEqual(data.wind.direction, 181)
+
+    def test_parse_historical_response_wrong_day(self):
+        data = self.service._parse_visualcrossing_historical_response({
+            'days': [{'datetime': '2025-05-29', 'tempmax': 21.4}],
+        }, self.target)
+        self.assertIsNone(data)
+
+    def test_parse_historical_response_empty(self):
+        self.assertIsNone(self.service._parse_visualcrossing_historical_response({'days': []}, self.target))
+
+    def test_parse_historical_response_malformed(self):
+        for payload in ({'days': ['2025-05-30']}, {'days': [{'datetime': '2025-05-30', 'windspeed': 'calm'}]}):
+            with self.assertRaises(WeatherServiceError):
+                self.service._parse_visualcrossing_historical_response(payload, self.target)
+
+    @patch.object(WeatherService, '_make_request_with_retry')
+    def test_fetch_historical_skips_dates_without_observations(self, mock_request):
+        local_today = datetime.now(self.service.local_timezone).date()
+        self.assertIsNone(self.service.fetch_visualcrossing_historical(local_today))
+        self.assertIsNone(self.service.fetch_visualcrossing_historical(date(1969, 12, 31)))
+        mock_request.assert_not_called()
+
+    @override_settings(VISUALCROSSING_API_KEY='test-key')
+    @patch.object(WeatherService, '_make_request_with_retry')
+    def test_fetch_historical_range_single_request(self, mock_request):
+        """A span of past days is fetched in one request and split per day."""
+        service = WeatherService()
+        local_today = datetime.now(service.local_timezone).date()
+        start = local_today - timedelta(days=3)
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.content = json.dumps({
+            'days': [
+                {'datetime': (start + timedelta(days=i)).isoformat(), 'tempmax': 20.0 + i, 'windspeed': 10.0}
+                for i in range(3)
+            ],
+        }).encode()
+
+        results = service.fetch_visualcrossing_historical_range(start, local_today)
+
+        mock_request.assert_called_once()
+        self.assertIn(f"{start.isoformat()}/{(local_today - timedelta(days=1)).isoformat()}", mock_request.call_args[0][0])
+        self.assertEqual([d for d, _ in results], [start + timedelta(days=i) for i in range(3)])
+        self.assertEqual(results[2][1].temperature_high, 22)
+
+
+class WeatherServiceNWSFetchTests(TestCase):
+    """Tests for streamed NWS requests."""
+
+    def setUp(self):
+        self.service = WeatherService()
+
+    def test_get_nws_json_reads_body_on_success(self):
+        client = MagicMock()
+        response = _mock_stream(client, 200, payload={'properties': {}})
+        data = self.service._get_nws_json(client, 'https://api.weather.gov/x', {}, 'log', 'error')
+        self.assertEqual(data, {'properties': {}})
+        response.read.assert_called_once()
+
+    @patch('apps.hamsalert.services.weather.time.sleep')
+    def test_get_nws_json_skips_body_on_error(self, mock_sleep):
+        client = MagicMock()
+        response = _mock_stream(client, 503)
+        with self.assertRaisesMessage(WeatherServiceError, 'NWS API error: 503'):
+            self.service._get_nws_json(client, 'https://api.weather.gov/x', {}, 'log', 'NWS API error')
+        response.read.assert_not_called()
+        self.assertEqual(client.stream.call_count, self.service.max_retries + 1)
+
+    @patch('apps.hamsalert.services.weather.time.sleep')
+    def test_get_nws_json_retries_transient_errors(self, mock_sleep):
+        """A 503 and a failed connection are retried before the body is read."""
+        client = MagicMock()
+        response = _mock_stream(client, 503, 200, payload={'properties': {}})
+        client.stream.side_effect = [httpx.ConnectError('refused'), client.stream.return_value, client.stream.return_value]
+
+        data = self.service._get_nws_json(client, 'https://api.weather.gov/x', {}, 'log', 'error')
+
+        self.assertEqual(data, {'properties': {}})
+        self.assertEqual(client.stream.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        response.read.assert_called_once()
+
+    def test_parse_nws_response_summarizes_target_day(self):
+        def period(start, is_daytime, temperature, pop):
+            return {
+                'name': 'Period',
+                'startTime': start,
+                'endTime': start,
+                'isDaytime': is_daytime,
+                'temperature': temperature,
+                'windSpeed': '10 mph',
+                'windDirection': 'NW',
+                'probabilityOfPrecipitation': {'value': pop},
+            }
+
+        forecast = self.service._parse_nws_response({'properties': {'periods': [
+            period('2025-06-01T06:00:00-07:00', True, 70, 20),
+            period('2025-06-01T18:00:00-07:00', False, 50, 40),
+            period('2025-06-02T06:00:00-07:00', True, 80, 90),
+        ]}}, date(2025, 6, 1))
+
+        self.assertEqual(len(forecast.periods), 2)
+        self.assertEqual(forecast.temperature_high, 70)
+        self.assertEqual(forecast.temperature_low, 50)
+        self.assertEqual(forecast.precipitation_probability, 40)
+        self.assertEqual(forecast.periods[0].precipitation_probability, 20)
+
+    @patch.object(WeatherService, '_fetch_nws_forecast_json')
+    def test_fetch_nws_batch_splits_one_forecast(self, mock_fetch):
+        """Several days are parsed from a single forecast request."""
+        mock_fetch.return_value = {'properties': {'periods': [
+            {'startTime': f'2025-06-0{day}T06:00:00-07:00', 'endTime': f'2025-06-0{day}T18:00:00-07:00',
+             'isDaytime': True, 'temperature': 70, 'windSpeed': '10 mph', 'windDirection': 'NW'}
+            for day in (1, 2)
+        ]}}
+
+        results = self.service.fetch_nws_batch([date(2025, 6, 1), date(2025, 6, 2)])
+
+        mock_fetch.assert_called_once()
+        self.assertEqual([target for target, _ in results], [date(2025, 6, 1), date(2025, 6, 2)])
+        self.assertEqual(results[1][1].periods[0].start_time.date(), date(2025, 6, 2))
+
+    @patch('httpx.Client')
+    def test_fetch_nws_forecast_caches_points_lookup(self, mock_client_class):
+        """The points lookup only happens on the first fetch for a location."""
+        client = mock_client_class.return_value
+        response = _mock_stream(client, 200)
+        response.read.side_effect = [json.dumps(payload).encode() for payload in (
+            {'properties': {'forecast': 'https://api.weather.gov/gridpoints/EKA/1,2/forecast'}},
+            {'properties': {'periods': []}},
+            {'properties': {'periods': []}},
+        )]
+
+        self.service._fetch_nws_forecast(date(2025, 6, 1))
+        self.service._fetch_nws_forecast(date(2025, 6, 2))
+
+        mock_client_class.assert_called_once()
+        urls = [call.args[1] for call in client.stream.call_args_list]
+        self.assertEqual(len(urls), 3)
+        self.assertIn('/points/', urls[0])
+        self.assertTrue(urls[1].endswith('/forecast'))
+        self.assertTrue(urls[2].endswith('/forecast'))
+
+    @patch('httpx.Client')
+    def test_fetch_nws_forecast_uses_persisted_points_lookup(self, mock_client_class):
+        """A new service reuses the forecast URL stored in the Django cache."""
+        client = mock_client_class.return_value
+        response = _mock_stream(client, 200)
+        response.read.side_effect = [json.dumps(payload).encode() for payload in (
+            {'properties': {'forecast': 'https://api.weather.gov/gridpoints/EKA/1,2/forecast'}},
+            {'properties': {'periods': []}},
+            {'properties': {'periods': []}},
+        )]
+
+        self.service._fetch_nws_forecast(date(2025, 6, 1))
+        WeatherService()._fetch_nws_forecast(date(2025, 6, 1))
+
+        urls = [call.args[1] for call in client.stream.call_args_list]
+        self.assertEqual(len(urls), 3)
+        self.assertIn('/points/', urls[0])
+        self.assertTrue(urls[2].endswith('/forecast'))
+
+    @patch('httpx.Client')
+    def test_failed_forecast_forgets_points_lookup(self, mock_client_class):
+        """A forecast URL that errors is resolved again on the next fetch."""
+        client = mock_client_class.return_value
+        response = _mock_stream(client, 200, 404, 200, 200)
+        points = {'properties': {'forecast': 'https://api.weather.gov/gridpoints/EKA/1,2/forecast'}}
+        response.read.side_effect = [json.dumps(points).encode()] * 2 + [b'{"properties": {"periods": []}}']
+
+        with self.assertRaises(WeatherServiceError):
+            self.service._fetch_nws_forecast(date(2025, 6, 1))
+        self.service._fetch_nws_forecast(date(2025, 6, 1))
+
+        urls = [call.args[1] for call in client.stream.call_args_list]
+        self.assertEqual(len(urls), 4)
+        self.assertIn('/points/', urls[2])
+
+
+@override_settings(AVWX_API_TOKEN='test-token')
+class WeatherServiceAVWXFetchTests(TestCase):
+    """Tests for AVWX requests."""
+
+    @patch('httpx.Client')
+    def test_metar_and_taf_share_pooled_client(self, mock_client_class):
+        """METAR and TAF fetches reuse the service's pooled HTTP client."""
+        _mock_stream(mock_client_class.return_value, 404)
+        service = WeatherService()
+
+        self.assertIsNone(service._fetch_metar_from_api('KACV'))
+        self.assertIsNone(service._fetch_taf_from_api('KACV', date(2025, 6, 1)))
+
+        mock_client_class.assert_called_once()
+        urls = [call.args[1] for call in mock_client_class.return_value.stream.call_args_list]
+        self.assertEqual(urls, ['https://avwx.rest/api/metar/KACV', 'https://avwx.rest/api/taf/KACV'])
+
+    @patch('apps.hamsalert.services.weather.time.sleep')
+    @patch('httpx.Client')
+    def test_error_status_skips_body(self, mock_client_class, mock_sleep):
+        response = _mock_stream(mock_client_class.return_value, 503)
+
+        with self.assertRaisesMessage(WeatherServiceError, 'API error: 503'):
+            WeatherService()._fetch_metar_from_api('KACV')
+        response.read.assert_not_called()
+
+    @patch('apps.hamsalert.services.weather.time.sleep')
+    @patch('httpx.Client')
+    def test_rate_limit_and_connect_errors_are_retried(self, mock_client_class, mock_sleep):
+        """A 429 (honouring Retry-After) and a failed connection are retried."""
+        response = _mock_stream(mock_client_class.return_value, 429, 200, payload={'raw': 'KACV 011200Z'})
+        response.headers = {'Retry-After': '2'}
+        stream = mock_client_class.return_value.stream
+        stream.side_effect = [httpx.ConnectError('refused'), stream.return_value, stream.return_value]
+
+        data = WeatherService()._get_avwx_json('https://avwx.rest/api/metar/KACV', 'not found')
+
+        self.assertEqual(data, {'raw': 'KACV 011200Z'})
+        self.assertEqual(stream.call_count, 3)
+        self.assertEqual(mock_sleep.call_args_list[-1].args, (2.0,))
+
+    @patch('apps.hamsalert.services.weather.time.sleep')
+    @patch('httpx.Client')
+    def test_connect_errors_raise_after_retries(self, mock_client_class, mock_sleep):
+        mock_client_class.return_value.stream.side_effect = httpx.ConnectError('refused')
+        service = WeatherService()
+
+        with self.assertRaisesMessage(WeatherServiceError, 'API request failed'):
+            service._fetch_metar_from_api('KACV')
+        self.assertEqual(mock_client_class.return_value.stream.call_count, service.max_retries + 1)
+
+
+class WeatherForDateDispatchTests(TestCase):
+    """Tests for choosing a source by days out."""
+
+    @patch.object(WeatherService, '_get_extended_forecast', return_value='extended')
+    @patch.object(WeatherService, '_get_nws_forecast', return_value='nws')
+    @patch.object(WeatherService, '_get_taf', return_value='taf')
+    @patch.object(WeatherService, '_get_metar', return_value='metar')
+    def test_source_by_days_out(self, *mocks):
+        service = WeatherService()
+        today = datetime.now(service.local_timezone).date()
+        expected = {0: 'metar', 1: 'taf', 2: 'nws', 7: 'nws', 8: 'extended', 14: 'extended'}
+
+        for days_out, source in expected.items():
+            self.assertEqual(service.get_weather_for_date(today + timedelta(days=days_out)), source)
+        self.assertIsInstance(service.get_weather_for_date(today - timedelta(days=1)), UnavailableWeatherData)
+        self.assertIsInstance(service.get_weather_for_date(today + timedelta(days=15)), UnavailableWeatherData)
+
+
+class CompositeFetchTests(TestCase):
+    """Tests for fanning out fetches across sources."""
+
+    def setUp(self):
+        self.service = WeatherService()
+        self.today = datetime.now(self.service.local_timezone).date()
+
+    @patch.object(WeatherService, '_get_extended_forecast', return_value='extended')
+    @patch.object(WeatherService, '_get_nws_forecast', side_effect=WeatherServiceError('down'))
+    @patch.object(WeatherService, '_get_taf', return_value='taf')
+    @patch.object(WeatherService, '_get_metar', return_value=None)
+    def test_collects_results_and_skips_failed_sources(self, mock_metar, mock_taf, mock_nws, mock_extended):
+        composite = self.service.get_all_weather_for_date(self.today)
+
+        self.assertIsNone(composite.metar)
+        self.assertEqual(composite.taf, 'taf')
+        self.assertIsNone(composite.nws)
+        self.assertEqual(composite.extended, 'extended')
+        self.assertEqual(composite.source, WeatherSource.TAF)
+
+    @patch.object(WeatherService, '_get_extended_forecast', return_value='extended')
+    @patch.object(WeatherService, '_get_nws_forecast')
+    @patch.object(WeatherService, '_get_taf')
+    @patch.object(WeatherService, '_get_metar')
+    def test_only_applicable_sources_fetched(self, mock_metar, mock_taf, mock_nws, mock_extended):
+        composite = self.service.get_all_weather_for_date(self.today + timedelta(days=10))
+
+        mock_metar.assert_not_called()
+        mock_taf.assert_not_called()
+        mock_nws.assert_not_called()
+        self.assertEqual(composite.source, WeatherSource.EXTENDED)
+
+    @patch.object(WeatherService, '_deserialize_extended_data', return_value='stored extended')
+    @patch.object(WeatherService, '_deserialize_taf_data', return_value='stored taf')
+    @patch.object(WeatherService, '_get_extended_forecast')
+    @patch.object(WeatherService, '_get_nws_forecast', return_value='nws')
+    @patch.object(WeatherService, '_get_taf')
+    def test_fresh_db_sources_are_not_refetched(self, mock_taf, mock_nws, mock_extended, *deserializers):
+        tomorrow = self.today + timedelta(days=1)
+        lat, lon = self.service.nws_location
+        self.service._save_to_db('taf', tomorrow, {'stored': True}, station=self.service.default_station)
+        self.service._save_to_db('extended', tomorrow, {'stored': True}, lat=lat, lon=lon)
+
+        composite = self.service.get_all_weather_for_date(tomorrow)
+
+        mock_taf.assert_not_called()
+        mock_extended.assert_not_called()
+        mock_nws.assert_called_once_with(tomorrow)
+        self.assertEqual(composite.taf, 'stored taf')
+        self.assertEqual(composite.nws, 'nws')
+        self.assertEqual(composite.extended, 'stored extended')
+
+    @override_settings(WEATHER_COMPOSITE_SOURCE_TIMEOUTS={'metar': 1.0, 'taf': 1.0, 'nws': 0.05, 'extended': 1.0})
+    @patch.object(WeatherService, '_get_extended_forecast', return_value='extended')
+    @patch.object(WeatherService, '_get_nws_forecast')
+    @patch.object(WeatherService, '_get_taf', return_value='taf')
+    def test_slow_source_does_not_hold_back_composite(self, mock_taf, mock_nws, mock_extended):
+        """A source that misses its deadline is left out; the rest are returned."""
+        release = threading.Event()
+        mock_nws.side_effect = lambda target_date: release.wait(5) and 'nws'
+        try:
+            composite = WeatherService().get_all_weather_for_date(self.today + timedelta(days=1))
+        finally:
+            release.set()
+
+        self.assertEqual(composite.taf, 'taf')
+        self.assertIsNone(composite.nws)
+        self.assertEqual(composite.extended, 'extended')
+
+    @override_settings(WEATHER_COMPOSITE_SOURCE_TIMEOUTS={'metar': 1.0, 'taf': 1.0, 'nws': 0.05, 'extended': 1.0})
+    @patch.object(WeatherService, '_get_extended_forecast', return_value='extended')
+    @patch.object(WeatherService, '_get_nws_forecast')
+    @patch.object(WeatherService, '_get_taf', return_value='taf')
+    def test_hung_fetches_do_not_starve_later_calls(self, mock_taf, mock_nws, mock_extended):
+        """Workers stuck on earlier calls don't delay the next call's sources."""
+        release = threading.Event()
+        mock_nws.side_effect = lambda target_date: release.wait(5) and 'nws'
+        service = WeatherService()
+        try:
+            composites = [
+                service.get_all_weather_for_date(self.today + timedelta(days=1))
+                for _ in range(5)
+            ]
+        finally:
+            release.set()
+
+        for composite in composites:
+            self.assertEqual(composite.taf, 'taf')
+            self.assertEqual(composite.extended, 'extended')
+
+
+class SingleflightTests(TestCase):
+    """Tests for coalescing concurrent upstream fetches."""
+
+    def setUp(self):
+        self.service = WeatherService()
+
+    def _run_concurrently(self, leader_fetch, follower_fetch):
+        started = threading.Event()
+        results = {}
+
+        def leader():
+            def fetch():
+                started.set()
+                return leader_fetch()
+            try:
+                results['leader'] = self.service._singleflight(('test', 1), fetch)
+            except WeatherServiceError as e:
+                results['leader'] = e
+
+        def follower():
+            try:
+                results['follower'] = self.service._singleflight(('test', 1), follower_fetch)
+            except WeatherServiceError as e:
+                results['follower'] = e
+
+        leader_thread = threading.Thread(target=leader)
+        leader_thread.start()
+        started.wait(timeout=5)
+        follower_thread = threading.Thread(target=follower)
+        follower_thread.start()
+        return leader_thread, follower_thread, results
+
+    def test_concurrent_callers_share_one_fetch(self):
+        release = threading.Event()
+        follower_fetch = MagicMock(return_value='duplicate')
+
+        def leader_fetch():
+            release.wait(timeout=5)
+            return 'data'
+
+        leader_thread, follower_thread, results = self._run_concurrently(leader_fetch, follower_fetch)
+        # Give the follower time to find the in-flight call before releasing the leader
+        time.sleep(0.1)
+        release.set()
+        leader_thread.join(timeout=5)
+        follower_thread.join(timeout=5)
+
+        self.assertEqual(results, {'leader': 'data', 'follower': 'data'})
+        follower_fetch.assert_not_called()
+
+    def test_leader_error_is_shared(self):
+        release = threading.Event()
+        error = WeatherServiceError('upstream down')
+
+        def leader_fetch():
+            release.wait(timeout=5)
+            raise error
+
+        leader_thread, follower_thread, results = self._run_concurrently(leader_fetch, MagicMock())
+        time.sleep(0.1)
+        release.set()
+        leader_thread.join(timeout=5)
+        follower_thread.join(timeout=5)
+
+        self.assertIs(results['leader'], error)
+        self.assertIs(results['follower'], error)
+
+    def test_sequential_calls_fetch_again(self):
+        fetch = MagicMock(side_effect=['first', 'second'])
+        self.assertEqual(self.service._singleflight(('test', 2), fetch), 'first')
+        self.assertEqual(self.service._singleflight(('test', 2), fetch), 'second')
+
+
 class WeatherServiceBackoffTests(TestCase):
     """Tests for exponential backoff calculation."""
 
@@ -457,6 +1192,43 @@ class RateLimitRequestIntegrationTests(TestCase):
         )
         self.assertEqual(response.status_code, 200)
 
+    @patch('httpx.Client')
+    def test_make_request_reuses_pooled_client(self, mock_client_class):
+        """Consecutive requests share one HTTP client."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_client_class.return_value.get.return_value = mock_response
+
+        self.service._make_request_with_retry('https://weather.visualcrossing.com/a', params={})
+        self.service._make_request_with_retry('https://weather.visualcrossing.com/b', params={})
+
+        mock_client_class.assert_called_once()
+        self.assertEqual(mock_client_class.return_value.get.call_count, 2)
+
+    @patch('httpx.Client')
+    def test_context_manager_closes_pooled_client(self, mock_client_class):
+        """Leaving a `with WeatherService()` block closes its HTTP client."""
+        mock_client_class.return_value.get.return_value = MagicMock(status_code=200)
+
+        with WeatherService() as service:
+            service._make_request_with_retry('https://weather.visualcrossing.com/a', params={})
+
+        mock_client_class.return_value.close.assert_called_once()
+
+    @patch('apps.hamsalert.services.weather.time.sleep')
+    @patch('httpx.Client')
+    def test_make_request_retries_transient_server_errors(self, mock_client_class, mock_sleep):
+        """A 503 is retried and the following success returned."""
+        mock_client_class.return_value.get.side_effect = [
+            MagicMock(status_code=503, headers={'Retry-After': '2'}),
+            MagicMock(status_code=200),
+        ]
+
+        response = self.service._make_request_with_retry('https://weather.visualcrossing.com/a', params={})
+
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once_with(2.0)
+
 
 class RateLimitErrorSubclassTests(TestCase):
     """Tests for RateLimitError exception."""
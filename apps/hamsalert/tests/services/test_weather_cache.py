@@ -4,6 +4,7 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -24,6 +25,8 @@ from apps.hamsalert.services.weather import (
     WeatherServiceError,
     WeatherSource,
     WindData,
+    _l1_invalidate,
+    _refresh_lock_key,
 )
 
 
@@ -99,6 +102,16 @@ class WeatherServiceDBCacheTests(TestCase):
         result = self.service._get_from_db('extended', self.test_date, lat=self.lat, lon=self.lon)
         self.assertEqual(result, new_data)
 
+    def test_save_to_db_upserts_coordinate_records(self):
+        self.service._save_to_db('extended', self.test_date, {'version': 1}, lat=self.lat, lon=self.lon)
+        self.service._save_to_db(
+            'extended', self.test_date, {'version': 2}, lat=self.lat, lon=self.lon, api_response_time_ms=90,
+        )
+
+        record = WeatherRecord.objects.get(weather_type='extended')
+        self.assertEqual(record.data, {'version': 2})
+        self.assertEqual(record.api_response_time_ms, 90)
+
     def test_save_to_db_records_api_response_time(self):
         self.service._save_to_db(
             'extended',
@@ -374,6 +387,22 @@ class DBCacheIntegrationTests(TestCase):
         self.assertEqual(result.wind.speed, 12)
         self.assertTrue(result.from_cache)
 
+    @patch.object(WeatherService, '_fetch_visualcrossing_daily')
+    def test_stale_fallback_reads_db_once(self, mock_fetch):
+        """Fresh check, stale window and stale fallback share one DB read."""
+        self.service._save_to_db('extended', self.test_date, {'stored': True}, lat=self.lat, lon=self.lon)
+        WeatherRecord.objects.filter(weather_type='extended').update(
+            fetched_at=timezone.now() - timedelta(days=2)
+        )
+        mock_fetch.side_effect = WeatherServiceError("API unavailable")
+
+        with patch.object(WeatherService, '_deserialize_extended_data', return_value='stale') as deserialize:
+            with self.assertNumQueries(1):
+                result = self.service._get_extended_forecast(self.test_date)
+
+        self.assertEqual(result, 'stale')
+        deserialize.assert_called_once_with({'stored': True})
+
     @patch.object(WeatherService, '_fetch_visualcrossing_daily')
     def test_api_error_with_no_stale_data_raises(self, mock_fetch):
         """On API error with no stale data, should raise exception."""
@@ -412,6 +441,326 @@ class DBCacheIntegrationTests(TestCase):
         self.assertTrue(result.from_cache)
 
 
+class WeatherFromDBTests(TestCase):
+    """Tests for the read-only composite used by views."""
+
+    def setUp(self):
+        WeatherRecord.objects.all().delete()
+        _l1_invalidate()
+        self.addCleanup(_l1_invalidate)
+        self.service = WeatherService()
+        self.lat, self.lon = self.service.nws_location
+        self.target = datetime.now(self.service.local_timezone).date() + timedelta(days=3)
+
+    def _extended(self, speed):
+        return self.service._serialize_extended_data(ExtendedForecastData(
+            location=(self.lat, self.lon),
+            target_date=self.target,
+            wind=WindData(direction=270, speed=speed, gust=None, direction_repr='270'),
+        ))
+
+    def test_reads_all_sources_in_one_query(self):
+        self.service._save_to_db('extended', self.target, self._extended(8), lat=self.lat, lon=self.lon)
+        # A record for another station must not be picked up
+        self.service._save_to_db('taf', self.target, {}, station='KSFO')
+
+        with self.assertNumQueries(1):
+            composite = self.service.get_weather_from_db(self.target, 'KACV')
+
+        self.assertEqual(composite.sources, [WeatherSource.EXTENDED])
+        self.assertEqual(composite.extended.wind.speed, 8)
+        self.assertEqual(composite.source, WeatherSource.EXTENDED)
+
+    def test_returns_none_without_records(self):
+        self.assertIsNone(self.service.get_weather_from_db(self.target))
+
+    def test_repeat_read_served_from_l1(self):
+        nws = NwsForecastData(
+            location=(self.lat, self.lon),
+            target_date=self.target,
+            periods=[],
+            wind=WindData(direction=None, speed=5, gust=None, direction_repr='VRB'),
+        )
+        self.service._save_to_db('nws', self.target, self.service._serialize_nws_data(nws), lat=self.lat, lon=self.lon)
+        self.service._save_to_db('extended', self.target, self._extended(8), lat=self.lat, lon=self.lon)
+        self.service.get_weather_from_db(self.target, 'KACV')
+
+        with self.assertNumQueries(0):
+            composite = self.service.get_weather_from_db(self.target, 'KACV')
+        self.assertEqual(composite.extended.wind.speed, 8)
+
+        self.service._save_to_db('extended', self.target, self._extended(12), lat=self.lat, lon=self.lon)
+        self.assertEqual(self.service.get_weather_from_db(self.target, 'KACV').extended.wind.speed, 12)
+
+
+class StaleWhileRevalidateTests(TestCase):
+    """Tests for serving recently expired data while refreshing in the background."""
+
+    def setUp(self):
+        WeatherRecord.objects.all().delete()
+        self.service = WeatherService()
+        self.test_date = date.today() + timedelta(days=3)
+        self.lat, self.lon = self.service.nws_location
+        self.hourly_data = {
+            'location': [self.lat, self.lon],
+            'target_date': self.test_date.isoformat(),
+            'hours': [],
+        }
+
+    def _age_records(self, seconds):
+        WeatherRecord.objects.all().update(fetched_at=timezone.now() - timedelta(seconds=seconds))
+
+    @patch.object(WeatherService, '_refresh_in_background')
+    @patch.object(WeatherService, '_fetch_visualcrossing_hourly')
+    def test_expired_data_within_window_served_and_refreshed(self, mock_fetch, mock_refresh):
+        self.service._save_to_db('hourly', self.test_date, self.hourly_data, lat=self.lat, lon=self.lon)
+        self._age_records(self.service.extended_cache_ttl + 60)
+
+        result = self.service.get_hourly_forecast(self.test_date)
+
+        self.assertTrue(result.from_cache)
+        mock_fetch.assert_not_called()
+        mock_refresh.assert_called_once()
+        self.assertEqual(mock_refresh.call_args.args[0], ('hourly', self.lat, self.lon, self.test_date))
+
+    @patch.object(WeatherService, '_refresh_in_background')
+    @patch.object(WeatherService, '_fetch_visualcrossing_hourly')
+    def test_data_past_window_fetched_synchronously(self, mock_fetch, mock_refresh):
+        self.service._save_to_db('hourly', self.test_date, self.hourly_data, lat=self.lat, lon=self.lon)
+        self._age_records(self.service.extended_cache_ttl + self.service.stale_while_revalidate + 60)
+        mock_fetch.return_value = HourlyForecastData(
+            location=(self.lat, self.lon), target_date=self.test_date, hours=[],
+        )
+
+        result = self.service.get_hourly_forecast(self.test_date)
+
+        self.assertFalse(result.from_cache)
+        mock_fetch.assert_called_once()
+        mock_refresh.assert_not_called()
+
+    @patch.object(WeatherService, '_refresh_in_background')
+    @patch.object(WeatherService, '_fetch_nws_forecast')
+    def test_expired_nws_served_and_refreshed(self, mock_fetch, mock_refresh):
+        nws = NwsForecastData(
+            location=(self.lat, self.lon),
+            target_date=self.test_date,
+            periods=[],
+            wind=WindData(direction=None, speed=5, gust=None, direction_repr='VRB'),
+        )
+        self.service._save_to_db('nws', self.test_date, self.service._serialize_nws_data(nws), lat=self.lat, lon=self.lon)
+        self._age_records(self.service.nws_cache_ttl + 60)
+
+        result = self.service._get_nws_forecast(self.test_date)
+
+        self.assertTrue(result.from_cache)
+        mock_fetch.assert_not_called()
+        self.assertEqual(mock_refresh.call_args.args[0], ('nws', self.lat, self.lon, self.test_date))
+
+    @patch('apps.hamsalert.services.weather.connection')
+    @patch('apps.hamsalert.services.weather.threading.Thread')
+    def test_refresh_in_background_dedupes_running_refresh(self, mock_thread, mock_connection):
+        refresh = MagicMock()
+        key = ('hourly', self.test_date)
+
+        self.service._refresh_in_background(key, refresh)
+        self.service._refresh_in_background(key, refresh)
+
+        # Second call is skipped while the first is still in flight
+        mock_thread.assert_called_once()
+
+        # Once the refresh runs, the key is released
+        mock_thread.call_args.kwargs['target']()
+        refresh.assert_called_once()
+        self.service._refresh_in_background(key, refresh)
+        self.assertEqual(mock_thread.call_count, 2)
+        mock_thread.call_args.kwargs['target']()
+
+    @patch('apps.hamsalert.services.weather.connection')
+    @patch('apps.hamsalert.services.weather.threading.Thread')
+    def test_refresh_in_background_skipped_while_another_process_holds_lock(self, mock_thread, mock_connection):
+        key = ('hourly', self.test_date)
+        cache.add(_refresh_lock_key(key), 1)
+        self.addCleanup(cache.delete, _refresh_lock_key(key))
+
+        self.service._refresh_in_background(key, MagicMock())
+
+        mock_thread.assert_not_called()
+        # The in-process marker is released so a later call can retry
+        cache.delete(_refresh_lock_key(key))
+        self.service._refresh_in_background(key, MagicMock())
+        mock_thread.assert_called_once()
+        mock_thread.call_args.kwargs['target']()
+        self.assertIsNone(cache.get(_refresh_lock_key(key)))
+
+
+class HourlyForecastRangeTests(TestCase):
+    """Tests for fetching hourly forecasts over a date range."""
+
+    def setUp(self):
+        WeatherRecord.objects.all().delete()
+        self.service = WeatherService()
+        self.lat, self.lon = self.service.nws_location
+        self.start = date.today() + timedelta(days=1)
+        self.end = self.start + timedelta(days=3)
+
+    def _hourly(self, target):
+        return HourlyForecastData(location=(self.lat, self.lon), target_date=target, hours=[])
+
+    def _store(self, target):
+        self.service._save_to_db(
+            'hourly', target, self.service._serialize_hourly_data(self._hourly(target)),
+            lat=self.lat, lon=self.lon,
+        )
+
+    @patch.object(WeatherService, 'fetch_visualcrossing_hourly_range')
+    def test_all_days_cached_skips_api(self, mock_fetch):
+        for i in range(4):
+            self._store(self.start + timedelta(days=i))
+
+        results = self.service.get_hourly_forecast_range(self.start, self.end)
+
+        mock_fetch.assert_not_called()
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(data.from_cache for data in results.values()))
+
+    @patch.object(WeatherService, 'fetch_visualcrossing_hourly_range')
+    def test_missing_days_fetched_in_one_request(self, mock_fetch):
+        self._store(self.start)
+        missing = [self.start + timedelta(days=i) for i in range(1, 4)]
+        mock_fetch.return_value = [(d, self._hourly(d)) for d in missing]
+
+        results = self.service.get_hourly_forecast_range(self.start, self.end)
+
+        mock_fetch.assert_called_once_with(missing[0], missing[-1])
+        self.assertEqual(sorted(results), [self.start] + missing)
+        self.assertEqual(WeatherRecord.objects.filter(weather_type='hourly').count(), 4)
+
+    @patch.object(WeatherService, 'fetch_visualcrossing_hourly_range')
+    def test_api_error_falls_back_to_stale_days(self, mock_fetch):
+        self._store(self.start)
+        WeatherRecord.objects.update(fetched_at=timezone.now() - timedelta(days=1))
+        mock_fetch.side_effect = WeatherServiceError("API unavailable")
+
+        results = self.service.get_hourly_forecast_range(self.start, self.end)
+
+        self.assertEqual(list(results), [self.start])
+        self.assertTrue(results[self.start].from_cache)
+
+
+class L1CacheTests(TestCase):
+    """Tests for the in-process cache in front of DB reads."""
+
+    def setUp(self):
+        WeatherRecord.objects.all().delete()
+        _l1_invalidate()
+        self.addCleanup(_l1_invalidate)
+        self.service = WeatherService()
+        self.lat, self.lon = self.service.nws_location
+        self.target = date.today() + timedelta(days=1)
+
+    def _store(self, high):
+        data = HourlyForecastData(
+            location=(self.lat, self.lon),
+            target_date=self.target,
+            hours=[HourlyForecastEntry(time=datetime(2024, 6, 15, 12, 0), temperature_c=high)],
+        )
+        self.service._save_to_db(
+            'hourly', self.target, self.service._serialize_hourly_data(data),
+            lat=self.lat, lon=self.lon,
+        )
+
+    def test_repeat_read_skips_db(self):
+        self._store(20)
+        self.service.get_hourly_from_db(self.target)
+        with self.assertNumQueries(0):
+            data = self.service.get_hourly_from_db(self.target)
+        self.assertEqual(data.hours[0].temperature_c, 20)
+
+    def test_save_invalidates_entry(self):
+        self._store(20)
+        self.service.get_hourly_from_db(self.target)
+        self._store(25)
+        self.assertEqual(self.service.get_hourly_from_db(self.target).hours[0].temperature_c, 25)
+
+    @override_settings(WEATHER_L1_CACHE_TTL=0)
+    def test_disabled_with_zero_ttl(self):
+        service = WeatherService()
+        self._store(20)
+        service.get_hourly_from_db(self.target)
+        with self.assertNumQueries(1):
+            service.get_hourly_from_db(self.target)
+
+
+class ClearCacheTests(TestCase):
+    """Tests for WeatherService.clear_cache."""
+
+    def setUp(self):
+        WeatherRecord.objects.all().delete()
+        self.service = WeatherService()
+        self.lat, self.lon = self.service.nws_location
+        self.local_today = datetime.now(self.service.local_timezone).date()
+
+    def _save(self, weather_type, days_out, **location):
+        target = self.local_today + timedelta(days=days_out)
+        self.service._save_to_db(weather_type, target, {'test': weather_type}, **location)
+        return target
+
+    def test_clears_metar_for_today(self):
+        self._save('metar', 0, station='KACV')
+        self._save('metar', 0, station='KJFK')
+
+        self.service.clear_cache(station='kacv')
+
+        self.assertEqual(list(WeatherRecord.objects.values_list('station', flat=True)), ['KJFK'])
+
+    def test_clears_extended_and_hourly_together(self):
+        target = self._save('extended', 10, lat=self.lat, lon=self.lon)
+        self._save('hourly', 10, lat=self.lat, lon=self.lon)
+        self._save('hourly', 11, lat=self.lat, lon=self.lon)
+
+        self.service.clear_cache(target_date=target)
+
+        remaining = WeatherRecord.objects.values_list('weather_type', 'target_date')
+        self.assertEqual(list(remaining), [('hourly', self.local_today + timedelta(days=11))])
+
+    def test_out_of_range_date_clears_nothing(self):
+        target = self._save('extended', 20, lat=self.lat, lon=self.lon)
+
+        with self.assertNumQueries(0):
+            self.service.clear_cache(target_date=target)
+
+        self.assertEqual(WeatherRecord.objects.count(), 1)
+
+    def test_clears_many_stations_and_dates_in_one_delete(self):
+        self._save('metar', 0, station='KACV')
+        self._save('metar', 0, station='KJFK')
+        self._save('taf', 1, station='KACV')
+        tomorrow = self._save('taf', 1, station='KSFO')
+        nws_day = self._save('nws', 3, lat=self.lat, lon=self.lon)
+
+        with self.assertNumQueries(1):
+            self.service.clear_cache(
+                station=['kacv', 'kjfk'],
+                target_date=[self.local_today, tomorrow, nws_day],
+            )
+
+        remaining = WeatherRecord.objects.values_list('weather_type', 'station')
+        self.assertEqual(list(remaining), [('taf', 'KSFO')])
+
+    def test_clear_all_for_date_in_one_delete(self):
+        target = self._save('taf', 1, station='KJFK')
+        self._save('taf', 1, station='KACV')
+        self._save('nws', 1, lat=self.lat, lon=self.lon)
+        self._save('extended', 1, lat=self.lat, lon=self.lon)
+        self._save('nws', 2, lat=self.lat, lon=self.lon)
+
+        with self.assertNumQueries(1):
+            self.service.clear_all_cache_for_date(target, station='kjfk')
+
+        remaining = WeatherRecord.objects.order_by('target_date').values_list('weather_type', 'station')
+        self.assertEqual(list(remaining), [('taf', 'KACV'), ('nws', '')])
+
+
 class WeatherRecordModelTests(TestCase):
     """Tests for the WeatherRecord model."""
 
@@ -771,3 +1120,20 @@ class RateLimitDBCountTests(TestCase):
         # Should still return True since these don't count
         result = self.service._check_rate_limit()
         self.assertTrue(result)
+
+    @override_settings(WEATHER_RATE_LIMIT_PER_HOUR=3, WEATHER_RATE_LIMIT_SAFETY_MARGIN=1.0)
+    def test_check_rate_limit_over_hourly_threshold(self):
+        """Records older than a minute still count toward the hourly window."""
+        service = WeatherService()
+        for i in range(3):
+            WeatherRecord.objects.create(
+                weather_type='hourly',
+                target_date=date.today() + timedelta(days=i),
+                latitude=Decimal('40.9781'),
+                longitude=Decimal('-124.1086'),
+                data={'test': 'data'},
+                fetched_at=timezone.now() - timedelta(minutes=30),
+            )
+
+        with self.assertNumQueries(1):
+            self.assertFalse(service._check_rate_limit())
@@ -7,6 +7,7 @@ from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from apps.hamsalert.models import WeatherRecord
+from apps.hamsalert.services import get_weather_service
 from apps.hamsalert.weather_poller import WeatherPoller
 
 
@@ -16,6 +17,10 @@ class WeatherPollerTests(TestCase):
     def setUp(self):
         WeatherRecord.objects.all().delete()
 
+    def test_uses_shared_weather_service(self):
+        """Poller should reuse the shared service (and its HTTP client)."""
+        self.assertIs(WeatherPoller().service, get_weather_service())
+
     def test_poll_metar_saves_to_db(self):
         """METAR poll should save data to DB via _save_to_db."""
         poller = WeatherPoller()
@@ -46,18 +51,21 @@ class WeatherPollerTests(TestCase):
         self.assertEqual(mock_service._save_to_db.call_count, 2)
 
     def test_poll_nws_saves_for_days_2_to_7(self):
-        """NWS poll should save data for days 2-7."""
+        """NWS poll should fetch once and save data for days 2-7."""
         poller = WeatherPoller()
         mock_service = MagicMock()
         mock_service.nws_location = (40.9781, -124.1086)
-        mock_service._fetch_nws_forecast.return_value = MagicMock()
+        today = date.today()
+        target_dates = [today + timedelta(days=i) for i in range(2, 8)]
+        mock_service.fetch_nws_batch.return_value = [(d, MagicMock()) for d in target_dates]
         mock_service._serialize_nws_data.return_value = {'test': 'data'}
         poller.service = mock_service
 
-        poller._poll_nws(date.today())
+        poller._poll_nws(today)
 
-        # Should be called 6 times (days 2, 3, 4, 5, 6, 7)
-        self.assertEqual(mock_service._fetch_nws_forecast.call_count, 6)
+        # One forecast request covers days 2, 3, 4, 5, 6, 7
+        mock_service.fetch_nws_batch.assert_called_once_with(target_dates)
+        mock_service._fetch_nws_forecast.assert_not_called()
         self.assertEqual(mock_service._save_to_db.call_count, 6)
 
     def test_poll_extended_saves_daily_and_hourly(self):
@@ -90,6 +98,29 @@ class WeatherPollerTests(TestCase):
         # Save called twice per day (daily + hourly) = 30 total
         self.assertEqual(mock_service._save_to_db.call_count, 30)
 
+    def test_poll_historical_fetches_missing_days_in_one_call(self):
+        """Historical poll should fetch the missing span with a single range request."""
+        poller = WeatherPoller()
+        mock_service = MagicMock()
+        mock_service.nws_location = (40.9781, -124.1086)
+        local_today = date(2025, 6, 5)
+        mock_service.fetch_visualcrossing_historical_range.return_value = [
+            (date(2025, 6, day), MagicMock()) for day in range(1, 5)
+        ]
+        mock_service._serialize_historical_data.return_value = {'test': 'data'}
+        poller.service = mock_service
+        WeatherRecord.objects.create(
+            weather_type='historical', target_date=date(2025, 6, 2), data={}, fetched_at=timezone.now(),
+        )
+
+        poller._poll_historical(local_today)
+
+        mock_service.fetch_visualcrossing_historical_range.assert_called_once_with(
+            date(2025, 6, 1), date(2025, 6, 4)
+        )
+        # Day already stored is not re-saved
+        self.assertEqual(mock_service._save_to_db.call_count, 3)
+
     def test_poll_source_handles_api_error(self):
         """Poller should handle API errors gracefully."""
         poller = WeatherPoller()
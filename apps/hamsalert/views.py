@@ -1,18 +1,16 @@
 import calendar
 from datetime import date, datetime
 
-from django.conf import settings as django_settings
 from django.http import JsonResponse
 from django.shortcuts import redirect, render
 from django.utils import timezone
 from django.views.decorators.http import require_GET
-from zoneinfo import ZoneInfo
 
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_POST
 
 from .models import Event, FlyingIntent
-from .services import CompositeWeatherData, WeatherService, WeatherSource
+from .services import CompositeWeatherData, WeatherSource, get_weather_service
 
 
 # Cache TTLs by source (must match settings)
@@ -164,7 +162,7 @@ def calendar_day_view(request, year, month, day):
 
     weather = None
     weather_error = None
-    weather_service = WeatherService()
+    weather_service = get_weather_service()
 
     if weather_service.is_configured():
         station = request.GET.get('station')
@@ -221,7 +219,7 @@ def weather_refresh(request):
     """HTMX endpoint to refresh weather data (reads from DB)."""
     weather = None
     weather_error = None
-    weather_service = WeatherService()
+    weather_service = get_weather_service()
 
     # Get target date from request params
     year = request.GET.get('year')
@@ -269,9 +267,8 @@ def hourly_forecast(request, year, month, day):
             'error': 'Invalid date.',
         })
 
-    weather_service = WeatherService()
-    local_tz = ZoneInfo(getattr(django_settings, 'WEATHER_LOCAL_TIMEZONE', 'America/Los_Angeles'))
-    local_today = datetime.now(local_tz).date()
+    weather_service = get_weather_service()
+    local_today = datetime.now(weather_service.local_timezone).date()
     days_out = (target_date - local_today).days
 
     if days_out < 0 or days_out > 14:
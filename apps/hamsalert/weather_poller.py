@@ -45,8 +45,8 @@ class WeatherPoller:
     """Background service that polls weather APIs on schedule."""
 
     def __init__(self):
-        from .services import WeatherService
-        self.service = WeatherService()
+        from .services import get_weather_service
+        self.service = get_weather_service()
         self.local_timezone = ZoneInfo(
             getattr(settings, 'WEATHER_LOCAL_TIMEZONE', 'America/Los_Angeles')
         )
@@ -243,26 +243,24 @@ class WeatherPoller:
         logger.info("WeatherPoller: TAF updated")
 
     def _poll_nws(self, local_today: date):
-        """Poll NWS for days 2-7."""
-        logger.info("WeatherPoller: Polling NWS")
+        """Poll NWS for days 2-7 (1 API call total)."""
+        logger.info("WeatherPoller: Polling NWS (batch)")
         lat, lon = self.service.nws_location
-        for days_out in range(2, 8):  # Days 2-7
-            target_date = local_today + timedelta(days=days_out)
-            try:
-                data = self.service._fetch_nws_forecast(target_date)
-                if data:
-                    self.service._save_to_db(
-                        'nws',
-                        target_date,
-                        self.service._serialize_nws_data(data),
-                        lat=lat,
-                        lon=lon,
-                    )
-                    logger.info(f"WeatherPoller: NWS updated for {target_date}")
-            except Exception as e:
-                logger.warning(f"WeatherPoller: NWS poll failed for {target_date}: {e}")
-            time.sleep(API_CALL_DELAY)
-        logger.info("WeatherPoller: NWS updated")
+        target_dates = [local_today + timedelta(days=days_out) for days_out in range(2, 8)]  # Days 2-7
+        try:
+            results = self.service.fetch_nws_batch(target_dates)
+        except Exception as e:
+            logger.warning(f"WeatherPoller: NWS poll failed: {e}")
+            return
+        for target_date, data in results:
+            self.service._save_to_db(
+                'nws',
+                target_date,
+                self.service._serialize_nws_data(data),
+                lat=lat,
+                lon=lon,
+            )
+        logger.info(f"WeatherPoller: NWS updated ({len(results)} days)")
 
     def _poll_extended(self, local_today: date):
         """Poll Visual Crossing for days 0-14, including hourly data (2 API calls total)."""
@@ -326,41 +324,41 @@ class WeatherPoller:
         lat, lon = self.service.nws_location
         fetched = 0
 
-        # Fetch each day that's missing
-        current = first_of_month
-        while current <= yesterday:
-            if self._is_rate_limited():
-                logger.info("WeatherPoller: Rate limited, stopping historical poll")
-                break
-
-            # Skip if we already have this date
-            exists = WeatherRecord.objects.filter(
+        # Find the days that are missing
+        existing = set(
+            WeatherRecord.objects.filter(
                 weather_type='historical',
-                target_date=current,
-            ).exists()
-
-            if not exists:
-                try:
-                    data = self.service.fetch_visualcrossing_historical(current)
-                    if data:
-                        self.service._save_to_db(
-                            'historical',
-                            current,
-                            self.service._serialize_historical_data(data),
-                            lat=lat,
-                            lon=lon,
-                        )
-                        fetched += 1
-                        logger.info(f"WeatherPoller: Historical fetched for {current}")
-                except Exception as e:
-                    error_str = str(e).lower()
-                    if 'rate limit' in error_str or '429' in error_str:
-                        self._set_rate_limited()
-                        break
-                    logger.warning(f"WeatherPoller: Historical poll failed for {current}: {e}")
-                time.sleep(API_CALL_DELAY)
-
-            current += timedelta(days=1)
+                target_date__gte=first_of_month,
+                target_date__lte=yesterday,
+            ).values_list('target_date', flat=True)
+        )
+        missing = [
+            first_of_month + timedelta(days=offset)
+            for offset in range((yesterday - first_of_month).days + 1)
+            if first_of_month + timedelta(days=offset) not in existing
+        ]
+
+        if missing:
+            # Fetch the whole missing span in ONE API call
+            try:
+                results = self.service.fetch_visualcrossing_historical_range(missing[0], missing[-1])
+                for target_date, data in results:
+                    if target_date in existing:
+                        continue
+                    self.service._save_to_db(
+                        'historical',
+                        target_date,
+                        self.service._serialize_historical_data(data),
+                        lat=lat,
+                        lon=lon,
+                    )
+                    fetched += 1
+            except Exception as e:
+                error_str = str(e).lower()
+                if 'rate limit' in error_str or '429' in error_str:
+                    self._set_rate_limited()
+                    return
+                logger.warning(f"WeatherPoller: Historical poll failed for {missing[0]} to {missing[-1]}: {e}")
 
         if fetched > 0:
             logger.info(f"WeatherPoller: Historical updated ({fetched} days fetched)")
@@ -172,12 +172,17 @@ WEATHER_METAR_CACHE_TTL = 1800   # 30 min
 WEATHER_TAF_CACHE_TTL = 3600    # 1 hour
 WEATHER_NWS_CACHE_TTL = 7200    # 2 hours
 WEATHER_VISUALCROSSING_CACHE_TTL = 14400  # 4 hours
+WEATHER_STALE_WHILE_REVALIDATE = 3600  # Serve expired data this long while refreshing in background
+WEATHER_L1_CACHE_TTL = 60  # In-process cache of DB reads for views (0 disables)
 
 # Weather API Request Settings (retry on failures)
 WEATHER_MAX_RETRIES = 3
 WEATHER_BASE_DELAY = 1.0  # seconds
 WEATHER_MAX_DELAY = 30.0  # seconds
 
+# How long a composite fetch waits on each source before returning without it
+WEATHER_COMPOSITE_SOURCE_TIMEOUTS = {'metar': 3.0, 'taf': 3.0, 'nws': 5.0, 'extended': 5.0}
+
 # Weather API Rate Limits
 WEATHER_RATE_LIMIT_PER_MINUTE = 600
 WEATHER_RATE_LIMIT_PER_HOUR = 5000